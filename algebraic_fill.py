@@ -1,105 +1,304 @@
+import mmap
+import os
 import re
+from array import array
 from fractions import Fraction
 
 def to_frac(x):
     try: return Fraction(str(x))
     except: return Fraction(0)
 
-def parsear_matriz_texto(texto: str, max_filas=8, max_cols=8):
+# --- LECTURA DE MATRICES (una sola pasada) ---
+
+# Un único regex recorre el texto: cada coincidencia es un número, un fin de fila o un
+# comando LaTeX a ignorar. Todo lo demás (comas, &, corchetes de apertura, letras) se salta.
+_TOKEN_MATRIZ = r"""
+    (?P<fs>[+-]?)\\[dt]?frac\s*\{\s*(?P<fn>[+-]?[0-9.]+)\s*\}\s*\{\s*(?P<fd>[+-]?[0-9.]+)\s*\}   # -\frac{a}{b}
+  | (?P<num>(?:[+-]|(?<![A-Za-z_0-9.]))(?:(?P<ent>[0-9]+)(?![0-9.eE/])|[0-9]+\.?[0-9]*(?:[eE][+-]?[0-9]+)?|\.[0-9]+(?:[eE][+-]?[0-9]+)?)
+        (?:/(?P<den>[0-9]+\.?[0-9]*))?)                                           # 3, -1.5, 2e-3, 1/2
+  | (?P<fin>\r?\n|;|\]|\\\\|\\(?![A-Za-z]))                                        # fin de fila
+  | \\[A-Za-z]+                                                                   # \begin, \hline...
+"""
+_RE_MATRIZ = re.compile(_TOKEN_MATRIZ, re.VERBOSE)
+_RE_MATRIZ_BYTES = re.compile(_TOKEN_MATRIZ.encode(), re.VERBOSE)
+_MENOS = ("-", b"-")
+_RE_FRAC = re.compile(r"\\[dt]?frac\s*\{[^{}]*\}\s*\{[^{}]*\}")
+
+class MatrizLeida:
+    """
+    Resultado compacto del lector: todos los valores en una lista plana (int si el
+    literal era entero, Fraction si no) y el inicio de cada fila en un array.
+    Las filas de distinta longitud no se recortan: quedan listadas en `irregulares`.
+    """
+    __slots__ = ("datos", "inicios")
+
+    def __init__(self):
+        self.datos = []
+        self.inicios = array("q", [0])
+
+    @property
+    def filas(self): return len(self.inicios) - 1
+
+    @property
+    def cols(self): return max((self.longitud(i) for i in range(self.filas)), default=0)
+
+    def longitud(self, i): return self.inicios[i + 1] - self.inicios[i]
+
+    @property
+    def irregulares(self):
+        """[(fila, longitud)] de las filas que no tienen tantas columnas como la más larga."""
+        c = self.cols
+        return [(i, self.longitud(i)) for i in range(self.filas) if self.longitud(i) != c]
+
+    def fila(self, i): return self.datos[self.inicios[i]:self.inicios[i + 1]]
+
+    def a_listas(self, rellenar=Fraction(0)):
+        """Matriz de Fraction (formato de matrix_ops); las filas cortas se completan con `rellenar`."""
+        c = self.cols
+        return [[Fraction(v) for v in self.fila(i)] + [rellenar] * (c - self.longitud(i)) for i in range(self.filas)]
+
+    def __repr__(self):
+        return f"MatrizLeida({self.filas}x{self.cols}{', irregular' if self.irregulares else ''})"
+
+def _consumir(M: MatrizLeida, buf, regex, como_texto):
+    """Agrega a M los tokens de `buf` (str, bytes o mmap). Devuelve la posición del último fin de fila."""
+    datos, inicios = M.datos, M.inicios
+    for m in regex.finditer(buf):
+        if m.group("fin") is not None:
+            if len(datos) > inicios[-1]: inicios.append(len(datos)) # Filas vacías: se ignoran
+            continue
+        try:
+            if m.group("ent") is not None: v = int(m.group("ent"))
+            elif m.group("num") is not None:
+                num, den = m.group("num"), m.group("den")
+                if den is not None: num = num[:len(num) - len(den) - 1]
+                v = Fraction(como_texto(num)) / (Fraction(como_texto(den)) if den is not None else 1)
+            elif m.group("fn") is not None:
+                v = Fraction(como_texto(m.group("fn"))) / Fraction(como_texto(m.group("fd")))
+                if m.group("fs") in _MENOS: v = -v
+            else: continue # Comando LaTeX
+        except ZeroDivisionError: raise ValueError(f"División por cero en '{como_texto(m.group(0))}'")
+        if v.__class__ is int and m.group("num")[:1] in _MENOS: v = -v
+        datos.append(v)
+
+def _cerrar(M: MatrizLeida) -> MatrizLeida:
+    if len(M.datos) > M.inicios[-1]: M.inicios.append(len(M.datos))
+    return M
+
+def _retroceder_frac(bloque: str, corte: int) -> int:
+    """Si el corte cae dentro de un \\frac{a} {b} (sus espacios también son cortes), retroceder hasta antes del comando."""
+    j = bloque.rfind("frac", 0, corte + 1)
+    if j < 1: return corte
+    inicio = j - 1 if bloque[j - 1] == "\\" else j - 2 if bloque[j - 2:j] in ("\\d", "\\t") else -1
+    if inicio < 0: return corte
+    m = _RE_FRAC.match(bloque, inicio)
+    if m is not None and m.end() <= corte + 1: return corte
+    if inicio > 0 and bloque[inicio - 1] in "+-": inicio -= 1 # El signo viaja con la fracción
+    return inicio - 1
+
+def leer_matriz(fuente, tam_bloque=1 << 20) -> MatrizLeida:
+    """
+    Lee una matriz de texto en cualquiera de los formatos habituales: CSV, columnas
+    separadas por espacios o tabuladores, [[1, 2], [3, 4]] (NumPy), [1 2; 3 4] (MATLAB),
+    1 & 2 \\ 3 & 4 (LaTeX, con \frac{a}{b}) y fracciones 1/2. `fuente` puede ser un str
+    o un archivo abierto; este último se procesa por bloques sin cargarlo entero.
+    """
+    M = MatrizLeida()
+    if isinstance(fuente, str):
+        _consumir(M, fuente, _RE_MATRIZ, str)
+        return _cerrar(M)
+    resto = ""
+    while True:
+        bloque = fuente.read(tam_bloque)
+        if isinstance(bloque, bytes): bloque = bloque.decode("utf-8", errors="replace")
+        if not bloque: break
+        bloque = resto + bloque
+        # Cortar en el último salto de línea (o separador) para no partir un número
+        corte = _retroceder_frac(bloque, max(bloque.rfind("\n"), bloque.rfind(" "), bloque.rfind(","), bloque.rfind(";")))
+        if corte < 0: resto = bloque; continue
+        _consumir(M, bloque[:corte + 1], _RE_MATRIZ, str)
+        resto = bloque[corte + 1:]
+    _consumir(M, resto, _RE_MATRIZ, str)
+    return _cerrar(M)
+
+def leer_matriz_archivo(ruta) -> MatrizLeida:
+    """Como leer_matriz, pero con el archivo proyectado en memoria (mmap): el regex lo recorre sin copiarlo."""
+    with open(ruta, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0: return MatrizLeida()
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            M = MatrizLeida()
+            _consumir(M, mm, _RE_MATRIZ_BYTES, lambda b: b.decode("ascii"))
+            return _cerrar(M)
+
+def parsear_matriz_texto(texto: str, max_filas=None, max_cols=None):
     """
     Convierte texto sucio (PDFs, LaTeX, Excel) a matriz numérica.
+    Sin límite de tamaño por defecto; las filas cortas se completan con ceros
+    (usar leer_matriz para saber cuáles eran irregulares).
+    """
+    filas = leer_matriz(texto).a_listas()
+    if max_filas is not None: filas = filas[:max_filas]
+    if max_cols is not None: filas = [r[:max_cols] for r in filas]
+    return filas
+
+# --- SISTEMAS LINEALES (sin eval) ---
+
+_TOKEN_SISTEMA = re.compile(r"""
+    (?P<num>[0-9]+(?:[.,][0-9]+|\.)?|\.[0-9]+)   # 1,5 = 1.5 (coma decimal solo entre dígitos)
+  | (?P<var>[^\W\d]\w*)
+  | (?P<op>[-+*/()=−·×])
+  | (?P<sep>\n|;|\\)
+  | (?P<esp>[ \t\r\u00a0]+|[:$&{}\[\]])   # Espacios y basura de copiado: se ignoran
+  | (?P<otro>.)                            # ^, comas sueltas...: error con su posición
+""", re.VERBOSE)
+_NUMERACION = re.compile(r"(?m)^[ \t]*\d+[.)](?!\d)") # "1." o "2)" al inicio de línea
+_OPS = {"−": "-", "·": "*", "×": "*"}
+
+class _Lineal:
+    """Forma lineal Σ coef[i]·x_i + cte durante el análisis (coeficientes int o Fraction)."""
+    __slots__ = ("coef", "cte")
+    def __init__(self, coef=None, cte=0):
+        self.coef = coef if coef is not None else {}
+        self.cte = cte
+
+    def sumar(self, otra, signo=1):
+        c = self.coef
+        for i, v in otra.coef.items():
+            r = c.get(i, 0) + signo * v
+            if r: c[i] = r
+            else: c.pop(i, None)
+        self.cte += signo * otra.cte
+        return self
+
+    def escalar(self, k):
+        if k == 0: self.coef = {}
+        else:
+            for i in self.coef: self.coef[i] *= k
+        self.cte *= k
+        return self
+
+class _AnalizadorLineal:
     """
-    # 1. Normalización agresiva
-    # Reemplazar barras invertidas y caracteres de lista por saltos
-    texto = texto.replace("\\", "\n").replace(";", "\n").replace("(", " ").replace(")", " ")
-    texto = texto.replace("[", " ").replace("]", " ").replace("{", " ").replace("}", " ")
-    
-    filas = []
-    raw_rows = [r.strip() for r in texto.split('\n') if r.strip()]
-    
-    if len(raw_rows) > max_filas:
-        # Si hay demasiadas filas, intentar ver si es un vector en una sola linea mal cortada
-        pass 
-
-    for r in raw_rows:
-        # Extraer números (enteros, decimales, fracciones)
-        # Soporta: -5, 3.4, 1/2
-        numeros = re.findall(r'-?\d+(?:/\d+)?(?:\.\d+)?', r)
-        if numeros:
-            # Si hay demasiadas columnas, cortamos (o lanzamos error)
-            if len(numeros) > max_cols:
-                numeros = numeros[:max_cols]
-            filas.append([to_frac(n) for n in numeros])
-    
-    # Validación final de dimensiones
-    if not filas: return []
-    return filas[:max_filas]
-
-def parsear_sistema_ecuaciones(texto: str, max_vars=5):
+    Descenso recursivo sobre los tokens de una ecuación:
+        expr   := termino (('+'|'-') termino)*
+        termino:= factor (('*'|'/'|implícito) factor)*
+        factor := ('+'|'-') factor | número | variable | '(' expr ')'
+    Multiplicar dos términos con variables o dividir por uno de ellos es un error (no lineal).
+    """
+    def __init__(self, indices):
+        self.indices = indices # nombre -> columna, compartido por todas las ecuaciones
+
+    def analizar(self, toks):
+        self.toks, self.i = toks, 0
+        izq = self.expr()
+        if self._ver() == "=":
+            self.i += 1
+            izq.sumar(self.expr(), -1)
+        if self.i < len(self.toks): raise ValueError(f"símbolo inesperado '{self.toks[self.i][1]}' (columna {self.toks[self.i][2]})")
+        return izq
+
+    def _ver(self):
+        return self.toks[self.i][1] if self.i < len(self.toks) else None
+
+    def expr(self):
+        acc = self.termino()
+        while self._ver() in ("+", "-"):
+            signo = 1 if self.toks[self.i][1] == "+" else -1
+            self.i += 1
+            acc.sumar(self.termino(), signo)
+        return acc
+
+    def termino(self):
+        acc = self.factor()
+        while True:
+            t = self._ver()
+            if t in ("*", "/"): self.i += 1
+            elif t is None or self.toks[self.i][0] == "op" and t != "(": return acc
+            elif self.toks[self.i][0] == "num": # "2 3" o "1,5" mal copiado: no es 2·3
+                raise ValueError(f"número '{t}' sin operador (columna {self.toks[self.i][2]})")
+            f = self.factor()
+            if t == "/":
+                if f.coef: raise ValueError("división por una variable (no es lineal)")
+                if f.cte == 0: raise ValueError("división por cero")
+                acc.escalar(Fraction(1, 1) / f.cte)
+            elif not f.coef: acc.escalar(f.cte)
+            elif not acc.coef: acc = f.escalar(acc.cte)
+            else: raise ValueError("producto de variables (no es lineal)")
+
+    def factor(self):
+        if self.i >= len(self.toks): raise ValueError("expresión incompleta")
+        tipo, t, col = self.toks[self.i]
+        self.i += 1
+        if tipo == "num": return _Lineal(cte=int(t) if t.isdigit() else Fraction(t.replace(",", ".")))
+        if tipo == "var": return _Lineal({self.indices.setdefault(t, len(self.indices)): 1})
+        if t == "(":
+            r = self.expr()
+            if self._ver() != ")": raise ValueError("falta ')'")
+            self.i += 1
+            return r
+        if t in ("+", "-"):
+            r = self.factor()
+            return r.escalar(-1) if t == "-" else r
+        raise ValueError(f"símbolo inesperado '{t}' (columna {col})")
+
+def _ordenar_variables(nombres):
+    # x, y, z primero; el resto alfabéticamente
+    preferidas = [v for v in ("x", "y", "z") if v in nombres]
+    return preferidas + sorted(set(nombres) - set(preferidas))
+
+def parsear_sistema_disperso(texto: str):
+    """
+    Ecuaciones lineales con términos en ambos lados, coeficientes implícitos (2x, x/2,
+    -(x - y), 3(x + 1)) y numeración "1)" ignorada. Una sola pasada de tokenización y
+    un descenso recursivo por ecuación; no usa eval.
+    Devuelve (filas, b, variables): cada fila es un dict {columna: Fraction} solo con
+    los coeficientes no nulos.
+    """
+    indices, filas, b = {}, [], []
+    analizador = _AnalizadorLineal(indices)
+
+    def cerrar(toks, n_linea):
+        # Sin '=' y solo palabras ("Solución:", "Sistema") no es una ecuación
+        if not toks or all(k == "var" for k, _, _ in toks): return
+        try: L = analizador.analizar(toks)
+        except ValueError as e: raise ValueError(f"Ecuación {len(filas) + 1} (línea {n_linea}): {e}")
+        filas.append(L.coef); b.append(-L.cte)
+
+    toks, n_linea, inicio = [], 1, 0
+    # La numeración se tapa con espacios (no se borra) para que las columnas sigan valiendo
+    for m in _TOKEN_SISTEMA.finditer(_NUMERACION.sub(lambda n: " " * len(n.group()), texto)):
+        tipo = m.lastgroup
+        if tipo == "esp": continue
+        if tipo == "sep":
+            cerrar(toks, n_linea); toks = []
+            if m.group() == "\n": n_linea, inicio = n_linea + 1, m.end()
+        elif tipo == "otro":
+            raise ValueError(f"Ecuación {len(filas) + 1} (línea {n_linea}, columna {m.start() - inicio + 1}): "
+                             f"símbolo no admitido '{m.group()}'" + (" (no es lineal)" if m.group() == "^" else ""))
+        else:
+            t = m.group()
+            toks.append((tipo, _OPS.get(t, t), m.start() - inicio + 1))
+    cerrar(toks, n_linea)
+
+    variables = _ordenar_variables(indices)
+    columna = [0] * len(indices)
+    for nueva, v in enumerate(variables): columna[indices[v]] = nueva
+    filas = [{columna[i]: Fraction(v) for i, v in f.items()} for f in filas]
+    return filas, [Fraction(v) for v in b], variables
+
+def parsear_sistema_ecuaciones(texto: str, max_vars=None):
     """
     Parsea ecuaciones lineales incluso con formato 'sucio'.
-    Ej: "x+y=3 \ 2x-y=0"
+    Ej: "x+y=3 \ 2x-y=0", "2(x - 1) = y + 4". Devuelve (A, b, variables) con A densa.
     """
-    # 1. Limpieza de separadores raros
-    texto = texto.replace("\\", "\n").replace(";", "\n")
-    
-    lineas = []
-    for l in texto.split('\n'):
-        # Ignorar líneas que no parecen ecuaciones (ej: "Solución:")
-        if not l.strip() or (('=' not in l) and not re.search(r'[a-zA-Z]', l)):
-            continue
-        lineas.append(l.strip())
-
-    if not lineas: return [], [], []
-
-    # 2. Identificar variables
-    vars_found = set()
-    patron_var = r'[a-zA-Z_]\w*' 
-    
-    for l in lineas:
-        # Quitamos basura común de copiado
-        clean_l = re.sub(r'^\d+[\.\)]', '', l) # Quita numeración "1." o "1)"
-        lhs = clean_l.split('=')[0] if '=' in clean_l else clean_l
-        vars_found.update(re.findall(patron_var, lhs))
-    
-    if not vars_found: return [], [], []
-
-    # Orden inteligente: x,y,z o a,b,c o x1,x2...
-    variables = sorted(list(vars_found))
-    if {'x', 'y', 'z'}.issubset(set(variables)) and len(variables)<=3: variables = ['x','y','z'][:len(variables)]
-    elif {'x', 'y'}.issubset(set(variables)): variables = ['x', 'y']
-    
+    filas, b, variables = parsear_sistema_disperso(texto)
+    if not filas or not variables: return [], [], []
+    if max_vars is not None and len(variables) > max_vars:
+        raise ValueError(f"Demasiadas variables ({len(variables)} > {max_vars}).")
+    n = len(variables)
     A = []
-    b = []
-
-    # 3. Extraer coeficientes
-    for l in lineas:
-        l = re.sub(r'^\d+[\.\)]', '', l) # Limpiar numeración de ejercicio
-        
-        if '=' in l: lhs, rhs = l.split('=')
-        else: lhs, rhs = l, "0"
-            
-        lhs = lhs.replace(" ", "")
-        row_coeffs = {v: Fraction(0) for v in variables}
-        
-        # Regex: (+/-)(valor)(variable)
-        terms = re.findall(r'([+\-]?)(\d+(?:/\d+)?(?:\.\d+)?)?([a-zA-Z_]\w*)', lhs)
-        
-        for signo, val, var in terms:
-            if var not in variables: continue
-            if val == "": num = Fraction(1)
-            else: num = to_frac(val)
-            if signo == "-": num *= -1
-            row_coeffs[var] += num
-            
-        A.append([row_coeffs[v] for v in variables])
-        
-        # Lado derecho: limpiar basura no numérica
-        try:
-            rhs_clean = re.sub(r'[^0-9+\-*/\.\(\) ]', '', rhs)
-            rhs_val = to_frac(eval(rhs_clean, {"__builtins__": None}))
-        except:
-            rhs_val = Fraction(0)
-        b.append(rhs_val)
-
-    return A, b, variables
\ No newline at end of file
+    for f in filas:
+        fila = [Fraction(0)] * n
+        for j, v in f.items(): fila[j] = v
+        A.append(fila)
+    return A, b, variables
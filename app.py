@@ -1,9 +1,76 @@
-﻿import tkinter as tk
+﻿import time
+_T0 = time.perf_counter()
+import importlib
+from collections import OrderedDict, deque
+import os
+import sys
+import tkinter as tk
 from tkinter import ttk
 from ui_components import MenuLateral, DashboardCard, COLOR_FONDO_PRINCIPAL
-from simple_calculator import SimpleCalculator
-from views_matrix import VentanaCalculadoraUniversal, VentanaGauss, VentanaSistemas, VentanaVectores
-from views_numerical import VistaNewton, VistaSecante, VentanaBiseccion, VentanaReglaFalsa
+
+# Perfil de arranque: `python app.py --perfil` o SUITE_PERFIL=1
+PERFIL = "--perfil" in sys.argv or os.environ.get("SUITE_PERFIL") == "1"
+PRESUPUESTO_ARRANQUE_MS = 600 # Desde el inicio del proceso hasta el tablero dibujado
+_T_IMPORTS = time.perf_counter() - _T0
+
+def _perfil(msg):
+    if PERFIL: print(f"[perfil] {msg}", file=sys.stderr, flush=True)
+
+def cargar_vista(ref: str):
+    """
+    'modulo:Clase' -> clase. Cada módulo de vistas se importa la primera vez que se
+    abre una de sus herramientas: NumPy y Matplotlib solo llegan con los numéricos.
+    """
+    modulo, clase = ref.split(":")
+    nuevo = modulo not in sys.modules
+    t = time.perf_counter()
+    cls = getattr(importlib.import_module(modulo), clase)
+    if nuevo: _perfil(f"import {modulo}: {(time.perf_counter() - t) * 1e3:.0f} ms")
+    return cls
+
+def _contar_widgets(w) -> int:
+    return 1 + sum(_contar_widgets(h) for h in w.winfo_children())
+
+class CacheVistas:
+    """
+    Vistas ya construidas, por (módulo, clave). Cambiar de herramienta solo oculta una
+    página y muestra otra, así que se conservan entradas, gráficas y resultados.
+    Política: LRU con presupuesto de coste; el coste de una página es su número de
+    widgets (medido al ocultarla) más COSTO_FIGURA por cada figura de Matplotlib.
+    """
+    PRESUPUESTO = 4000
+    COSTO_FIGURA = 400
+
+    def __init__(self, presupuesto=None):
+        self.presupuesto = presupuesto or self.PRESUPUESTO
+        self.paginas = OrderedDict() # clave -> Frame
+        self.costos = {}
+
+    def obtener(self, clave):
+        pagina = self.paginas.get(clave)
+        if pagina is not None: self.paginas.move_to_end(clave)
+        return pagina
+
+    def guardar(self, clave, pagina):
+        self.paginas[clave] = pagina
+        self.costos[clave] = 0
+
+    def medir(self, clave):
+        pagina = self.paginas.get(clave)
+        if pagina is None: return
+        figuras = sum(1 for w in pagina.winfo_children() for v in w.winfo_children() if hasattr(v, "fig"))
+        self.costos[clave] = _contar_widgets(pagina) + figuras * self.COSTO_FIGURA
+
+    def desalojar(self, conservar=None):
+        """Destruye las páginas menos usadas hasta volver al presupuesto. Devuelve las claves quitadas."""
+        quitadas = []
+        while sum(self.costos.values()) > self.presupuesto:
+            clave = next((k for k in self.paginas if k != conservar), None)
+            if clave is None: break
+            self.paginas.pop(clave).destroy() # <Destroy> cierra también su EjecutorTareas
+            self.costos.pop(clave, None)
+            quitadas.append(clave)
+        return quitadas
 
 class Aplicacion(tk.Tk):
     def __init__(self):
@@ -16,39 +83,65 @@ class Aplicacion(tk.Tk):
         self.MODULOS = {
             "calculadora": {
                 "titulo": "Calculadora", "subtitulo": "Científica Básica", "icono": "🧮", "color": "#E67E22",
-                "vistas": [("calc_basic", "Básica", SimpleCalculator)]
+                "vistas": [("calc_basic", "Básica", "simple_calculator:SimpleCalculator")]
             },
             "matrices": {
                 "titulo": "Álgebra Lineal", "subtitulo": "Espacio de Trabajo", "icono": "📊", "color": "#8E44AD",
                 "vistas": [
-                    ("calc_mat", "Calculadora Matricial", VentanaCalculadoraUniversal),
-                    ("sistemas", "Sistemas (Ax=b)", VentanaSistemas),
-                    ("gauss", "Gauss / Gauss-Jordan", VentanaGauss),
-                    ("vectores", "Espacios Vectoriales", VentanaVectores),
+                    ("calc_mat", "Calculadora Matricial", "views_matrix:VentanaCalculadoraUniversal"),
+                    ("sistemas", "Sistemas (Ax=b)", "views_matrix:VentanaSistemas"),
+                    ("gauss", "Gauss / Gauss-Jordan", "views_matrix:VentanaGauss"),
+                    ("vectores", "Espacios Vectoriales", "views_matrix:VentanaVectores"),
                 ]
             },
             "numericos": {
-                "titulo": "Métodos Numéricos", "subtitulo": "Raíces", "icono": "📈", "color": "#27AE60",
+                "titulo": "Métodos Numéricos", "subtitulo": "Raíces e Integrales", "icono": "📈", "color": "#27AE60",
                 "vistas": [
-                    ("newton", "Newton-Raphson", VistaNewton),
-                    ("secante", "Secante", VistaSecante),
-                    ("biseccion", "Bisección", VentanaBiseccion),
-                    ("falsa", "Regla Falsa", VentanaReglaFalsa),
+                    ("newton", "Newton-Raphson", "views_numerical:VistaNewton"),
+                    ("secante", "Secante", "views_numerical:VistaSecante"),
+                    ("biseccion", "Bisección", "views_numerical:VentanaBiseccion"),
+                    ("falsa", "Regla Falsa", "views_numerical:VentanaReglaFalsa"),
+                    ("no_lineal", "Sistemas No Lineales", "views_numerical:VistaSistemaNoLineal"),
+                    ("integracion", "Integración", "views_numerical:VistaIntegracion"),
                 ]
             }
         }
         self.main_container = tk.Frame(self, bg=COLOR_FONDO_PRINCIPAL)
         self.main_container.pack(fill="both", expand=True)
+        # Tablero y área de trabajo se crean una vez; las vistas viven en la caché
+        self.dashboard = None
+        self.sidebar = None
+        self.active_mod = None
+        self.work_area = tk.Frame(self.main_container, bg="white")
+        self.vistas = CacheVistas()
+        self.pagina_actual = None
+        self.ultima_vista = {} # módulo -> última herramienta abierta
+        self.latencias = deque(maxlen=50) # (clave, ms, desde caché)
         self._mostrar_dashboard()
+        if PERFIL: self.after_idle(self._perfil_primera_pintura)
+
+    def _perfil_primera_pintura(self):
+        self.update_idletasks()
+        total = (time.perf_counter() - _T0) * 1e3
+        _perfil(f"imports de arranque: {_T_IMPORTS * 1e3:.0f} ms")
+        _perfil(f"primera pintura: {total:.0f} ms (presupuesto {PRESUPUESTO_ARRANQUE_MS} ms{', EXCEDIDO' if total > PRESUPUESTO_ARRANQUE_MS else ''})")
+        pesados = [m for m in ("numpy", "matplotlib", "views_numerical", "views_matrix") if m in sys.modules]
+        if pesados: _perfil(f"cargados antes de tiempo: {', '.join(pesados)}")
 
     def _mostrar_dashboard(self):
-        for w in self.main_container.winfo_children(): w.destroy()
+        self.work_area.pack_forget()
+        if self.sidebar is not None: self.sidebar.destroy(); self.sidebar = None
+        if self.dashboard is not None:
+            self.dashboard.pack(fill="both", expand=True)
+            return
+        self.dashboard = tk.Frame(self.main_container, bg=COLOR_FONDO_PRINCIPAL)
+        self.dashboard.pack(fill="both", expand=True)
         
-        header = tk.Frame(self.main_container, bg="white", height=80, padx=50)
+        header = tk.Frame(self.dashboard, bg="white", height=80, padx=50)
         header.pack(fill="x")
         tk.Label(header, text="Math Suite", font=("Segoe UI", 22, "bold"), fg="#2C3E50", bg="white").pack(side="left", pady=20)
         
-        grid = tk.Frame(self.main_container, bg=COLOR_FONDO_PRINCIPAL)
+        grid = tk.Frame(self.dashboard, bg=COLOR_FONDO_PRINCIPAL)
         grid.place(relx=0.5, rely=0.5, anchor="center")
 
         for i, (key, data) in enumerate(self.MODULOS.items()):
@@ -57,28 +150,53 @@ class Aplicacion(tk.Tk):
     def _load_mod(self, key):
         self.active_mod = key
         data = self.MODULOS[key]
-        for w in self.main_container.winfo_children(): w.destroy()
+        if self.dashboard is not None: self.dashboard.pack_forget()
+        if self.sidebar is not None: self.sidebar.destroy()
         
         sidebar = MenuLateral(self.main_container, data["titulo"], [(v[1], v[0]) for v in data["vistas"]], self._change_tool, self._mostrar_dashboard, data["color"])
         sidebar.pack(side=tk.LEFT, fill="y")
         self.sidebar = sidebar
         
-        self.work_area = tk.Frame(self.main_container, bg="white")
         self.work_area.pack(side=tk.RIGHT, fill="both", expand=True)
-        self._change_tool(data["vistas"][0][0])
+        self._change_tool(self.ultima_vista.get(key, data["vistas"][0][0]))
 
     def _change_tool(self, key):
-        for w in self.work_area.winfo_children(): w.destroy()
+        t = time.perf_counter()
+        clave = (self.active_mod, key)
+        if self.pagina_actual is not None:
+            anterior, pagina = self.pagina_actual
+            if anterior not in self.vistas.paginas: pagina.destroy() # Página de error
+            else:
+                pagina.pack_forget()
+                self.vistas.medir(anterior) # Su tamaño real se conoce ya construida y usada
+
+        pagina = self.vistas.obtener(clave)
+        desde_cache = pagina is not None
+        if pagina is None: pagina = self._construir_pagina(key)
+        pagina.pack(fill="both", expand=True)
+        self.pagina_actual = (clave, pagina)
+        self.ultima_vista[self.active_mod] = key
+        self.sidebar.marcar_seleccion(key)
+
+        ms = (time.perf_counter() - t) * 1e3
+        self.latencias.append((key, ms, desde_cache))
+        _perfil(f"cambio a {key}: {ms:.1f} ms ({'caché' if desde_cache else 'construida'})")
+        for k in self.vistas.desalojar(conservar=clave): _perfil(f"vista desalojada: {k[1]}")
+
+    def _construir_pagina(self, key):
         target = next(v for v in self.MODULOS[self.active_mod]["vistas"] if v[0] == key)
+        pagina = tk.Frame(self.work_area, bg="white")
         
-        tk.Label(self.work_area, text=target[1], font=("Segoe UI", 18), bg="white", fg="#333").pack(anchor="sw", padx=30, pady=10)
-        ttk.Separator(self.work_area).pack(fill="x")
+        tk.Label(pagina, text=target[1], font=("Segoe UI", 18), bg="white", fg="#333").pack(anchor="sw", padx=30, pady=10)
+        ttk.Separator(pagina).pack(fill="x")
         
-        container = tk.Frame(self.work_area, bg="white", padx=20, pady=20)
+        container = tk.Frame(pagina, bg="white", padx=20, pady=20)
         container.pack(fill="both", expand=True)
-        try: target[2](container)
-        except Exception as e: tk.Label(container, text=f"Error: {e}", fg="red").pack()
-        self.sidebar.marcar_seleccion(key)
+        try:
+            cargar_vista(target[2])(container)
+            self.vistas.guardar((self.active_mod, key), pagina)
+        except Exception as e: tk.Label(container, text=f"Error: {e}", fg="red").pack() # Sin caché: se reintenta
+        return pagina
 
 if __name__ == "__main__":
     app = Aplicacion()
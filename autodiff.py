@@ -0,0 +1,103 @@
+import math
+
+# Diferenciación automática en modo directo (números duales v + d·ε).
+# Los componentes pueden ser float, Decimal o Intervalo: las funciones
+# elementales se toman de una tabla "base" del tipo correspondiente.
+
+def _ln_de(v):
+    if hasattr(v, "ln"): return v.ln()
+    return math.log(v)
+
+def _exp_de(v):
+    if hasattr(v, "exp"): return v.exp()
+    return math.exp(v)
+
+def _signo_de(v):
+    if hasattr(v, "signo"): return v.signo()
+    return (v > 0) - (v < 0)
+
+class Dual:
+    """Número dual: valor `v` y derivada `d` respecto a la variable sembrada."""
+    __slots__ = ("v", "d")
+
+    def __init__(self, v, d=0):
+        self.v = v
+        self.d = d
+
+    def __repr__(self): return f"Dual({self.v!r}, {self.d!r})"
+
+    def __add__(self, o):
+        if isinstance(o, Dual): return Dual(self.v + o.v, self.d + o.d)
+        return Dual(self.v + o, self.d)
+    __radd__ = __add__
+
+    def __sub__(self, o):
+        if isinstance(o, Dual): return Dual(self.v - o.v, self.d - o.d)
+        return Dual(self.v - o, self.d)
+
+    def __rsub__(self, o): return Dual(o - self.v, -self.d)
+
+    def __mul__(self, o):
+        if isinstance(o, Dual): return Dual(self.v * o.v, self.d * o.v + self.v * o.d)
+        return Dual(self.v * o, self.d * o)
+    __rmul__ = __mul__
+
+    def __truediv__(self, o):
+        if isinstance(o, Dual):
+            return Dual(self.v / o.v, (self.d * o.v - self.v * o.d) / (o.v * o.v))
+        return Dual(self.v / o, self.d / o)
+
+    def __rtruediv__(self, o): return Dual(o / self.v, -o * self.d / (self.v * self.v))
+
+    def __pow__(self, o):
+        if isinstance(o, Dual):
+            # a^b = exp(b·ln a)
+            ln_v = _ln_de(self.v)
+            val = self.v ** o.v
+            return Dual(val, val * (o.d * ln_v + o.v * self.d / self.v))
+        if o == 0: return Dual(self.v ** 0, self.d * 0)
+        return Dual(self.v ** o, o * self.v ** (o - 1) * self.d)
+
+    def __rpow__(self, o):
+        val = o ** self.v
+        return Dual(val, val * _ln_de(o) * self.d)
+
+    def __neg__(self): return Dual(-self.v, -self.d)
+    def __pos__(self): return self
+    def __abs__(self): return Dual(abs(self.v), self.d * _signo_de(self.v))
+
+def funciones_duales(base):
+    """
+    Envuelve una tabla de funciones escalares (sin, cos, tan, exp, ln, sqrt, log10)
+    para que acepten Dual. `base["cte"]` convierte constantes al tipo numérico.
+    """
+    sin, cos, tan, exp, ln, sqrt = base["sin"], base["cos"], base["tan"], base["exp"], base["ln"], base["sqrt"]
+    ln10 = ln(base["cte"](10))
+
+    def _envolver(f, df):
+        def g(u):
+            if not isinstance(u, Dual): return f(u)
+            return Dual(f(u.v), df(u.v) * u.d)
+        return g
+
+    def _tan_d(v):
+        t = tan(v)
+        return 1 + t * t
+
+    return {
+        "sin": _envolver(sin, cos),
+        "cos": _envolver(cos, lambda v: -sin(v)),
+        "tan": _envolver(tan, _tan_d),
+        "exp": _envolver(exp, exp),
+        "ln": _envolver(ln, lambda v: 1 / v),
+        "sqrt": _envolver(sqrt, lambda v: 1 / (2 * sqrt(v))),
+        "log": _envolver(lambda v: ln(v) / ln10, lambda v: 1 / (v * ln10)),
+        "log10": _envolver(lambda v: ln(v) / ln10, lambda v: 1 / (v * ln10)),
+        "abs": abs,
+        "pow": pow,
+    }
+
+FUNCIONES_FLOAT = {
+    "sin": math.sin, "cos": math.cos, "tan": math.tan, "exp": math.exp,
+    "ln": math.log, "sqrt": math.sqrt, "cte": float,
+}
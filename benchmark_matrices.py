@@ -0,0 +1,131 @@
+"""
+Banco de pruebas de la eliminación exacta: filas enteras con denominador común
+(matrix_ops) frente a la versión de referencia con una Fraction por entrada.
+
+    python benchmark_matrices.py                      # tabla en consola
+    python benchmark_matrices.py --tamanos 20 40 80   # otros tamaños
+    python benchmark_matrices.py -o resultados.json   # además, JSON
+
+Por cada operación (rref, determinante, inversa, rango), tipo de matriz y tamaño se mide el
+tiempo (mínimo de varias repeticiones) de ambas versiones y se comprueba que den
+exactamente el mismo resultado.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+from fractions import Fraction
+
+import matrix_ops as mo
+
+# --- Referencia: una Fraction por entrada (el algoritmo anterior, sin pasos) ---
+
+def rref_fracciones(A):
+    M = [[Fraction(v) for v in fila] for fila in A]
+    rows, cols = len(M), len(M[0])
+    r = 0
+    for c in range(cols):
+        if r >= rows: break
+        pivot = r
+        while pivot < rows and M[pivot][c] == 0: pivot += 1
+        if pivot == rows: continue
+        M[r], M[pivot] = M[pivot], M[r]
+        piv_val = M[r][c]
+        for j in range(c, cols): M[r][j] /= piv_val
+        for i in range(rows):
+            if i != r and M[i][c] != 0:
+                f = M[i][c]
+                for j in range(c, cols): M[i][j] -= f * M[r][j]
+        r += 1
+    return M
+
+def det_fracciones(A):
+    M = [[Fraction(v) for v in fila] for fila in A]
+    n, det = len(M), Fraction(1)
+    for i in range(n):
+        p = i
+        while p < n and M[p][i] == 0: p += 1
+        if p == n: return Fraction(0)
+        if p != i: M[i], M[p] = M[p], M[i]; det = -det
+        piv = M[i][i]
+        det *= piv
+        for j in range(i + 1, n):
+            f = M[j][i] / piv
+            for k in range(i, n): M[j][k] -= f * M[i][k]
+    return det
+
+def inversa_fracciones(A):
+    n = len(A)
+    R = rref_fracciones([list(fila) + [Fraction(int(i == j)) for j in range(n)] for i, fila in enumerate(A)])
+    return [fila[n:] for fila in R]
+
+OPERACIONES = {
+    "rref": (rref_fracciones, lambda A: mo.rref(A)[0]),
+    "determinante": (det_fracciones, lambda A: mo.determinante(A)[0]),
+    "inversa": (inversa_fracciones, lambda A: mo.matriz_inversa(A)[0]),
+    # Filtro flotante certificado (rango completo) frente a contar filas no nulas de la RREF
+    "rango": (lambda A: sum(1 for fila in rref_fracciones(A) if any(fila)), lambda A: mo.rango_matriz(A)[0]),
+}
+
+# --- Matrices de prueba ---
+
+def _enteras(n, rng): return [[Fraction(rng.randint(-9, 9)) for _ in range(n)] for _ in range(n)]
+def _racionales(n, rng): return [[Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(n)] for _ in range(n)]
+def _hilbert(n, rng): return [[Fraction(1, i + j + 1) for j in range(n)] for i in range(n)]
+
+TIPOS = {"enteras": _enteras, "racionales": _racionales, "hilbert": _hilbert}
+TAMANOS = (10, 25, 50)
+
+def _cronometrar(f, A, repeticiones):
+    mejor, res = float("inf"), None
+    for _ in range(repeticiones):
+        t0 = time.perf_counter(); res = f(A); mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, res
+
+def medir(op, tipo, n, repeticiones=3, semilla=0) -> dict:
+    A = TIPOS[tipo](n, random.Random(semilla))
+    referencia, filas = OPERACIONES[op]
+    t_ref, r_ref = _cronometrar(referencia, A, repeticiones)
+    t_fil, r_fil = _cronometrar(filas, A, repeticiones)
+    return {"operacion": op, "tipo": tipo, "n": n, "fraccion_s": t_ref, "filas_enteras_s": t_fil,
+            "aceleracion": t_ref / t_fil if t_fil else None, "iguales": r_ref == r_fil}
+
+def ejecutar(operaciones=None, tipos=None, tamanos=TAMANOS, repeticiones=3) -> dict:
+    for k in mo.ESTADISTICAS_FILTRO: mo.ESTADISTICAS_FILTRO[k] = 0
+    filas = [medir(op, t, n, repeticiones) for op in (operaciones or OPERACIONES) for t in (tipos or TIPOS) for n in tamanos]
+    return {
+        "meta": {"fecha": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+                 "plataforma": platform.platform(), "repeticiones": repeticiones, "umbral_bits": mo.UMBRAL_BITS},
+        "resultados": filas,
+        "filtro": dict(mo.ESTADISTICAS_FILTRO),
+    }
+
+def imprimir(res: dict):
+    print(f"{'operación':<13} {'tipo':<11} {'n':>4} {'Fraction ms':>12} {'filas ms':>10} {'x':>6}  ok")
+    for f in res["resultados"]:
+        print(f"{f['operacion']:<13} {f['tipo']:<11} {f['n']:>4} {f['fraccion_s'] * 1e3:>12.2f} "
+              f"{f['filas_enteras_s'] * 1e3:>10.2f} {f['aceleracion']:>6.1f}  {'✓' if f['iguales'] else '✗'}")
+    filtro = res.get("filtro", {})
+    if sum(filtro.values()):
+        print(f"Filtro flotante: {filtro['flotante']} de {sum(filtro.values())} consultas decididas sin aritmética exacta")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Eliminación exacta: filas enteras frente a Fraction por entrada.")
+    ap.add_argument("-o", "--salida", help="Escribe los resultados en JSON.")
+    ap.add_argument("--operaciones", nargs="+", choices=list(OPERACIONES))
+    ap.add_argument("--tipos", nargs="+", choices=list(TIPOS))
+    ap.add_argument("--tamanos", nargs="+", type=int, default=list(TAMANOS))
+    ap.add_argument("-r", "--repeticiones", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    res = ejecutar(args.operaciones, args.tipos, args.tamanos, args.repeticiones)
+    imprimir(res)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as fh: json.dump(res, fh, indent=2, ensure_ascii=False)
+    return 0 if all(f["iguales"] for f in res["resultados"]) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
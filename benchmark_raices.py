@@ -0,0 +1,182 @@
+"""
+Banco de pruebas de los métodos de raíces (Newton, secante, bisección, regla falsa y
+las variantes para raíces múltiples: Newton modificado, Steffensen, Aitken Δ²).
+
+    python benchmark_raices.py                         # tabla en consola
+    python benchmark_raices.py -o resultados.json      # además, JSON
+    python benchmark_raices.py --baseline base.json    # compara y sale con 1 si hay regresiones
+
+Por cada método, caso del corpus y tolerancia se mide: tiempo (mínimo de varias
+repeticiones), evaluaciones de f, iteraciones, éxito y error final frente a la raíz
+conocida. Las evaluaciones y las iteraciones son deterministas, así que cualquier
+aumento cuenta como regresión; el tiempo solo si empeora más que `--umbral-tiempo`.
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import numerical_methods as nm
+
+# --- Corpus ---
+# raiz: valor de referencia (16 cifras); x0/x1: arranques abiertos; ab: intervalo con cambio
+# de signo (None si no existe, p. ej. raíz doble); tol_exito: exactitud que se exige.
+CORPUS = [
+    # Polinomios
+    dict(nombre="cubica_wallis", categoria="polinomio", f="x^3-2*x-5", raiz=2.0945514815423265, x0=2.0, x1=3.0, ab=(2.0, 3.0)),
+    dict(nombre="raiz_de_2", categoria="polinomio", f="x^2-2", raiz=1.4142135623730951, x0=1.0, x1=2.0, ab=(1.0, 2.0)),
+    dict(nombre="quintica", categoria="polinomio", f="x^5-x-1", raiz=1.1673039782614187, x0=1.0, x1=2.0, ab=(1.0, 2.0)),
+    # Trascendentes
+    dict(nombre="coseno_punto_fijo", categoria="trascendente", f="cos(x)-x", raiz=0.7390851332151607, x0=1.0, x1=0.5, ab=(0.0, 1.0)),
+    dict(nombre="exp_lineal", categoria="trascendente", f="exp(x)-3*x", raiz=0.6190612867359451, x0=0.0, x1=0.5, ab=(0.0, 1.0)),
+    dict(nombre="omega_lambert", categoria="trascendente", f="x*exp(x)-1", raiz=0.5671432904097838, x0=1.0, x1=0.5, ab=(0.0, 1.0)),
+    dict(nombre="log_mas_x", categoria="trascendente", f="ln(x)+x", raiz=0.5671432904097838, x0=0.5, x1=1.0, ab=(0.1, 1.0)),
+    dict(nombre="seno_pi", categoria="trascendente", f="sin(x)", raiz=math.pi, x0=3.0, x1=3.5, ab=(3.0, 4.0)),
+    # Raíces múltiples (Newton y secante pasan a convergencia lineal)
+    dict(nombre="triple_desplazada", categoria="multiple", f="(x-1)^3", raiz=1.0, x0=2.0, x1=1.5, ab=(0.0, 2.5), tol_exito=1e-4),
+    dict(nombre="doble_sin_cambio", categoria="multiple", f="(x-2)^2*(x+1)", raiz=2.0, x0=3.0, x1=2.5, ab=None, tol_exito=1e-4),
+    dict(nombre="casi_doble", categoria="multiple", f="(x-1)^2-0.000000000001", raiz=1.000001, x0=2.0, x1=1.5, ab=(1.0, 2.0)),
+    # Zonas planas (derivada casi nula lejos de la raíz, regla falsa estancada)
+    dict(nombre="potencia_10", categoria="plana", f="x^10-1", raiz=1.0, x0=0.5, x1=0.6, ab=(0.0, 1.3)),
+    dict(nombre="gaussiana_desplazada", categoria="plana", f="exp(-x^2)-0.5", raiz=0.8325546111576978, x0=0.3, x1=0.4, ab=(0.0, 2.0)),
+    # Derivada casi singular en el arranque / ciclos de Newton
+    dict(nombre="ciclo_newton", categoria="singular", f="x^3-2*x+2", raiz=-1.7692923542386314, x0=0.0, x1=0.5, ab=(-2.0, -1.0)),
+    dict(nombre="derivada_pequena", categoria="singular", f="x^3-x-0.001", raiz=1.0004996254991811, x0=0.58, x1=0.6, ab=(0.5, 2.0)),
+]
+
+METODOS = {
+    "newton": lambda c, tol: nm.newton_raphson(c["f"], c["x0"], tol=tol, traza=False),
+    "secante": lambda c, tol: nm.metodo_secante(c["f"], c["x0"], c["x1"], tol=tol, traza=False),
+    "biseccion": lambda c, tol: nm.metodo_biseccion(c["f"], *c["ab"], tol=tol, traza=False),
+    "regla_falsa": lambda c, tol: nm.metodo_regla_falsa(c["f"], *c["ab"], tol=tol, traza=False),
+    # Raíces múltiples y aceleración (comparar contra newton / secante en la categoría "multiple")
+    "newton_mod": lambda c, tol: nm.newton_modificado(c["f"], c["x0"], tol=tol, traza=False),
+    "newton_u": lambda c, tol: nm.newton_modificado(c["f"], c["x0"], variante="u", tol=tol, traza=False),
+    "steffensen": lambda c, tol: nm.metodo_steffensen(c["f"], c["x0"], tol=tol, traza=False),
+    "aitken_newton": lambda c, tol: nm.acelerar_aitken(nm.newton_raphson, c["f"], c["x0"], tol=tol, traza=False),
+    "aitken_secante": lambda c, tol: nm.acelerar_aitken(nm.metodo_secante, c["f"], c["x0"], c["x1"], tol=tol, traza=False),
+}
+CON_INTERVALO = {"biseccion", "regla_falsa"}
+TOLERANCIAS = (1e-7, 1e-12)
+
+@contextmanager
+def _contar_evaluaciones():
+    """
+    Intercepta nm.evaluar_funcion (también la usa derivada_numerica) y nm._f_y_derivadas
+    (f, f', f'' por diferenciación automática: cuenta como una evaluación) y cuenta las llamadas.
+    """
+    originales, cuenta = {n: getattr(nm, n) for n in ("evaluar_funcion", "_f_y_derivadas")}, [0]
+    def contar(original):
+        def contada(func_str, x):
+            cuenta[0] += 1
+            return original(func_str, x)
+        return contada
+    for n, f in originales.items(): setattr(nm, n, contar(f))
+    try: yield cuenta
+    finally:
+        for n, f in originales.items(): setattr(nm, n, f)
+
+def medir(metodo: str, caso: dict, tol: float, repeticiones=5) -> dict:
+    fila = {"metodo": metodo, "caso": caso["nombre"], "categoria": caso["categoria"], "tol": tol}
+    if metodo in CON_INTERVALO and caso.get("ab") is None:
+        fila.update(exito=None, motivo="sin intervalo con cambio de signo")
+        return fila
+    correr = METODOS[metodo]
+    try:
+        with _contar_evaluaciones() as cuenta: x, reg = correr(caso, tol) # También calienta la caché de compilación
+    except Exception as e:
+        fila.update(exito=False, motivo=str(e))
+        return fila
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter(); correr(caso, tol); tiempos.append(time.perf_counter() - t0)
+    error = abs(x - caso["raiz"]) if math.isfinite(x) else math.inf
+    try: residuo = abs(nm.evaluar_funcion(caso["f"], x))
+    except ValueError: residuo = math.inf
+    fila.update(tiempo_s=min(tiempos), evaluaciones=cuenta[0], iteraciones=reg.iteraciones,
+                error_final=error, residuo=residuo,
+                exito=error <= caso.get("tol_exito", max(1e-6, 10 * tol)) * max(1.0, abs(caso["raiz"])))
+    return fila
+
+def ejecutar(metodos=None, categorias=None, tolerancias=TOLERANCIAS, repeticiones=5) -> dict:
+    casos = [c for c in CORPUS if not categorias or c["categoria"] in categorias]
+    filas = [medir(m, c, tol, repeticiones) for m in (metodos or METODOS) for c in casos for tol in tolerancias]
+    return {
+        "meta": {"fecha": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+                 "plataforma": platform.platform(), "repeticiones": repeticiones},
+        "resultados": filas,
+        "resumen": resumir(filas),
+    }
+
+def resumir(filas) -> dict:
+    resumen = {}
+    for f in filas:
+        if f.get("exito") is None: continue
+        r = resumen.setdefault(f["metodo"], {"casos": 0, "exitos": 0, "tiempo_s": 0.0, "evaluaciones": 0})
+        r["casos"] += 1; r["exitos"] += bool(f["exito"])
+        r["tiempo_s"] += f.get("tiempo_s", 0.0); r["evaluaciones"] += f.get("evaluaciones", 0)
+    for r in resumen.values(): r["tasa_exito"] = r["exitos"] / r["casos"]
+    return resumen
+
+def comparar(actual: dict, base: dict, umbral_tiempo=1.5, minimo_s=2e-5) -> list:
+    """Lista de regresiones (textos) de `actual` respecto a `base`, emparejando por método, caso y tol."""
+    previos = {(f["metodo"], f["caso"], f["tol"]): f for f in base["resultados"]}
+    regresiones = []
+    for f in actual["resultados"]:
+        p = previos.get((f["metodo"], f["caso"], f["tol"]))
+        if p is None or p.get("exito") is None: continue
+        clave = f"{f['metodo']}/{f['caso']} tol={f['tol']:g}"
+        if p["exito"] and not f.get("exito"):
+            regresiones.append(f"{clave}: dejó de converger ({f.get('motivo') or 'error ' + format(f.get('error_final', math.nan), '.2e')})")
+            continue
+        for campo in ("evaluaciones", "iteraciones"):
+            if campo in p and f.get(campo, 0) > p[campo]:
+                regresiones.append(f"{clave}: {campo} {p[campo]} -> {f[campo]}")
+        t0, t1 = p.get("tiempo_s"), f.get("tiempo_s")
+        if t0 and t1 and t1 > umbral_tiempo * t0 and t1 - t0 > minimo_s:
+            regresiones.append(f"{clave}: tiempo {t0 * 1e6:.1f} µs -> {t1 * 1e6:.1f} µs (x{t1 / t0:.2f})")
+    return regresiones
+
+def imprimir(res: dict):
+    print(f"{'método':<12} {'caso':<22} {'tol':>7} {'µs':>9} {'evals':>6} {'iter':>5} {'error':>9}  ok")
+    for f in res["resultados"]:
+        if f.get("exito") is None: continue
+        if "tiempo_s" not in f:
+            print(f"{f['metodo']:<12} {f['caso']:<22} {f['tol']:>7.0e} {'—':>9} {'—':>6} {'—':>5} {'—':>9}  ✗ {f['motivo']}")
+            continue
+        print(f"{f['metodo']:<12} {f['caso']:<22} {f['tol']:>7.0e} {f['tiempo_s'] * 1e6:>9.1f} {f['evaluaciones']:>6} "
+              f"{f['iteraciones']:>5} {f['error_final']:>9.1e}  {'✓' if f['exito'] else '✗'}")
+    print()
+    for m, r in res["resumen"].items():
+        print(f"{m:<12} éxito {r['exitos']}/{r['casos']} ({r['tasa_exito']:.0%})  "
+              f"tiempo total {r['tiempo_s'] * 1e3:.2f} ms  evaluaciones {r['evaluaciones']}")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark de los métodos de raíces sobre un corpus de funciones de prueba.")
+    ap.add_argument("-o", "--salida", help="Escribe los resultados en JSON.")
+    ap.add_argument("--baseline", help="JSON de una ejecución anterior con el que comparar.")
+    ap.add_argument("--metodos", nargs="+", choices=list(METODOS))
+    ap.add_argument("--categorias", nargs="+", choices=sorted({c["categoria"] for c in CORPUS}))
+    ap.add_argument("--tol", nargs="+", type=float, default=list(TOLERANCIAS))
+    ap.add_argument("-r", "--repeticiones", type=int, default=5)
+    ap.add_argument("--umbral-tiempo", type=float, default=1.5, help="Factor de empeoramiento de tiempo tolerado.")
+    args = ap.parse_args(argv)
+
+    res = ejecutar(args.metodos, args.categorias, args.tol, args.repeticiones)
+    imprimir(res)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as fh: json.dump(res, fh, indent=2, ensure_ascii=False)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh: base = json.load(fh)
+        regresiones = comparar(res, base, args.umbral_tiempo)
+        print(f"\nComparación con {args.baseline}: {len(regresiones) or 'sin'} regresiones")
+        for r in regresiones: print("  ✗", r)
+        return 1 if regresiones else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import math
+from fractions import Fraction
+from typing import Optional
+
+# Evaluador exacto (Fraction) por shunting-yard incremental: cada token se integra al
+# llegar, reduciendo en el momento todo lo que su precedencia permite. Así las pilas
+# quedan poco profundas y la vista previa no necesita volver a leer la expresión.
+# Las pilas son listas enlazadas inmutables (valor, resto): deshacer un token es
+# volver al estado anterior en O(1).
+
+PRECEDENCIA = {"+": 1, "-": 1, "*": 2, "/": 2, "neg": 3}
+LIMITE_BITS = 200_000 # ~60 000 cifras: más allá, operar y mostrar empieza a congelar la UI
+
+def _push(pila, v): return (v, pila)
+
+def comprobar_tamano(v: Fraction) -> Fraction:
+    """Devuelve v, o ValueError si numerador o denominador pasan de LIMITE_BITS."""
+    if v.numerator.bit_length() > LIMITE_BITS or v.denominator.bit_length() > LIMITE_BITS:
+        raise ValueError("Número demasiado grande")
+    return v
+
+def _aplicar(op, vals):
+    if op == "neg":
+        a, vals = vals
+        return _push(vals, -a)
+    b, (a, vals) = vals
+    if op == "+": r = a + b
+    elif op == "-": r = a - b
+    elif op == "*": r = a * b
+    else:
+        if b == 0: raise ValueError("División por cero")
+        r = a / b
+    return _push(vals, comprobar_tamano(r))
+
+class EvaluadorIncremental:
+    """
+    agregar(token): número (Fraction, int o str), '+', '-', '*', '/', '(' o ')'.
+    Un '-' donde se espera operando es el signo (unario); un '(' tras un operando
+    multiplica implícitamente.
+    """
+    def __init__(self):
+        # Estado: (valores, operadores, espera_operando, paréntesis abiertos)
+        self.historial = [(None, None, True, 0)]
+        self.tokens = []
+
+    @property
+    def estado(self): return self.historial[-1]
+
+    @property
+    def espera_operando(self): return self.estado[2]
+
+    def agregar(self, token):
+        """Integra un token. Si es inválido lanza ValueError y el estado no cambia."""
+        vals, ops, espera, prof = self.estado
+        if token in ("+", "-", "*", "/"):
+            if espera:
+                if token == "-": ops = _push(ops, "neg")
+                elif token != "+": raise ValueError(f"Falta un operando antes de '{token}'")
+            else:
+                vals, ops = self._reducir(vals, ops, PRECEDENCIA[token])
+                ops, espera = _push(ops, token), True
+        elif token == "(":
+            if not espera: vals, ops = self._reducir(vals, ops, PRECEDENCIA["*"]); ops = _push(ops, "*")
+            ops, espera, prof = _push(ops, "("), True, prof + 1
+        elif token == ")":
+            if espera or prof == 0: raise ValueError("Paréntesis sin abrir o vacío")
+            vals, ops = self._reducir(vals, ops, 0)
+            ops, prof = ops[1], prof - 1 # Quitar el '('
+        else:
+            if not espera: raise ValueError("Faltan operadores entre números")
+            v = token if isinstance(token, Fraction) else Fraction(token)
+            vals, espera = _push(vals, comprobar_tamano(v)), False
+        self.historial.append((vals, ops, espera, prof))
+        self.tokens.append(token)
+
+    def deshacer(self):
+        if len(self.historial) > 1:
+            self.historial.pop(); self.tokens.pop()
+
+    @staticmethod
+    def _reducir(vals, ops, prec_min):
+        """Aplica los operadores de la cima con precedencia >= prec_min (hasta un '(')."""
+        while ops is not None and ops[0] != "(" and PRECEDENCIA[ops[0]] >= prec_min:
+            vals = _aplicar(ops[0], vals)
+            ops = ops[1]
+        return vals, ops
+
+    def vista_previa(self, pendiente=None) -> Optional[Fraction]:
+        """
+        Valor si la expresión terminara ahora (con `pendiente` como último número):
+        se ignoran los operadores colgantes y se cierran los paréntesis abiertos.
+        None si todavía no hay nada que evaluar. Cuesta O(profundidad de las pilas).
+        """
+        vals, ops, espera, _ = self.estado
+        if pendiente is not None and espera: vals, espera = _push(vals, Fraction(pendiente)), False
+        while espera and ops is not None: # "3 + (" -> 3
+            op, ops = ops
+            if op not in ("neg", "("): espera = False # Operador binario colgante: queda su operando izquierdo
+        if espera: return None
+        while ops is not None:
+            if ops[0] != "(": vals = _aplicar(ops[0], vals)
+            ops = ops[1]
+        return vals[0]
+
+    def resultado(self, pendiente=None) -> Fraction:
+        r = self.vista_previa(pendiente)
+        if r is None: raise ValueError("Expresión vacía")
+        return r
+
+# --- Presentación ---
+
+def _log10_abs(n: int) -> float:
+    """log10|n| para enteros de cualquier tamaño, usando solo los 64 bits altos."""
+    n = abs(n)
+    exceso = max(0, n.bit_length() - 64)
+    return math.log10(n >> exceso) + exceso * math.log10(2)
+
+def aproximar(v: Fraction, cifras=12) -> str:
+    """Decimal de `cifras` significativas sin convertir a texto los enteros enormes."""
+    if v == 0: return "0"
+    if v.denominator == 1 and v.numerator.bit_length() <= 53: return str(v.numerator)
+    log = _log10_abs(v.numerator) - _log10_abs(v.denominator)
+    if abs(log) < 300: return f"{float(v):.{cifras}g}"
+    e = math.floor(log)
+    mantisa = 10 ** (log - e)
+    return f"{'-' if v < 0 else ''}{mantisa:.{cifras - 1}f}e{e:+d}"
+
+def exacto_corto(v: Fraction, max_cifras=12) -> Optional[str]:
+    """'n/d' si numerador y denominador caben en `max_cifras`; si no, None."""
+    lim = max_cifras * 3.33
+    if v.numerator.bit_length() > lim or v.denominator.bit_length() > lim: return None
+    return str(v.numerator) if v.denominator == 1 else f"{v.numerator}/{v.denominator}"
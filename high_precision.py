@@ -0,0 +1,157 @@
+import re
+from decimal import Decimal, localcontext, getcontext
+from functools import lru_cache
+
+from autodiff import Dual, funciones_duales
+from numerical_methods import _preprocesar_expresion
+from traces import Traza
+
+DIGITOS_GUARDA = 10
+
+# --- Funciones elementales con la precisión del contexto decimal actual ---
+
+@lru_cache(maxsize=16)
+def _pi(prec: int) -> Decimal:
+    """π con `prec` dígitos (serie de la documentación de decimal), cacheado por precisión."""
+    with localcontext() as ctx:
+        ctx.prec = prec + 2
+        lasts, t, s, n, na, d, da = 0, Decimal(3), Decimal(3), 1, 0, 0, 24
+        while s != lasts:
+            lasts = s
+            n, na = n + na, na + 8
+            d, da = d + da, da + 32
+            t = (t * n) / d
+            s += t
+    with localcontext() as ctx:
+        ctx.prec = prec
+        return +s
+
+def pi_dec() -> Decimal: return _pi(getcontext().prec)
+
+def _serie_seno_coseno(x: Decimal, seno: bool) -> Decimal:
+    """Taylor tras reducir el argumento a [-π, π] con dígitos extra."""
+    prec = getcontext().prec
+    extra = max(0, x.adjusted()) + 5 # Reducir un argumento grande consume dígitos
+    with localcontext() as ctx:
+        ctx.prec = prec + extra
+        dos_pi = 2 * _pi(ctx.prec)
+        x = x.remainder_near(dos_pi)
+        x2 = x * x
+        termino = x if seno else Decimal(1)
+        suma, k = termino, 1 if seno else 0
+        eps = Decimal(10) ** (-(prec + 2))
+        while abs(termino) > eps:
+            termino = -termino * x2 / ((k + 1) * (k + 2))
+            k += 2
+            suma += termino
+    return +suma
+
+def sin_dec(x): return _serie_seno_coseno(Decimal(x), True)
+def cos_dec(x): return _serie_seno_coseno(Decimal(x), False)
+def tan_dec(x): return sin_dec(x) / cos_dec(x)
+
+FUNCIONES_DECIMAL = {
+    "sin": sin_dec, "cos": cos_dec, "tan": tan_dec,
+    "exp": lambda x: Decimal(x).exp(),
+    "ln": lambda x: Decimal(x).ln(),
+    "sqrt": lambda x: Decimal(x).sqrt(),
+    "cte": Decimal,
+}
+
+# Literales numéricos -> Decimal exacto: "0.1" no debe pasar por float
+_LITERAL = re.compile(r'(?<![\w.])(\d+\.\d*|\.\d+|\d+)')
+
+@lru_cache(maxsize=64)
+def _compilar_decimal(func_str: str):
+    func_py = _LITERAL.sub(r'_D("\1")', _preprocesar_expresion(func_str))
+    return compile(func_py, "<f(x)>", "eval")
+
+def _contexto_decimal(x):
+    ctx = funciones_duales(FUNCIONES_DECIMAL)
+    ctx.update({"x": x, "_D": Decimal, "e": Decimal(1).exp(), "pi": pi_dec()})
+    return ctx
+
+def evaluar_decimal(func_str: str, x) -> Decimal:
+    """f(x) con la precisión del contexto decimal actual."""
+    try: return +Decimal(eval(_compilar_decimal(func_str), {"__builtins__": None}, _contexto_decimal(Decimal(x))))
+    except Exception as e: raise ValueError(f"Error evaluando '{func_str}' en alta precisión: {e}")
+
+def _f_y_derivada(codigo, x: Decimal):
+    r = eval(codigo, {"__builtins__": None}, _contexto_decimal(Dual(x, Decimal(1))))
+    if isinstance(r, Dual): return Decimal(r.v), Decimal(r.d)
+    return Decimal(r), Decimal(0)
+
+def _para_registro(d: Decimal):
+    # Errores por debajo del rango de float se guardan como texto en la traza
+    f = float(d)
+    return f if f != 0 or d == 0 else f"{d:.3E}"
+
+def _agregar_fila(reg, k, x, x_nuevo, fx, error):
+    # La traza puede ser de cualquier método de raíces: cada valor va a la columna
+    # del mismo nombre si existe (xi/xi+1 en Newton y secante, c en los de intervalo)
+    valores = {'iter': k, 'xi': x, 'xi+1': x_nuevo, 'c': x_nuevo, 'f(xi)': fx, 'error': error}
+    reg.agregar(*(valores.get(c) for c in reg.columnas))
+
+def _redondear(x, digits: int) -> Decimal:
+    with localcontext() as ctx:
+        ctx.prec = digits
+        return +(x if isinstance(x, Decimal) else Decimal(repr(float(x))))
+
+def _digitos_verificados(paso, x, digits: int) -> int:
+    # Dígitos que el último paso de Newton garantiza: |paso| / |x| ~ 10^-d
+    if paso == 0: return digits
+    d = int((max(Decimal(1), abs(x)) / abs(paso)).log10())
+    return max(1, min(digits, d))
+
+def sin_refinar(x, digits: int, reg, k: int):
+    """La fase flotante no convergió: x queda como float (ningún dígito verificado) y una fila de nota en la traza."""
+    _agregar_fila(reg, k, float(x), None, None, "Sin refinar: no convergió")
+    return x, reg
+
+def refinar_newton(func_str: str, x0, digits: int, reg=None, k0=0, max_extra=20):
+    """
+    Newton en decimal duplicando la precisión de trabajo en cada paso: como el
+    número de dígitos correctos también se duplica, solo la última iteración se
+    hace con la precisión completa. Derivada exacta por duales decimales.
+    Devuelve (raiz, reg) con `digits` dígitos significativos; si no se alcanzan
+    (raíz múltiple: Newton pasa a ser lineal) la última fila de la traza lo dice y
+    la raíz se redondea a los dígitos que el último paso sí verificó.
+    """
+    if reg is None: reg = Traza(('iter', 'xi', 'f(xi)', 'error'))
+    try: codigo = _compilar_decimal(func_str)
+    except SyntaxError as e: raise ValueError(f"Expresión mal formada: {e}")
+    objetivo = digits + DIGITOS_GUARDA
+    prec = min(32, objetivo)
+    x = Decimal(repr(float(x0))) if not isinstance(x0, Decimal) else x0
+    k = k0
+    extra = 0
+    paso, convergio = None, False
+    while True:
+        k += 1
+        with localcontext() as ctx:
+            ctx.prec = prec
+            try: fx, dfx = _f_y_derivada(codigo, +x)
+            except Exception:
+                _agregar_fila(reg, k, float(x), None, None, "Error Mat.")
+                break
+            if dfx == 0:
+                _agregar_fila(reg, k, float(x), None, _para_registro(fx), "Derivada 0")
+                break
+            paso = fx / dfx
+            _agregar_fila(reg, k, float(x), float(x - paso), _para_registro(fx), _para_registro(abs(paso)))
+            x = x - paso
+        if prec < objetivo:
+            prec = min(2 * prec, objetivo)
+            continue
+        # Precisión completa: confirmar que el paso ya está por debajo de 10^-digits
+        if abs(paso) <= Decimal(10) ** (-digits) * max(Decimal(1), abs(x)):
+            convergio = True
+            break
+        extra += 1
+        if extra >= max_extra:
+            _agregar_fila(reg, k + 1, float(x), None, None, f"Sin alcanzar {digits} dígitos")
+            break
+    if convergio: return _redondear(x, digits), reg
+    # Sin alcanzar la precisión pedida: sin ningún paso no hay nada verificado
+    if paso is None: return x0, reg
+    return _redondear(x, _digitos_verificados(paso, x, digits)), reg
@@ -0,0 +1,317 @@
+import math
+from typing import List, Dict, Any, Tuple
+
+from autodiff import Dual, funciones_duales
+from numerical_methods import _preprocesar_expresion
+
+INF = math.inf
+
+# Redondeo hacia afuera: cada extremo se empuja un ulp en la dirección segura.
+# Suponemos que libm (sin, exp, log...) tiene error < 1 ulp, por eso las
+# funciones elementales se ensanchan dos ulps.
+def _abajo(x: float) -> float: return math.nextafter(x, -INF)
+def _arriba(x: float) -> float: return math.nextafter(x, INF)
+
+def _binaria(op):
+    # Deja que Dual (u otros tipos) resuelvan la operación con sus métodos reflejados
+    def envoltura(self, o):
+        if not isinstance(o, (Intervalo, int, float)): return NotImplemented
+        return op(self, o)
+    envoltura.__name__ = op.__name__
+    return envoltura
+
+def _mul(a: float, b: float) -> float:
+    # Convención de análisis de intervalos: 0 * inf = 0
+    if a == 0 or b == 0: return 0.0
+    return a * b
+
+class Intervalo:
+    """Intervalo cerrado [lo, hi] con aritmética de redondeo hacia afuera."""
+    __slots__ = ("lo", "hi")
+
+    def __init__(self, lo, hi=None):
+        if hi is None: hi = lo
+        self.lo = float(lo)
+        self.hi = float(hi)
+        if self.lo > self.hi: raise ValueError(f"Intervalo vacío [{lo}, {hi}]")
+
+    def __repr__(self): return f"[{self.lo!r}, {self.hi!r}]"
+
+    # --- Propiedades ---
+    @property
+    def ancho(self): return self.hi - self.lo
+    @property
+    def medio(self):
+        if math.isinf(self.lo) or math.isinf(self.hi):
+            if self.lo == -INF and self.hi == INF: return 0.0
+            return self.hi if math.isinf(self.lo) else self.lo
+        return self.lo + (self.hi - self.lo) / 2
+
+    def contiene(self, x) -> bool: return self.lo <= x <= self.hi
+    def en_interior_de(self, o) -> bool: return o.lo < self.lo and self.hi < o.hi
+
+    def interseccion(self, o):
+        lo, hi = max(self.lo, o.lo), min(self.hi, o.hi)
+        return Intervalo(lo, hi) if lo <= hi else None
+
+    def biseccion(self, fraccion=0.5):
+        m = self.medio if fraccion == 0.5 or math.isinf(self.ancho) else self.lo + fraccion * self.ancho
+        return Intervalo(self.lo, m), Intervalo(m, self.hi)
+
+    # --- Aritmética ---
+    @_binaria
+    def __add__(self, o):
+        o = _como_intervalo(o)
+        return Intervalo(_abajo(self.lo + o.lo), _arriba(self.hi + o.hi))
+    __radd__ = __add__
+
+    @_binaria
+    def __sub__(self, o):
+        o = _como_intervalo(o)
+        return Intervalo(_abajo(self.lo - o.hi), _arriba(self.hi - o.lo))
+
+    @_binaria
+    def __rsub__(self, o): return _como_intervalo(o) - self
+
+    @_binaria
+    def __mul__(self, o):
+        o = _como_intervalo(o)
+        p = (_mul(self.lo, o.lo), _mul(self.lo, o.hi), _mul(self.hi, o.lo), _mul(self.hi, o.hi))
+        return Intervalo(_abajo(min(p)), _arriba(max(p)))
+    __rmul__ = __mul__
+
+    @_binaria
+    def __truediv__(self, o):
+        o = _como_intervalo(o)
+        if o.contiene(0): return Intervalo(-INF, INF) # División extendida: sin información
+        return self * Intervalo(_abajo(1 / o.hi), _arriba(1 / o.lo))
+
+    @_binaria
+    def __rtruediv__(self, o): return _como_intervalo(o) / self
+
+    def __neg__(self): return Intervalo(-self.hi, -self.lo)
+    def __pos__(self): return self
+
+    def __abs__(self):
+        if self.lo >= 0: return self
+        if self.hi <= 0: return -self
+        return Intervalo(0.0, max(-self.lo, self.hi))
+
+    @_binaria
+    def __pow__(self, o):
+        if isinstance(o, int) or (isinstance(o, float) and o.is_integer()):
+            n = int(o)
+            if n == 0: return Intervalo(1.0)
+            if n < 0: return 1 / (self ** -n)
+            return _potencia_entera(self, n)
+        # Exponente real o intervalo: x^y = exp(y·ln x)
+        return (_como_intervalo(o) * self.ln()).exp()
+
+    @_binaria
+    def __rpow__(self, o): return _como_intervalo(o) ** self
+
+    # --- Funciones elementales (duck typing para autodiff) ---
+    def exp(self):
+        return Intervalo(max(0.0, _abajo(_abajo(_exp_seguro(self.lo)))), _arriba(_arriba(_exp_seguro(self.hi))))
+
+    def ln(self):
+        if self.hi <= 0: raise ValueError("ln fuera de dominio")
+        lo = -INF if self.lo <= 0 else _abajo(_abajo(math.log(self.lo)))
+        hi = INF if math.isinf(self.hi) else _arriba(_arriba(math.log(self.hi)))
+        return Intervalo(lo, hi)
+
+    def sqrt(self):
+        if self.hi < 0: raise ValueError("sqrt fuera de dominio")
+        lo = 0.0 if self.lo <= 0 else max(0.0, _abajo(math.sqrt(self.lo)))
+        return Intervalo(lo, _arriba(math.sqrt(self.hi)))
+
+    def sin(self): return _trigonometrica(self, math.sin, math.pi / 2, -math.pi / 2)
+    def cos(self): return _trigonometrica(self, math.cos, 0.0, math.pi)
+
+    def tan(self):
+        # Polos en π/2 + kπ: si el intervalo (ligeramente inflado) contiene uno, no hay cota
+        if self.ancho >= math.pi or _contiene_punto(self, math.pi / 2, math.pi):
+            return Intervalo(-INF, INF)
+        return Intervalo(_abajo(_abajo(math.tan(self.lo))), _arriba(_arriba(math.tan(self.hi))))
+
+    def signo(self):
+        if self.lo > 0: return Intervalo(1.0)
+        if self.hi < 0: return Intervalo(-1.0)
+        return Intervalo(-1.0, 1.0)
+
+def _como_intervalo(x) -> Intervalo:
+    if isinstance(x, Intervalo): return x
+    x = float(x)
+    if x.is_integer(): return Intervalo(x)
+    # Un literal decimal (0.1) no es representable: lo encerramos entre sus vecinos
+    return Intervalo(_abajo(x), _arriba(x))
+
+def _exp_seguro(x: float) -> float:
+    try: return math.exp(x)
+    except OverflowError: return INF
+
+def _potencia_entera(X: Intervalo, n: int) -> Intervalo:
+    def pw(v, hacia):
+        try: r = v ** n
+        except OverflowError: r = math.copysign(INF, v) if n % 2 else INF
+        return hacia(hacia(r)) if not math.isinf(r) else r
+    if n % 2 == 1 or X.lo >= 0:
+        return Intervalo(pw(X.lo, _abajo), pw(X.hi, _arriba))
+    if X.hi <= 0:
+        return Intervalo(pw(X.hi, _abajo), pw(X.lo, _arriba))
+    return Intervalo(0.0, pw(max(-X.lo, X.hi), _arriba))
+
+def _contiene_punto(X: Intervalo, base: float, periodo: float) -> bool:
+    """¿Contiene X algún punto base + k·periodo? (inflado para absorber el error de π)"""
+    holgura = 1e-9 * max(1.0, abs(X.lo), abs(X.hi))
+    k = math.ceil((X.lo - holgura - base) / periodo)
+    return base + k * periodo <= X.hi + holgura
+
+def _trigonometrica(X: Intervalo, f, pos_max: float, pos_min: float) -> Intervalo:
+    """sin/cos: extremos evaluados + máximos (pos_max + 2kπ) y mínimos (pos_min + 2kπ) internos."""
+    if math.isinf(X.lo) or math.isinf(X.hi) or X.ancho >= 2 * math.pi:
+        return Intervalo(-1.0, 1.0)
+    a, b = f(X.lo), f(X.hi)
+    lo, hi = _abajo(_abajo(min(a, b))), _arriba(_arriba(max(a, b)))
+    if _contiene_punto(X, pos_max, 2 * math.pi): hi = 1.0
+    if _contiene_punto(X, pos_min, 2 * math.pi): lo = -1.0
+    return Intervalo(max(-1.0, lo), min(1.0, hi))
+
+FUNCIONES_INTERVALO = {
+    "sin": lambda X: _como_intervalo(X).sin(),
+    "cos": lambda X: _como_intervalo(X).cos(),
+    "tan": lambda X: _como_intervalo(X).tan(),
+    "exp": lambda X: _como_intervalo(X).exp(),
+    "ln": lambda X: _como_intervalo(X).ln(),
+    "sqrt": lambda X: _como_intervalo(X).sqrt(),
+    "cte": _como_intervalo,
+}
+
+# Constantes como intervalos finos que contienen el valor real
+PI = Intervalo(math.pi, _arriba(math.pi))
+E = Intervalo(_abajo(math.e), _arriba(math.e))
+
+def _crear_contexto_intervalo(X):
+    """Análogo de _crear_contexto_seguro: `x` puede ser Intervalo o Dual de intervalos."""
+    ctx = funciones_duales(FUNCIONES_INTERVALO)
+    ctx.update({"x": X, "e": E, "pi": PI})
+    return ctx
+
+def evaluar_intervalo(func_str: str, X: Intervalo) -> Intervalo:
+    """Cota garantizada del rango de f sobre X."""
+    func_py = _preprocesar_expresion(func_str)
+    try:
+        return _como_intervalo(eval(func_py, {"__builtins__": None}, _crear_contexto_intervalo(X)))
+    except ValueError: raise
+    except Exception as e:
+        raise ValueError(f"Error evaluando '{func_str}' en X={X}: {e}")
+
+def _evaluar_con_derivada(func_py: str, X: Intervalo) -> Tuple[Intervalo, Intervalo]:
+    """Devuelve (F(X), F'(X)) en una sola pasada con duales de intervalos."""
+    r = eval(func_py, {"__builtins__": None}, _crear_contexto_intervalo(Dual(X, Intervalo(1.0))))
+    if isinstance(r, Dual): return _como_intervalo(r.v), _como_intervalo(r.d)
+    return _como_intervalo(r), Intervalo(0.0)
+
+# --- AISLAMIENTO CERTIFICADO DE RAÍCES ---
+
+def _operador_krawczyk(func_py, X, dF):
+    y = X.medio
+    fy = _evaluar_con_derivada(func_py, Intervalo(y))[0]
+    m = dF.medio
+    if m == 0 or not math.isfinite(m): return None
+    Y = 1 / m
+    return y - Y * fy + (1 - Y * dF) * (X - y)
+
+def _operador_newton(func_py, X, dF):
+    if dF.contiene(0): return None
+    y = X.medio
+    fy = _evaluar_con_derivada(func_py, Intervalo(y))[0]
+    return y - fy / dF
+
+def aislar_raices(func_str: str, a: float, b: float, tol=1e-10, max_cajas=20000, metodo="krawczyk"):
+    """
+    Ramificación y poda con el operador de Krawczyk (o Newton intervalar).
+    Devuelve (raices, estadisticas). Cada raíz es {'a','b','unica'}:
+      unica=True  -> existencia y unicidad demostradas en [a, b]
+      unica=False -> no se pudo descartar ni certificar (raíz múltiple, tol, límite de cajas)
+    Todo punto de [a, b] donde f se anula está dentro de alguna caja devuelta.
+    """
+    if a > b: a, b = b, a
+    func_py = _preprocesar_expresion(func_str)
+    operador = _operador_krawczyk if metodo == "krawczyk" else _operador_newton
+    stats = {'cajas': 0, 'poda_rango': 0, 'poda_operador': 0, 'poda_dominio': 0,
+             'biseccion': 0, 'certificadas': 0, 'sin_certificar': 0, 'prof_max': 0}
+    raices: List[Dict[str, Any]] = []
+    pila = [(Intervalo(a, b), 0)]
+
+    while pila:
+        X, prof = pila.pop()
+        stats['cajas'] += 1
+        stats['prof_max'] = max(stats['prof_max'], prof)
+
+        if stats['cajas'] > max_cajas:
+            # Sin presupuesto: lo pendiente se informa sin certificar (nunca se descarta)
+            for Z, _ in [(X, prof)] + pila:
+                raices.append({'a': Z.lo, 'b': Z.hi, 'unica': False})
+                stats['sin_certificar'] += 1
+            break
+
+        try: FX, dF = _evaluar_con_derivada(func_py, X)
+        except ValueError:
+            stats['poda_dominio'] += 1 # f no está definida en ningún punto de X
+            continue
+        except (ZeroDivisionError, OverflowError):
+            FX, dF = Intervalo(-INF, INF), Intervalo(-INF, INF)
+
+        if not FX.contiene(0):
+            stats['poda_rango'] += 1
+            continue
+
+        try: K = operador(func_py, X, dF)
+        except (ValueError, ZeroDivisionError, OverflowError): K = None
+
+        if K is not None:
+            if K.en_interior_de(X):
+                # Existencia y unicidad: contraemos hasta la tolerancia
+                while K.ancho > tol:
+                    try: _, dK = _evaluar_con_derivada(func_py, K)
+                    except Exception: break
+                    K2 = operador(func_py, K, dK)
+                    if K2 is None: break
+                    K2 = K2.interseccion(K)
+                    if K2 is None or K2.ancho >= K.ancho: break
+                    K = K2
+                raices.append({'a': K.lo, 'b': K.hi, 'unica': True})
+                stats['certificadas'] += 1
+                continue
+            Xn = K.interseccion(X)
+            if Xn is None:
+                stats['poda_operador'] += 1
+                continue
+            if Xn.ancho < 0.5 * X.ancho:
+                pila.append((Xn, prof + 1)) # Contracción útil: reintentar sin bisecar
+                continue
+            X = Xn
+
+        if X.ancho <= tol:
+            raices.append({'a': X.lo, 'b': X.hi, 'unica': False})
+            stats['sin_certificar'] += 1
+            continue
+
+        stats['biseccion'] += 1
+        # Corte ligeramente descentrado: raíces "redondas" (0, 1, π...) no caen en la frontera
+        izq, der = X.biseccion(0.4990234375)
+        pila.append((der, prof + 1))
+        pila.append((izq, prof + 1))
+
+    raices.sort(key=lambda r: r['a'])
+    return _fusionar_contiguas(raices), stats
+
+def _fusionar_contiguas(raices):
+    """Une cajas no certificadas que se tocan (raíces múltiples, polos) en una sola."""
+    res = []
+    for r in raices:
+        if res and not r['unica'] and not res[-1]['unica'] and r['a'] <= res[-1]['b']:
+            res[-1]['b'] = max(res[-1]['b'], r['b'])
+        else: res.append(r)
+    return res
@@ -0,0 +1,273 @@
+import math
+from typing import Dict, List, Optional
+
+from traces import diagnosticar_convergencia, nueva_traza
+
+# Métodos iterativos para Ax = b (A cuadrada) en flotante, pensados para sistemas
+# grandes y dispersos donde la eliminación O(n³) no es viable:
+# - Jacobi: un barrido es un producto A·x vectorizado.
+# - Gauss-Seidel / SOR: en matrices grandes y dispersas las filas se agrupan por
+#   colores (filas del mismo color no se acoplan) y cada color se actualiza de una
+#   vez; en las pequeñas o densas se barre fila a fila en el orden natural, que es
+#   el que se hace a mano.
+# - Gradiente conjugado con precondicionador de Jacobi (A simétrica definida positiva).
+# La matriz se guarda en CSR con NumPy: el costo por iteración es O(no nulos).
+# Cada método registra ('iter', 'residuo', 'error') con residuo = ||b - Ax||/||b||
+# y error = ||x_k - x_(k-1)||∞, como las trazas de numerical_methods.
+
+COLUMNAS = ('iter', 'residuo', 'error')
+LIMITE_DIVERGENCIA = 1e12 # Residuo relativo a partir del cual se declara divergencia
+
+class MatrizDispersa:
+    """A n×n en CSR: `datos` y `columnas` por fila, fila i en inicio[i]:inicio[i+1]."""
+    __slots__ = ("n", "datos", "columnas", "inicio", "filas", "diag")
+
+    def __init__(self, n, filas, columnas, datos):
+        import numpy as np
+        orden = np.lexsort((columnas, filas))
+        filas, columnas, datos = filas[orden], columnas[orden], datos[orden]
+        no_nulo = datos != 0
+        self.n = n
+        self.filas, self.columnas, self.datos = filas[no_nulo], columnas[no_nulo], datos[no_nulo]
+        self.inicio = np.searchsorted(self.filas, np.arange(n + 1))
+        self.diag = np.zeros(n)
+        d = self.filas == self.columnas
+        self.diag[self.filas[d]] = self.datos[d]
+
+    @classmethod
+    def desde(cls, A, n_columnas=None):
+        """
+        Desde un ndarray, una lista de listas o una lista de {columna: valor} por fila.
+        Con filas dispersas, `n_columnas` es el número real de incógnitas: sin él, una
+        fila sin entradas en la última columna no permitiría ver que la matriz no es cuadrada.
+        """
+        import numpy as np
+        if isinstance(A, MatrizDispersa): return A
+        if hasattr(A, "shape") or (len(A) and not isinstance(A[0], dict)):
+            M = np.asarray(A if hasattr(A, "shape") else [[float(v) for v in fila] for fila in A], dtype=np.float64)
+            if M.ndim != 2 or M.shape[0] != M.shape[1]: raise ValueError("Los métodos iterativos necesitan una matriz cuadrada")
+            f, c = np.nonzero(M)
+            return cls(M.shape[0], f, c, M[f, c])
+        n = len(A)
+        if (n_columnas is not None and n_columnas != n) or any(j >= n for fila in A for j in fila):
+            raise ValueError("Los métodos iterativos necesitan una matriz cuadrada")
+        f = np.fromiter((i for i, fila in enumerate(A) for _ in fila), dtype=np.intp)
+        c = np.fromiter((j for fila in A for j in fila), dtype=np.intp)
+        v = np.fromiter((float(x) for fila in A for x in fila.values()), dtype=np.float64)
+        return cls(n, f, c, v)
+
+    @property
+    def no_nulos(self): return int(self.datos.size)
+
+    def __matmul__(self, x):
+        import numpy as np
+        return np.bincount(self.filas, weights=self.datos * x[self.columnas], minlength=self.n)
+
+    def es_simetrica(self, rtol=1e-12) -> bool:
+        import numpy as np
+        t = np.lexsort((self.filas, self.columnas)) # Entradas de Aᵀ en orden de filas
+        return (np.array_equal(self.columnas[t], self.filas) and np.array_equal(self.filas[t], self.columnas)
+                and np.allclose(self.datos[t], self.datos, rtol=rtol, atol=0))
+
+    def colores(self):
+        """
+        Coloreo voraz del grafo de A + Aᵀ: lista de arreglos de filas sin acoplamiento
+        entre sí. Un Gauss-Seidel por colores actualiza cada grupo de una vez.
+        """
+        import numpy as np
+        vecinos = [[] for _ in range(self.n)]
+        for i, j in zip(self.filas.tolist(), self.columnas.tolist()):
+            if i != j: vecinos[i].append(j); vecinos[j].append(i)
+        color = [-1] * self.n
+        for i in range(self.n):
+            usados = {color[j] for j in vecinos[i]}
+            c = 0
+            while c in usados: c += 1
+            color[i] = c
+        color = np.array(color)
+        return [np.flatnonzero(color == c) for c in range(int(color.max()) + 1)] if self.n else []
+
+def dominancia_diagonal(A: MatrizDispersa) -> float:
+    """min_i |a_ii| / Σ_(j≠i) |a_ij|; > 1 si la diagonal es estrictamente dominante por filas."""
+    import numpy as np
+    fuera = np.bincount(A.filas, weights=np.abs(A.datos), minlength=A.n) - np.abs(A.diag)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cocientes = np.where(fuera > 0, np.abs(A.diag) / fuera, np.inf)
+    return float(cocientes.min()) if A.n else math.inf
+
+def _preparar(A, b, x0):
+    import numpy as np
+    A = MatrizDispersa.desde(A)
+    b = np.array([float(v) for v in b], dtype=np.float64)
+    if b.size != A.n: raise ValueError(f"b tiene {b.size} valores y A {A.n} filas")
+    x = np.zeros(A.n) if x0 is None else np.array([float(v) for v in x0], dtype=np.float64)
+    nb = float(np.linalg.norm(b)) or 1.0
+    return A, b, x, nb
+
+def _exigir_diagonal(A):
+    import numpy as np
+    nulos = np.flatnonzero(A.diag == 0)
+    if nulos.size: raise ValueError(f"Elemento diagonal nulo en la fila {nulos[0] + 1}: reordene las ecuaciones")
+
+def _registrar(reg, k, residuo, error) -> bool:
+    """Agrega la fila; True si hay que parar por divergencia."""
+    if not math.isfinite(residuo) or residuo > LIMITE_DIVERGENCIA:
+        reg.agregar(k, None, "Diverge")
+        return True
+    reg.agregar(k, residuo, error)
+    return False
+
+def jacobi(A, b, x0=None, tol=1e-10, max_iter=1000, traza=True):
+    """x_(k+1) = x_k + D⁻¹(b - A·x_k). Devuelve (x, reg)."""
+    import numpy as np
+    A, b, x, nb = _preparar(A, b, x0)
+    _exigir_diagonal(A)
+    reg = nueva_traza(traza, COLUMNAS)
+    r = b - A @ x
+    for k in range(1, max_iter + 1):
+        dx = r / A.diag
+        x = x + dx
+        r = b - A @ x
+        residuo = float(np.linalg.norm(r)) / nb
+        if _registrar(reg, k, residuo, float(np.abs(dx).max(initial=0.0))) or residuo <= tol: break
+    return x.tolist(), reg
+
+def _barrido_natural(A, b, x, omega):
+    """Una pasada de SOR fila a fila (orden natural)."""
+    datos, columnas, inicio, d = A.datos, A.columnas, A.inicio, A.diag
+    for i in range(A.n):
+        a, z = inicio[i], inicio[i + 1]
+        x[i] += omega * (b[i] - datos[a:z] @ x[columnas[a:z]]) / d[i]
+
+def _bloques_color(A, colores):
+    """Por color: (filas, columnas, datos, fila local) para el producto restringido."""
+    import numpy as np
+    bloques = []
+    for idx in colores:
+        local = np.full(A.n, -1); local[idx] = np.arange(idx.size)
+        sel = local[A.filas] >= 0
+        bloques.append((idx, A.columnas[sel], A.datos[sel], local[A.filas[sel]]))
+    return bloques
+
+def sor(A, b, omega=1.0, x0=None, tol=1e-10, max_iter=1000, traza=True, orden=None):
+    """
+    Sobrerrelajación sucesiva (omega = 1: Gauss-Seidel). orden: "natural", "colores"
+    o None (colores en sistemas grandes y dispersos si salen pocos). Devuelve (x, reg).
+    """
+    import numpy as np
+    if not 0 < omega < 2: raise ValueError("SOR converge solo con 0 < ω < 2")
+    A, b, x, nb = _preparar(A, b, x0)
+    _exigir_diagonal(A)
+    reg = nueva_traza(traza, COLUMNAS)
+    bloques = None
+    if orden == "colores" or (orden is None and A.n >= 200 and A.no_nulos <= 32 * A.n):
+        colores = A.colores()
+        if orden == "colores" or len(colores) <= A.n // 10: bloques = _bloques_color(A, colores)
+    for k in range(1, max_iter + 1):
+        previo = x.copy()
+        if bloques is None: _barrido_natural(A, b, x, omega)
+        else:
+            for idx, cols, datos, local in bloques:
+                s = np.bincount(local, weights=datos * x[cols], minlength=idx.size)
+                x[idx] += omega * (b[idx] - s) / A.diag[idx]
+        residuo = float(np.linalg.norm(b - A @ x)) / nb
+        if _registrar(reg, k, residuo, float(np.abs(x - previo).max(initial=0.0))) or residuo <= tol: break
+    return x.tolist(), reg
+
+def gauss_seidel(A, b, x0=None, tol=1e-10, max_iter=1000, traza=True, orden=None):
+    return sor(A, b, 1.0, x0, tol, max_iter, traza, orden)
+
+def gradiente_conjugado(A, b, x0=None, tol=1e-10, max_iter=None, traza=True):
+    """
+    Gradiente conjugado precondicionado con la diagonal (Jacobi). A debe ser simétrica
+    definida positiva; en aritmética exacta termina en a lo sumo n pasos.
+    """
+    import numpy as np
+    A, b, x, nb = _preparar(A, b, x0)
+    if not A.es_simetrica(): raise ValueError("El gradiente conjugado requiere una matriz simétrica")
+    if (A.diag <= 0).any(): raise ValueError("Matriz no definida positiva (diagonal no positiva)")
+    reg = nueva_traza(traza, COLUMNAS)
+    max_iter = max_iter or 10 * A.n
+    r = b - A @ x
+    z = r / A.diag
+    p, rz = z.copy(), float(r @ z)
+    for k in range(1, max_iter + 1):
+        Ap = A @ p
+        pAp = float(p @ Ap)
+        if pAp <= 0:
+            reg.agregar(k, None, "Matriz no definida positiva")
+            break
+        alfa = rz / pAp
+        x += alfa * p
+        # Cada 50 pasos, residuo verdadero: evita la deriva del residuo recursivo
+        r = b - A @ x if k % 50 == 0 else r - alfa * Ap
+        residuo = float(np.linalg.norm(r)) / nb
+        if _registrar(reg, k, residuo, abs(alfa) * float(np.abs(p).max(initial=0.0))) or residuo <= tol: break
+        z = r / A.diag
+        rz, rz_previo = float(r @ z), rz
+        p = z + (rz / rz_previo) * p
+    return x.tolist(), reg
+
+METODOS_ITERATIVOS = {
+    "Jacobi": jacobi,
+    "Gauss-Seidel": gauss_seidel,
+    "SOR": sor,
+    "Gradiente conjugado": gradiente_conjugado,
+}
+
+def diagnosticar_iterativo(reg, tol=None, ventana=5) -> Dict:
+    """
+    Sobre la traza del residuo: factor de reducción asintótico ρ por iteración (media
+    geométrica de la última ventana), dígitos ganados por iteración, iteraciones
+    estimadas hasta `tol` y, con el factor de Jacobi o Gauss-Seidel, el ω óptimo de
+    SOR que predice la teoría de Young (matrices consistentemente ordenadas).
+    """
+    diag = diagnosticar_convergencia(reg, "residuo", ventana)
+    residuos = [r for r in reg.columna("residuo") if math.isfinite(r) and r > 0] if len(reg) else []
+    diag.update(factor=None, digitos=None, restantes=None, diverge=False)
+    if len(residuos) >= 2:
+        m = min(ventana, len(residuos) - 1)
+        factor = (residuos[-1] / residuos[-1 - m]) ** (1 / m)
+        diag['factor'] = factor
+        diag['diverge'] = factor > 1 and residuos[-1] > residuos[0]
+        if 0 < factor < 1:
+            diag['digitos'] = -math.log10(factor)
+            if tol and residuos[-1] > tol: diag['restantes'] = math.ceil(math.log(tol / residuos[-1]) / math.log(factor))
+    return diag
+
+def omega_optimo(factor, metodo) -> Optional[float]:
+    """ω de Young a partir del factor observado de Jacobi (ρ_J) o de Gauss-Seidel (ρ_GS = ρ_J²)."""
+    rho2 = factor * factor if metodo == "Jacobi" else factor
+    if not 0 <= rho2 < 1: return None
+    return 2 / (1 + math.sqrt(1 - rho2))
+
+def informe_iterativo(metodo, A, reg, tol, omega=None) -> List[str]:
+    """Pasos para el visor: datos de A, criterio a priori, tabla de iteraciones y diagnóstico."""
+    A = MatrizDispersa.desde(A)
+    dom = dominancia_diagonal(A)
+    lineas = [f"Método: {metodo}{f' (ω = {omega:g})' if metodo == 'SOR' else ''} · n = {A.n} · no nulos: {A.no_nulos}",
+              "Diagonal estrictamente dominante: sí (Jacobi y Gauss-Seidel convergen)" if dom > 1
+              else f"Diagonal estrictamente dominante: no (min |aᵢᵢ| / Σ|aᵢⱼ| = {dom:.3g}); la convergencia no está garantizada"]
+    if metodo == "Gradiente conjugado": lineas.append("Precondicionador: diagonal de A (Jacobi)")
+    tabla = [f"{'iter':>6}  {'||b-Ax||/||b||':>16}  {'||Δx||∞':>12}"]
+    for fila in reg:
+        res = fila.get('residuo'); err = fila.get('error')
+        tabla.append(f"{fila['iter']:>6}  {res if isinstance(res, str) else format(res, '16.6e') if res is not None else '':>16}"
+                     f"  {err if isinstance(err, str) else format(err, '12.4e') if err is not None else '':>12}")
+    lineas.append("\n".join(tabla))
+    d = diagnosticar_iterativo(reg, tol)
+    res_final = next((r for r in reversed(reg.columna("residuo")) if math.isfinite(r)), None) if len(reg) else None
+    conv = res_final is not None and res_final <= tol
+    diag = [f"{'Convergió' if conv else 'No convergió'} en {d['iteraciones']} iteraciones"
+            + (f" (residuo {res_final:.3e}, tolerancia {tol:g})" if res_final is not None else "")]
+    if d['factor'] is not None:
+        diag.append(f"Factor de reducción asintótico ρ ≈ {d['factor']:.4f} por iteración"
+                    + (f" · {d['digitos']:.2f} dígitos por iteración" if d['digitos'] else ""))
+    if d['diverge']: diag.append("El residuo crece: el método diverge para esta matriz")
+    elif d['estancado']: diag.append("Estancado: el residuo dejó de bajar")
+    if d['restantes'] and not conv: diag.append(f"Iteraciones estimadas hasta la tolerancia: {d['restantes']}")
+    if metodo in ("Jacobi", "Gauss-Seidel") and d['factor'] is not None and not d['diverge']:
+        w = omega_optimo(d['factor'], metodo)
+        if w: diag.append(f"ω óptimo estimado para SOR: {w:.4f}")
+    lineas.append("\n".join(diag))
+    return lineas
@@ -0,0 +1,110 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class TareaCancelada(Exception):
+    """Se lanza dentro del cálculo cuando el usuario lo detiene."""
+
+class _Tarea:
+    __slots__ = ("id", "clave", "funcion", "al_terminar", "al_error", "al_progreso", "cancelada")
+
+    def __init__(self, id, clave, funcion, al_terminar, al_error, al_progreso):
+        self.id, self.clave, self.funcion = id, clave, funcion
+        self.al_terminar, self.al_error, self.al_progreso = al_terminar, al_error, al_progreso
+        self.cancelada = threading.Event()
+
+class EjecutorTareas:
+    """
+    Ejecuta llamadas a los solvers fuera del hilo de Tk.
+    - funcion(progreso) corre en un hilo del pool; `progreso(dato)` publica un avance
+      y lanza TareaCancelada si se pidió detenerla (cancelación cooperativa).
+    - Los resultados y avances vuelven al hilo de la UI por sondeo con after().
+    - Coalescencia por clave: si llega otra petición con la misma clave, la que está
+      corriendo se cancela y la que espera se reemplaza (solo corre la última).
+    Los widgets solo se tocan desde los callbacks, nunca desde el hilo de trabajo.
+    """
+    def __init__(self, widget, intervalo_ms=40, hilos=1):
+        self.widget = widget
+        self.intervalo_ms = intervalo_ms
+        self.pool = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="calculo")
+        self.eventos = queue.Queue()
+        self._lock = threading.Lock()
+        self._pendientes = {} # clave -> _Tarea aún sin empezar
+        self._activas = {}    # id -> _Tarea en ejecución
+        self._seq = 0
+        self._sondeo = None
+        widget.bind("<Destroy>", self._al_destruir, add="+")
+
+    def enviar(self, clave, funcion, al_terminar=None, al_error=None, al_progreso=None):
+        with self._lock:
+            self._seq += 1
+            t = _Tarea(self._seq, clave, funcion, al_terminar, al_error, al_progreso)
+            for activa in self._activas.values():
+                if activa.clave == clave: activa.cancelada.set()
+            ya_encolada = clave in self._pendientes
+            self._pendientes[clave] = t
+            if not ya_encolada: self.pool.submit(self._trabajar, clave)
+        self._programar_sondeo()
+        return t.id
+
+    def cancelar(self, clave=None):
+        with self._lock:
+            for k in [k for k in self._pendientes if clave is None or k == clave]:
+                del self._pendientes[k]
+            for t in self._activas.values():
+                if clave is None or t.clave == clave: t.cancelada.set()
+
+    def ocupado(self, clave=None) -> bool:
+        with self._lock:
+            return any(clave is None or t.clave == clave for t in list(self._activas.values()) + list(self._pendientes.values()))
+
+    def cerrar(self):
+        self.cancelar()
+        self.pool.shutdown(wait=False)
+
+    # --- Hilo de trabajo ---
+    def _trabajar(self, clave):
+        with self._lock:
+            t = self._pendientes.pop(clave, None)
+            if t is None: return # Cancelada antes de empezar
+            self._activas[t.id] = t
+
+        def progreso(dato=None):
+            if t.cancelada.is_set(): raise TareaCancelada()
+            if t.al_progreso is not None: self.eventos.put(("progreso", t, dato))
+
+        try:
+            res = t.funcion(progreso)
+            self.eventos.put(("ok", t, res))
+        except TareaCancelada:
+            self.eventos.put(("cancelada", t, None))
+        except Exception as e:
+            self.eventos.put(("error", t, e))
+        finally:
+            with self._lock: self._activas.pop(t.id, None)
+
+    # --- Hilo de la UI ---
+    def _programar_sondeo(self):
+        if self._sondeo is None:
+            try: self._sondeo = self.widget.after(self.intervalo_ms, self._sondear)
+            except Exception: self._sondeo = None # Widget destruido
+
+    def _sondear(self):
+        self._sondeo = None
+        avances = {}
+        while True:
+            try: tipo, t, dato = self.eventos.get_nowait()
+            except queue.Empty: break
+            if tipo == "progreso":
+                if not t.cancelada.is_set(): avances.setdefault(t.id, (t, []))[1].append(dato)
+                continue
+            avances.pop(t.id, None)
+            if t.cancelada.is_set() or tipo == "cancelada": continue # Resultado obsoleto
+            if tipo == "ok" and t.al_terminar is not None: t.al_terminar(dato)
+            elif tipo == "error" and t.al_error is not None: t.al_error(dato)
+        # Un solo callback por tarea y por tick, con todos los avances acumulados
+        for t, datos in avances.values(): t.al_progreso(datos)
+        if self.ocupado() or not self.eventos.empty(): self._programar_sondeo()
+
+    def _al_destruir(self, e):
+        if e.widget is self.widget: self.cerrar()
@@ -0,0 +1,130 @@
+import math
+from fractions import Fraction
+from typing import NamedTuple, Optional
+
+from matrix_ops import Matriz, a_filas, fmt_paso, fmt_val, rref
+
+# Mínimos cuadrados para sistemas con más ecuaciones que incógnitas (o de rango
+# incompleto): x minimiza ||b - A·x||.
+# - Flotante: QR de Householder con pivoteo de columnas en NumPy. Cada reflector se
+#   aplica a todo el bloque restante con una operación vectorial, así que el bucle de
+#   Python es de n vueltas aunque A tenga 10⁵ filas.
+# - Exacto: ecuaciones normales AᵀA·x = Aᵀb acumuladas en enteros (filas con
+#   denominador común) y resueltas con rref de matrix_ops.
+# Con rango incompleto ambos dan la solución básica: variables libres en 0.
+
+LIMITE_EXACTO = 200_000 # Entradas (m·n) hasta las que se usa la vía exacta por defecto
+
+class SolucionMC(NamedTuple):
+    x: list
+    residuo: float # ||b - A·x||
+    rango: int
+    metodo: str
+    residuo2: Optional[Fraction] = None # ||b - A·x||² exacto (vía exacta)
+
+# --- Vía flotante ---
+
+def minimos_cuadrados_qr(A, b, progreso=None):
+    """QR de Householder con pivoteo de columnas. A puede ser lista de listas o ndarray."""
+    import numpy as np # Diferido: la vista de Gauss no necesita NumPy para sistemas cuadrados
+    R = np.array(A, dtype=np.float64)
+    if R.ndim != 2: raise ValueError("A debe ser una matriz")
+    y = np.array(b, dtype=np.float64).reshape(-1)
+    m, n = R.shape
+    if y.size != m: raise ValueError(f"b tiene {y.size} valores y A {m} filas")
+    perm = np.arange(n)
+    tol, rango = None, 0
+    for k in range(min(m, n)):
+        # Pivote: la columna restante de mayor norma (revela el rango)
+        normas = np.einsum("ij,ij->j", R[k:, k:], R[k:, k:])
+        p = k + int(np.argmax(normas))
+        if p != k:
+            R[:, [k, p]] = R[:, [p, k]]
+            perm[[k, p]] = perm[[p, k]]
+        alfa = math.sqrt(normas[p - k])
+        if tol is None: tol = max(m, n) * np.finfo(np.float64).eps * alfa
+        if alfa <= tol: break
+        v = R[k:, k].copy()
+        v[0] += math.copysign(alfa, v[0])
+        v /= np.linalg.norm(v)
+        R[k:, k:] -= 2.0 * np.outer(v, v @ R[k:, k:])
+        y[k:] -= 2.0 * v * (v @ y[k:])
+        rango += 1
+        if progreso: progreso(f"Reflector {k + 1} de {min(m, n)}")
+    x = np.zeros(n)
+    if rango:
+        z = np.zeros(rango)
+        for i in range(rango - 1, -1, -1): # Sustitución hacia atrás en R[:r, :r]
+            z[i] = (y[i] - R[i, i + 1:rango] @ z[i + 1:]) / R[i, i]
+        x[perm[:rango]] = z
+    residuo = float(np.linalg.norm(y[rango:]))
+    pasos = [f"QR de Householder con pivoteo de columnas ({m}×{n}, flotante)",
+             f"Orden de columnas: {', '.join(f'x{j + 1}' for j in perm)}",
+             f"Diagonal de R: {', '.join(f'{R[i, i]:.6g}' for i in range(min(rango, 12)))}{' …' if rango > 12 else ''}",
+             f"Rango numérico: {rango} (tolerancia {tol:.3g})" if tol is not None else "Rango numérico: 0",
+             f"||b - Ax|| = {residuo:.10g}"]
+    return SolucionMC(x.tolist(), residuo, rango, "qr"), pasos
+
+# --- Vía exacta ---
+
+def _normales(A, b):
+    """
+    [AᵀA | Aᵀb] exacta. Cada fila se pasa a enteros sobre su denominador d y se acumula
+    en un bloque entero por d²; solo al final se divide: una Fraction por entrada.
+    """
+    n = len(A[0])
+    bloques = {}
+    for f in a_filas([list(fila) + [bi] for fila, bi in zip(A, b)]):
+        a, d2 = f.nums, f.den * f.den
+        S = bloques.get(d2)
+        if S is None: S = bloques[d2] = [[0] * (n + 1) for _ in range(n)]
+        for j in range(n):
+            aj = a[j]
+            if aj: S[j] = [s + aj * ak for s, ak in zip(S[j], a)]
+    G = [[Fraction(0)] * (n + 1) for _ in range(n)]
+    for d2, S in bloques.items():
+        for j in range(n): G[j] = [g + Fraction(s, d2) for g, s in zip(G[j], S[j])]
+    return G
+
+def _residuo2(A, b, x) -> Fraction:
+    """||b - A·x||² exacto, con x sobre un denominador común y acumulando en enteros."""
+    D = math.lcm(*(v.denominator for v in x)) if x else 1
+    X = [v.numerator * (D // v.denominator) for v in x]
+    total = {}
+    for f in a_filas([list(fila) + [bi] for fila, bi in zip(A, b)]):
+        r = f.nums[-1] * D - sum(a * xj for a, xj in zip(f.nums, X) if a and xj)
+        if r: total[f.den] = total.get(f.den, 0) + r * r
+    return sum((Fraction(s, d * d * D * D) for d, s in total.items()), Fraction(0))
+
+def minimos_cuadrados_exacto(A: Matriz, b, progreso=None):
+    """Ecuaciones normales en aritmética exacta. Devuelve (SolucionMC, pasos)."""
+    m, n = len(A), len(A[0])
+    if len(b) != m: raise ValueError(f"b tiene {len(b)} valores y A {m} filas")
+    G = _normales(A, b)
+    pasos = [f"Ecuaciones normales AᵀA·x = Aᵀb ({m} ecuaciones, {n} incógnitas):\n{fmt_paso(G)}\n"]
+    R, p = rref(G, progreso)
+    pasos += p
+    x, rango = [Fraction(0)] * n, 0
+    for fila in R:
+        j = next((j for j in range(n) if fila[j] != 0), None)
+        if j is None: continue
+        x[j] = fila[-1]; rango += 1 # Pivote en la columna j; las libres quedan en 0
+    if rango < n: pasos.append(f"Rango {rango} < {n}: variables libres en 0 (solución básica)")
+    r2 = _residuo2(A, b, x)
+    pasos.append(f"||b - Ax||² = {fmt_val(r2)}  (||b - Ax|| ≈ {math.sqrt(r2):.10g})")
+    return SolucionMC(x, math.sqrt(r2), rango, "normales", r2), pasos
+
+def resolver_minimos_cuadrados(A, b, exacto=None, progreso=None):
+    """
+    (SolucionMC, pasos). exacto=None elige: exacta para listas de hasta LIMITE_EXACTO
+    entradas, QR flotante para arreglos de NumPy o sistemas mayores.
+    """
+    es_arreglo = hasattr(A, "shape")
+    m = A.shape[0] if es_arreglo else len(A)
+    if m == 0: raise ValueError("Sistema vacío")
+    n = A.shape[1] if es_arreglo else len(A[0])
+    if exacto is None: exacto = not es_arreglo and m * n <= LIMITE_EXACTO
+    if exacto:
+        if es_arreglo: A, b = [[Fraction(repr(float(v))) for v in fila] for fila in A.tolist()], [Fraction(repr(float(v))) for v in b]
+        return minimos_cuadrados_exacto(A, b, progreso)
+    return minimos_cuadrados_qr(A, b, progreso)
@@ -0,0 +1,415 @@
+import re
+from collections import OrderedDict
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple
+
+from matrix_ops import (
+    Matriz, fmt_val, sumar_matrices_dos, restar_matrices_dos, multiplicar_matrices,
+    transpuesta, determinante, matriz_inversa, rango_matriz, ident
+)
+
+# Expresiones de matrices: "inv(A)*B*A + 2*T(B)", "A^3 - det(A)*A'", "C = A*B".
+#   +  -  *  /(solo por escalar)  ^k (k entero)  '  inv()  T()/trans()  det()  rango()/rank()
+# Se compila en dos fases: la gramática da un árbol; el planificador lo convierte en
+# un DAG donde cada subexpresión aparece una sola vez (hash-consing), ordena cada
+# cadena de productos por programación dinámica sobre las formas reales y calcula
+# el coste. Al evaluar, cada nodo se busca antes en una caché entre evaluaciones.
+
+_TOKEN = re.compile(r"\s*(?:(?P<num>\d+(?:\.\d*)?|\.\d+)|(?P<id>[A-Za-z_]\w*)|(?P<op>[-+*/^(),']))")
+_ASIGNACION = re.compile(r"^\s*([A-Za-z_]\w*)\s*=(?!=)(.*)$", re.S)
+
+FUNCIONES = {"inv": "inv", "T": "trans", "trans": "trans", "det": "det", "rango": "rango", "rank": "rango"}
+SIMBOLOS = {"suma": "+", "resta": "-", "mul": "·", "div": "/"}
+
+def separar_asignacion(texto) -> Tuple[Optional[str], str]:
+    """'C = A*B' -> ('C', 'A*B'); sin asignación -> (None, texto)."""
+    m = _ASIGNACION.match(texto)
+    if m and m.group(1) not in FUNCIONES: return m.group(1), m.group(2)
+    return None, texto
+
+# --- Gramática ---
+
+def _tokenizar(texto):
+    toks, pos, texto = [], 0, texto.rstrip()
+    while pos < len(texto):
+        m = _TOKEN.match(texto, pos)
+        if not m or m.end() == pos: raise ValueError(f"Carácter inesperado '{texto[pos:].strip()[:1]}' en la posición {pos + 1}")
+        tipo = m.lastgroup
+        toks.append((tipo, Fraction(m.group(tipo)) if tipo == "num" else m.group(tipo)))
+        pos = m.end()
+    return toks
+
+class _Analizador:
+    """
+    expr     := term (('+' | '-') term)*
+    term     := unario (('*' | '/' | <yuxtaposición>) unario)*
+    unario   := '-' unario | potencia
+    potencia := postfijo ('^' '-'? entero)?
+    postfijo := atomo "'"*
+    atomo    := número | función '(' expr ')' | nombre | '(' expr ')'
+    """
+    def __init__(self, texto):
+        self.toks, self.i = _tokenizar(texto), 0
+        if not self.toks: raise ValueError("Expresión vacía")
+
+    def _ver(self): return self.toks[self.i] if self.i < len(self.toks) else (None, None)
+
+    def _tomar(self, valor=None):
+        tipo, v = self._ver()
+        if valor is not None and v != valor: raise ValueError(f"Se esperaba '{valor}'" + (f" y llegó '{v}'" if v is not None else " al final"))
+        if tipo is None: raise ValueError("La expresión termina antes de tiempo")
+        self.i += 1
+        return tipo, v
+
+    def analizar(self):
+        arbol = self._expr()
+        if self.i < len(self.toks): raise ValueError(f"Sobra '{self.toks[self.i][1]}'")
+        return arbol
+
+    def _expr(self):
+        a = self._term()
+        while self._ver()[1] in ("+", "-"):
+            op = self._tomar()[1]
+            a = (op, a, self._term())
+        return a
+
+    def _term(self):
+        a = self._unario()
+        while True:
+            tipo, v = self._ver()
+            if v in ("*", "/"): self._tomar(); a = (v, a, self._unario())
+            elif tipo in ("num", "id") or v == "(": a = ("*", a, self._unario()) # 2A, A(B+C)
+            else: return a
+
+    def _unario(self):
+        if self._ver()[1] == "-": self._tomar(); return ("neg", self._unario())
+        return self._potencia()
+
+    def _potencia(self):
+        a = self._postfijo()
+        if self._ver()[1] != "^": return a
+        self._tomar()
+        signo = -1 if self._ver()[1] == "-" and self._tomar() else 1
+        tipo, k = self._tomar()
+        if tipo != "num" or k.denominator != 1: raise ValueError("El exponente debe ser un entero")
+        return ("^", a, signo * int(k))
+
+    def _postfijo(self):
+        a = self._atomo()
+        while self._ver()[1] == "'": self._tomar(); a = ("trans", a)
+        return a
+
+    def _atomo(self):
+        tipo, v = self._tomar()
+        if tipo == "num": return ("num", v)
+        if v == "(":
+            a = self._expr(); self._tomar(")")
+            return a
+        if tipo == "id":
+            if v in FUNCIONES and self._ver()[1] == "(":
+                self._tomar("("); a = self._expr(); self._tomar(")")
+                return (FUNCIONES[v], a)
+            return ("mat", v)
+        raise ValueError(f"No se esperaba '{v}'")
+
+def analizar(texto): return _Analizador(texto).analizar()
+
+# --- Planificación: DAG, formas y costes ---
+
+def _txt_forma(f): return "escalar" if f is None else f"{f[0]}×{f[1]}"
+
+class Nodo:
+    __slots__ = ("id", "op", "hijos", "dato", "forma", "costo", "usos")
+
+    def __init__(self, id, op, hijos, dato, forma, costo):
+        self.id, self.op, self.hijos, self.dato, self.forma, self.costo = id, op, hijos, dato, forma, costo
+        self.usos = 0
+
+    def etiqueta(self):
+        if self.op == "mat": return self.dato
+        if self.op == "num": return fmt_val(self.dato)
+        return f"t{self.id}"
+
+def orden_cadena(dims) -> Tuple[int, list]:
+    """
+    Parentización óptima de M1·M2·…·Mk con Mi de dims[i-1]×dims[i] (DP clásica, O(k³)).
+    Devuelve (multiplicaciones escalares, árbol) con hojas = índice del factor.
+    """
+    k = len(dims) - 1
+    costo = [[0] * k for _ in range(k)]
+    corte = [[0] * k for _ in range(k)]
+    for largo in range(2, k + 1):
+        for i in range(k - largo + 1):
+            j = i + largo - 1
+            costo[i][j] = None
+            for s in range(i, j):
+                c = costo[i][s] + costo[s + 1][j] + dims[i] * dims[s + 1] * dims[j + 1]
+                if costo[i][j] is None or c < costo[i][j]: costo[i][j], corte[i][j] = c, s
+    def arbol(i, j): return i if i == j else (arbol(i, corte[i][j]), arbol(corte[i][j] + 1, j))
+    return costo[0][k - 1], arbol(0, k - 1)
+
+class Plan:
+    """DAG de una expresión para unas formas dadas (nombre -> (filas, cols))."""
+    def __init__(self, formas: Dict[str, Tuple[int, int]]):
+        self.formas = formas
+        self.nodos: Dict[tuple, Nodo] = {} # (op, ids de hijos, dato) -> Nodo
+        self.orden: List[Nodo] = [] # Orden de creación: los hijos siempre antes
+        self.cadenas = [] # (texto, coste elegido, coste de izquierda a derecha)
+        self.compartidos = 0 # Subexpresiones que aparecían más de una vez
+        self.raiz = None
+        self._veces: Dict[tuple, int] = {} # Apariciones de cada subárbol '*' en la expresión
+        self._productos = set() # Subárboles '*' ya construidos como nodo
+
+    @classmethod
+    def compilar(cls, texto, formas):
+        plan = cls(formas)
+        arbol = analizar(texto)
+        plan._contar_productos(arbol)
+        plan.raiz = plan._construir(arbol)
+        for n in plan.alcanzables(): n.usos = 0
+        for n in plan.alcanzables():
+            for h in n.hijos: h.usos += 1
+        return plan
+
+    def alcanzables(self) -> List[Nodo]:
+        """Nodos que cuelgan de la raíz, en orden de evaluación (cada uno una vez)."""
+        vistos, salida = set(), []
+        def visitar(n):
+            if n.id in vistos: return
+            vistos.add(n.id)
+            for h in n.hijos: visitar(h)
+            salida.append(n)
+        visitar(self.raiz)
+        return salida
+
+    @property
+    def costo(self): return sum(n.costo for n in self.alcanzables())
+
+    def _nodo(self, op, hijos=(), dato=None):
+        if op == "suma": hijos = tuple(sorted(hijos, key=lambda h: h.id)) # A+B y B+A son el mismo nodo
+        clave = (op, tuple(h.id for h in hijos), dato)
+        n = self.nodos.get(clave)
+        if n is not None:
+            if op not in ("mat", "num"): self.compartidos += 1
+            return n
+        forma, costo = self._forma(op, hijos, dato)
+        n = Nodo(len(self.orden) + 1, op, tuple(hijos), dato, forma, costo)
+        self.nodos[clave] = n; self.orden.append(n)
+        return n
+
+    def _forma(self, op, hijos, dato):
+        """(forma, coste en multiplicaciones escalares) o ValueError si no es válida."""
+        fs = [h.forma for h in hijos]
+        if op == "mat":
+            if dato not in self.formas: raise ValueError(f"Matriz '{dato}' no definida")
+            return self.formas[dato], 0
+        if op == "num": return None, 0
+        if op in ("suma", "resta"):
+            if fs[0] != fs[1]: raise ValueError(f"No se pueden {'sumar' if op == 'suma' else 'restar'} {_txt_forma(fs[0])} y {_txt_forma(fs[1])}")
+            return fs[0], 0
+        if op == "neg": return fs[0], 0
+        if op == "mul":
+            a, b = fs
+            if a is None or b is None:
+                m = a or b # Escalar por matriz (o escalar por escalar)
+                return m, m[0] * m[1] if m else 1
+            if a[1] != b[0]: raise ValueError(f"Producto incompatible: {_txt_forma(a)} · {_txt_forma(b)}")
+            return (a[0], b[1]), a[0] * a[1] * b[1]
+        if op == "div":
+            if fs[1] is not None: raise ValueError("Solo se puede dividir entre un escalar")
+            return fs[0], fs[0][0] * fs[0][1] if fs[0] else 1
+        if op == "trans": return (fs[0][1], fs[0][0]) if fs[0] else None, 0
+        a = fs[0]
+        if op in ("inv", "det", "pot") and a is not None and a[0] != a[1]:
+            raise ValueError(f"{op}() requiere una matriz cuadrada (es {_txt_forma(a)})")
+        if op == "inv": return a, a[0] ** 3 if a else 1
+        if op == "det":
+            if a is None: raise ValueError("det() requiere una matriz")
+            return None, a[0] ** 3 // 3
+        if op == "rango":
+            if a is None: raise ValueError("rango() requiere una matriz")
+            return None, a[0] * a[1] * min(a)
+        if op == "pot":
+            if a is None: return None, 1
+            k = abs(dato)
+            productos = max(0, k.bit_length() - 1 + bin(k).count("1") - 1) # Elevar al cuadrado y multiplicar
+            return a, productos * a[0] ** 3 + (a[0] ** 3 if dato < 0 else 0)
+        raise ValueError(f"Operación desconocida '{op}'")
+
+    def _construir(self, arbol):
+        op = arbol[0]
+        if op == "num": return self._nodo("num", dato=arbol[1])
+        if op == "mat": return self._nodo("mat", dato=arbol[1])
+        if op == "*":
+            self._productos.add(arbol)
+            return self._producto(self._factores(arbol, raiz=True))
+        if op in ("+", "-"): return self._nodo("suma" if op == "+" else "resta", (self._construir(arbol[1]), self._construir(arbol[2])))
+        if op == "/": return self._nodo("div", (self._construir(arbol[1]), self._construir(arbol[2])))
+        if op == "^": return self._nodo("pot", (self._construir(arbol[1]),), arbol[2])
+        return self._nodo(op, (self._construir(arbol[1]),))
+
+    def _contar_productos(self, arbol):
+        if not isinstance(arbol, tuple): return
+        if arbol[0] == "*": self._veces[arbol] = self._veces.get(arbol, 0) + 1
+        for hijo in arbol[1:]: self._contar_productos(hijo)
+
+    def _factores(self, arbol, raiz=False):
+        """
+        Aplana a*(b*c)*d en [a, b, c, d]: los paréntesis no fijan el orden del producto.
+        Un subproducto repetido, (A*B)*(A*B), o ya construido en otra parte de la
+        expresión queda como un solo factor: su nodo se calcula una vez y se reutiliza.
+        """
+        if arbol[0] != "*": return [arbol]
+        if not raiz and (self._veces.get(arbol, 0) > 1 or arbol in self._productos): return [arbol]
+        return self._factores(arbol[1]) + self._factores(arbol[2])
+
+    def _producto(self, factores):
+        nodos = [self._construir(f) for f in factores]
+        escalares = [n for n in nodos if n.forma is None]
+        mats = [n for n in nodos if n.forma is not None]
+        if len(mats) > 1:
+            for a, b in zip(mats, mats[1:]):
+                if a.forma[1] != b.forma[0]: raise ValueError(f"Producto incompatible: {_txt_forma(a.forma)} · {_txt_forma(b.forma)}")
+            dims = [mats[0].forma[0]] + [m.forma[1] for m in mats]
+            costo, arbol = orden_cadena(dims)
+            izq = sum(dims[0] * dims[i] * dims[i + 1] for i in range(1, len(mats)))
+            construir = lambda t: mats[t] if isinstance(t, int) else self._nodo("mul", (construir(t[0]), construir(t[1])))
+            texto = lambda t: mats[t].etiqueta() if isinstance(t, int) else f"({texto(t[0])}·{texto(t[1])})"
+            self.cadenas.append((texto(arbol)[1:-1], costo, izq))
+            resultado = construir(arbol)
+        else: resultado = mats[0] if mats else None
+        # Los escalares conmutan: se multiplican entre sí y luego, una vez, por la matriz
+        coef = None
+        for e in escalares: coef = e if coef is None else self._nodo("mul", (coef, e))
+        if resultado is None: return coef
+        return resultado if coef is None else self._nodo("mul", (coef, resultado))
+
+# --- Evaluación ---
+
+class CacheResultados:
+    """
+    Resultados por estructura de subexpresión y versión de las matrices de entrada.
+    Cambiar una matriz le da otra versión, y sus entradas viejas salen por LRU.
+    """
+    def __init__(self, max_entradas=64, max_celdas=2_000_000):
+        self.datos = OrderedDict()
+        self.celdas = 0
+        self.max_entradas, self.max_celdas = max_entradas, max_celdas
+        self.versiones = {} # nombre -> (matriz, versión)
+        self._ultima = 0
+
+    def version(self, nombre, M):
+        previa = self.versiones.get(nombre)
+        if previa is not None and previa[0] == M: return previa[1]
+        self._ultima += 1
+        self.versiones[nombre] = ([fila[:] for fila in M], self._ultima)
+        return self._ultima
+
+    def obtener(self, clave):
+        v = self.datos.get(clave)
+        if v is not None: self.datos.move_to_end(clave)
+        return v
+
+    def guardar(self, clave, valor):
+        self.datos[clave] = valor
+        self.celdas += _celdas(valor)
+        while len(self.datos) > 1 and (len(self.datos) > self.max_entradas or self.celdas > self.max_celdas):
+            _, viejo = self.datos.popitem(last=False)
+            self.celdas -= _celdas(viejo)
+
+def _celdas(v): return len(v) * len(v[0]) if isinstance(v, list) and v else 1
+
+def _escalar_por(k, M): return [[k * v for v in fila] for fila in M]
+
+def _potencia(M, k, progreso=None):
+    pasos = []
+    if k < 0: M, pasos = matriz_inversa(M, progreso); k = -k
+    R, base = ident(len(M)), M
+    while k:
+        if k & 1: R, _ = multiplicar_matrices(R, base, progreso)
+        k >>= 1
+        if k: base, _ = multiplicar_matrices(base, base, progreso)
+    return R, pasos
+
+def _aplicar(n: Nodo, args, progreso):
+    """Valor de un nodo a partir de los de sus hijos, usando matrix_ops. Devuelve (valor, pasos)."""
+    op = n.op
+    if op in ("suma", "resta"):
+        a, b = args
+        if n.forma is None: return (a + b if op == "suma" else a - b), []
+        return (sumar_matrices_dos if op == "suma" else restar_matrices_dos)(a, b)
+    if op == "neg": return (-args[0] if n.forma is None else _escalar_por(-1, args[0])), []
+    if op == "mul":
+        a, b = args
+        fa, fb = (h.forma for h in n.hijos)
+        if fa is None and fb is None: return a * b, []
+        if fa is None: return _escalar_por(a, b), []
+        if fb is None: return _escalar_por(b, a), []
+        return multiplicar_matrices(a, b, progreso)
+    if op == "div":
+        a, b = args
+        if b == 0: raise ValueError("División por cero")
+        return (a / b if n.forma is None else _escalar_por(1 / b, a)), []
+    a = args[0]
+    if n.hijos[0].forma is None: # Funciones sobre escalares
+        if op == "inv":
+            if a == 0: raise ValueError("División por cero")
+            return 1 / a, []
+        if op == "trans": return a, []
+        if op == "pot":
+            if a == 0 and n.dato < 0: raise ValueError("División por cero")
+            return a ** n.dato, []
+    if op == "trans": return transpuesta(a)
+    if op == "inv": return matriz_inversa(a, progreso)
+    if op == "det": return determinante(a, progreso)
+    if op == "rango":
+        r, pasos = rango_matriz(a, progreso)
+        return Fraction(r), pasos
+    if op == "pot": return _potencia(a, n.dato, progreso)
+    raise ValueError(f"Operación desconocida '{op}'")
+
+def _describir(n: Nodo) -> str:
+    h = [x.etiqueta() for x in n.hijos]
+    if n.op in SIMBOLOS: return f"{h[0]} {SIMBOLOS[n.op]} {h[1]}"
+    if n.op == "neg": return f"-{h[0]}"
+    if n.op == "pot": return f"{h[0]}^{n.dato}"
+    return f"{n.op}({h[0]})"
+
+def evaluar(texto, matrices: Dict[str, Matriz], cache: Optional[CacheResultados] = None, progreso=None):
+    """
+    (valor, pasos): valor es Fraction o matriz; los pasos empiezan con el informe del
+    plan (nodos, forma, coste, caché) y siguen con el procedimiento de cada operación.
+    """
+    formas = {k: (len(M), len(M[0]) if M else 0) for k, M in matrices.items()}
+    plan = Plan.compilar(texto, formas)
+    claves, valores = {}, {}
+    informe, detalle = [], []
+    reutilizados = ahorrado = 0
+    for n in plan.alcanzables():
+        if n.op == "mat":
+            claves[n.id] = ("mat", n.dato, cache.version(n.dato, matrices[n.dato]) if cache else 0)
+            valores[n.id] = matrices[n.dato]
+            continue
+        if n.op == "num":
+            claves[n.id], valores[n.id] = ("num", n.dato), n.dato
+            continue
+        claves[n.id] = (n.op, n.dato) + tuple(claves[h.id] for h in n.hijos)
+        guardado = cache.obtener(claves[n.id]) if cache else None
+        origen = "caché" if guardado is not None else ""
+        if guardado is not None:
+            valores[n.id] = guardado
+            reutilizados += 1; ahorrado += n.costo
+        else:
+            valores[n.id], pasos = _aplicar(n, [valores[h.id] for h in n.hijos], progreso)
+            if cache is not None: cache.guardar(claves[n.id], valores[n.id])
+            if pasos:
+                detalle.append(f"▶ t{n.id} = {_describir(n)}")
+                detalle.extend(pasos)
+        usos = f"  usado {n.usos}×" if n.usos > 1 else ""
+        informe.append(f"t{n.id} = {_describir(n):<22} [{_txt_forma(n.forma)}]  {n.costo:>10,} mult.  {origen}{usos}")
+    resumen = [f"Plan para: {texto.strip()}",
+               f"Nodos: {len(informe)}  ·  subexpresiones compartidas: {plan.compartidos}  ·  de caché: {reutilizados}",
+               f"Coste estimado: {plan.costo:,} multiplicaciones escalares ({plan.costo - ahorrado:,} calculadas)"]
+    for txt, elegido, izq in plan.cadenas:
+        resumen.append(f"Cadena {txt}: {elegido:,} mult. (de izquierda a derecha serían {izq:,})")
+    return valores[plan.raiz.id], ["\n".join(resumen + [""] + informe)] + detalle
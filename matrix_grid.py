@@ -0,0 +1,337 @@
+import tkinter as tk
+from tkinter import ttk
+from fractions import Fraction
+
+from algebraic_fill import leer_matriz
+from matrix_ops import Matriz, fmt_val
+
+# Rejilla virtualizada para MatrixInput: un Canvas que solo dibuja las celdas visibles
+# y un único Entry flotante para editar. Los valores viven ya como Fraction en
+# ModeloMatriz (el mismo formato que usa matrix_ops), así que leer la matriz no
+# vuelve a parsear texto: el parseo ocurre una vez, al confirmar cada edición.
+
+ANCHO_CELDA = 64
+ALTO_CELDA = 22
+ANCHO_CABECERA = 34
+VISIBLES_MAX = 8 # Tamaño pedido al gestor de geometría; si hay más espacio, se usa
+COLOR_SELECCION = "#cfe2ff"
+COLOR_CURSOR = "#0d6efd"
+
+class ModeloMatriz:
+    """Matriz de Fraction editable; al redimensionar se conservan los valores que siguen dentro."""
+    def __init__(self, filas=3, cols=3):
+        self.datos: Matriz = [[Fraction(0)] * cols for _ in range(filas)]
+
+    @property
+    def filas(self): return len(self.datos)
+
+    @property
+    def cols(self): return len(self.datos[0]) if self.datos else 0
+
+    def redimensionar(self, filas, cols):
+        cero = Fraction(0)
+        del self.datos[filas:]
+        for fila in self.datos:
+            if len(fila) > cols: del fila[cols:]
+            else: fila.extend([cero] * (cols - len(fila)))
+        self.datos.extend([cero] * cols for _ in range(filas - len(self.datos)))
+
+    def cargar(self, M):
+        self.datos = [[v if isinstance(v, Fraction) else Fraction(v) for v in fila] for fila in M]
+
+    def llenar(self, valor):
+        """valor(i, j) -> Fraction para cada celda."""
+        self.datos = [[valor(i, j) for j in range(self.cols)] for i in range(self.filas)]
+
+    def pegar(self, i0, j0, M):
+        """Copia el bloque M con esquina en (i0, j0), agrandando la matriz si no cabe."""
+        self.redimensionar(max(self.filas, i0 + len(M)), max(self.cols, j0 + max(map(len, M))))
+        for di, fila in enumerate(M):
+            self.datos[i0 + di][j0:j0 + len(fila)] = fila
+
+    def copia(self) -> Matriz:
+        return [fila[:] for fila in self.datos] # Fraction es inmutable: basta copiar las filas
+
+def parsear_celda(texto) -> Fraction:
+    texto = texto.strip()
+    return Fraction(texto) if texto else Fraction(0)
+
+class RejillaMatriz(tk.Frame):
+    """
+    Navegación: flechas, Tab/Shift+Tab, Enter, Inicio/Fin, RePág/AvPág, Ctrl+Inicio/Fin.
+    Selección de bloque con Shift (teclado o clic) o arrastrando. Escribir o F2 /
+    doble clic edita; Enter o Tab confirman, Escape cancela. Supr pone a 0 la
+    selección; Ctrl+C copia (tabulado) y Ctrl+V pega un bloque en el cursor.
+    """
+    def __init__(self, parent, filas=3, cols=3, al_redimensionar=None):
+        super().__init__(parent, bg="white")
+        self.modelo = ModeloMatriz(filas, cols)
+        self.al_redimensionar = al_redimensionar # Se llama si pegar agranda la matriz
+        self.f0 = self.c0 = 0 # Primera fila / columna visibles
+        self.cursor = (0, 0)
+        self.ancla = (0, 0) # Esquina fija de la selección
+        self.editando = None # (i, j) de la celda abierta en el editor
+
+        self.canvas = tk.Canvas(self, bg="white", highlightthickness=1, highlightcolor=COLOR_CURSOR, takefocus=1)
+        self.sy = ttk.Scrollbar(self, orient="vertical", command=self._scroll_y)
+        self.sx = ttk.Scrollbar(self, orient="horizontal", command=self._scroll_x)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.columnconfigure(0, weight=1); self.rowconfigure(0, weight=1)
+        self.editor = tk.Entry(self.canvas, justify="center", bd=1, relief="solid", bg="white")
+
+        # Reserva de ítems: una ranura por celda visible, se reutilizan al desplazar
+        self.textos = {} # (k, l) -> id de texto
+        self.cab_filas, self.cab_cols = [], []
+        self.n_filas_vis = self.n_cols_vis = 0
+
+        c = self.canvas
+        c.bind("<Configure>", lambda e: self._preparar_ranuras())
+        c.bind("<Button-1>", self._clic)
+        c.bind("<B1-Motion>", self._arrastrar)
+        c.bind("<Double-Button-1>", lambda e: self._abrir_editor())
+        c.bind("<MouseWheel>", lambda e: self._rueda(-1 if e.delta > 0 else 1, e.state & 1))
+        c.bind("<Button-4>", lambda e: self._rueda(-1, e.state & 1))
+        c.bind("<Button-5>", lambda e: self._rueda(1, e.state & 1))
+        c.bind("<Key>", self._tecla)
+        self.editor.bind("<Return>", lambda e: self._confirmar(1, 0))
+        self.editor.bind("<KP_Enter>", lambda e: self._confirmar(1, 0))
+        self.editor.bind("<Tab>", lambda e: self._confirmar(0, 1))
+        self.editor.bind("<Up>", lambda e: self._confirmar(-1, 0))
+        self.editor.bind("<Down>", lambda e: self._confirmar(1, 0))
+        self.editor.bind("<Escape>", lambda e: self._cerrar_editor())
+        self.editor.bind("<FocusOut>", lambda e: self._confirmar(0, 0, al_salir=True))
+        self._ajustar_tamano()
+
+    # --- Datos ---
+
+    def get(self) -> Matriz:
+        self._confirmar(0, 0, al_salir=True) # Lo que se esté escribiendo también cuenta
+        return self.modelo.copia()
+
+    def redimensionar(self, filas, cols):
+        self._cerrar_editor()
+        self.modelo.redimensionar(filas, cols)
+        self.cursor = self.ancla = (min(self.cursor[0], filas - 1), min(self.cursor[1], cols - 1))
+        self._ajustar_tamano()
+        self._preparar_ranuras()
+
+    def cargar(self, M):
+        self._cerrar_editor()
+        self.modelo.cargar(M)
+        self.f0 = self.c0 = 0
+        self.cursor = self.ancla = (0, 0)
+        self._ajustar_tamano()
+        self._preparar_ranuras()
+
+    def llenar(self, valor):
+        self._cerrar_editor()
+        self.modelo.llenar(valor)
+        self._redibujar()
+
+    # --- Geometría ---
+
+    def _ajustar_tamano(self):
+        m = self.modelo
+        self.canvas.config(width=ANCHO_CABECERA + min(m.cols, VISIBLES_MAX) * ANCHO_CELDA,
+                           height=ALTO_CELDA + min(m.filas, VISIBLES_MAX) * ALTO_CELDA)
+
+    def _preparar_ranuras(self):
+        """Crea o quita ranuras según el área visible. Solo ocurre al cambiar de tamaño."""
+        c, m = self.canvas, self.modelo
+        # Antes de mostrarse el canvas mide 1x1: se usa el tamaño pedido
+        ancho = c.winfo_width() if c.winfo_width() > 1 else int(c["width"])
+        alto = c.winfo_height() if c.winfo_height() > 1 else int(c["height"])
+        nf = min(m.filas, max(1, (alto - ALTO_CELDA) // ALTO_CELDA))
+        nc = min(m.cols, max(1, (ancho - ANCHO_CABECERA) // ANCHO_CELDA))
+        if (nf, nc) != (self.n_filas_vis, self.n_cols_vis):
+            c.delete("ranura")
+            self.n_filas_vis, self.n_cols_vis = nf, nc
+            x1, y1 = ANCHO_CABECERA + nc * ANCHO_CELDA, ALTO_CELDA + nf * ALTO_CELDA
+            c.create_rectangle(0, 0, x1, ALTO_CELDA, fill="#f1f3f5", outline="", tags="ranura")
+            c.create_rectangle(0, 0, ANCHO_CABECERA, y1, fill="#f1f3f5", outline="", tags="ranura")
+            c.create_rectangle(0, 0, 0, 0, fill=COLOR_SELECCION, outline="", tags=("ranura", "seleccion"))
+            for k in range(nf + 1):
+                y = ALTO_CELDA + k * ALTO_CELDA
+                c.create_line(0, y, x1, y, fill="#dee2e6", tags="ranura")
+            for l in range(nc + 1):
+                x = ANCHO_CABECERA + l * ANCHO_CELDA
+                c.create_line(x, 0, x, y1, fill="#dee2e6", tags="ranura")
+            self.cab_filas = [c.create_text(ANCHO_CABECERA / 2, ALTO_CELDA * (k + 1.5), fill="#888", font=("Segoe UI", 8), tags="ranura") for k in range(nf)]
+            self.cab_cols = [c.create_text(ANCHO_CABECERA + ANCHO_CELDA * (l + 0.5), ALTO_CELDA / 2, fill="#888", font=("Segoe UI", 8), tags="ranura") for l in range(nc)]
+            self.textos = {(k, l): c.create_text(ANCHO_CABECERA + ANCHO_CELDA * (l + 0.5), ALTO_CELDA * (k + 1.5), font=("Consolas", 9), tags="ranura")
+                           for k in range(nf) for l in range(nc)}
+            c.create_rectangle(0, 0, 0, 0, outline=COLOR_CURSOR, width=2, tags=("ranura", "cursor"))
+        # Mostrar barras solo si hacen falta
+        if m.filas > nf: self.sy.grid(row=0, column=1, sticky="ns")
+        else: self.sy.grid_remove()
+        if m.cols > nc: self.sx.grid(row=1, column=0, sticky="ew")
+        else: self.sx.grid_remove()
+        self._desplazar(self.f0, self.c0)
+
+    def _desplazar(self, f0, c0):
+        m = self.modelo
+        self.f0 = max(0, min(f0, m.filas - self.n_filas_vis))
+        self.c0 = max(0, min(c0, m.cols - self.n_cols_vis))
+        self._redibujar()
+
+    def _redibujar(self):
+        """Reasigna textos a las ranuras: O(celdas visibles), sin crear ítems."""
+        c, datos, f0, c0 = self.canvas, self.modelo.datos, self.f0, self.c0
+        for k, item in enumerate(self.cab_filas): c.itemconfigure(item, text=f0 + k + 1)
+        for l, item in enumerate(self.cab_cols): c.itemconfigure(item, text=c0 + l + 1)
+        max_car = ANCHO_CELDA // 7
+        for (k, l), item in self.textos.items():
+            s = fmt_val(datos[f0 + k][c0 + l])
+            c.itemconfigure(item, text=s if len(s) <= max_car else s[:max_car - 1] + "…")
+        self._dibujar_seleccion()
+        m = self.modelo
+        if m.filas: self.sy.set(f0 / m.filas, (f0 + self.n_filas_vis) / m.filas)
+        if m.cols: self.sx.set(c0 / m.cols, (c0 + self.n_cols_vis) / m.cols)
+        if self.editando: self._colocar_editor()
+
+    def _caja(self, i, j):
+        """Coordenadas en pantalla de la celda (i, j) (pueden caer fuera de la vista)."""
+        x = ANCHO_CABECERA + (j - self.c0) * ANCHO_CELDA
+        y = ALTO_CELDA + (i - self.f0) * ALTO_CELDA
+        return x, y, x + ANCHO_CELDA, y + ALTO_CELDA
+
+    def _dibujar_seleccion(self):
+        (i0, j0), (i1, j1) = self._rango()
+        x0, y0, _, _ = self._caja(i0, j0)
+        _, _, x1, y1 = self._caja(i1, j1)
+        xmax, ymax = ANCHO_CABECERA + self.n_cols_vis * ANCHO_CELDA, ALTO_CELDA + self.n_filas_vis * ALTO_CELDA
+        recorte = lambda x, y: (min(max(x, ANCHO_CABECERA), xmax), min(max(y, ALTO_CELDA), ymax))
+        self.canvas.coords("seleccion", *recorte(x0, y0), *recorte(x1, y1))
+        self.canvas.coords("cursor", *self._caja(*self.cursor))
+        visible = self.f0 <= self.cursor[0] < self.f0 + self.n_filas_vis and self.c0 <= self.cursor[1] < self.c0 + self.n_cols_vis
+        self.canvas.itemconfigure("cursor", state="normal" if visible else "hidden")
+
+    # --- Selección y navegación ---
+
+    def _rango(self):
+        (a, b), (c, d) = self.ancla, self.cursor
+        return (min(a, c), min(b, d)), (max(a, c), max(b, d))
+
+    def _mover(self, i, j, extender=False):
+        m = self.modelo
+        self.cursor = (max(0, min(i, m.filas - 1)), max(0, min(j, m.cols - 1)))
+        if not extender: self.ancla = self.cursor
+        i, j = self.cursor
+        # Desplazar lo justo para que el cursor quede a la vista
+        f0 = min(max(self.f0, i - self.n_filas_vis + 1), i)
+        c0 = min(max(self.c0, j - self.n_cols_vis + 1), j)
+        self._desplazar(f0, c0)
+
+    def _celda_en(self, x, y):
+        i = self.f0 + int((y - ALTO_CELDA) // ALTO_CELDA)
+        j = self.c0 + int((x - ANCHO_CABECERA) // ANCHO_CELDA)
+        return i, j
+
+    def _clic(self, e):
+        self.canvas.focus_set()
+        if e.x < ANCHO_CABECERA or e.y < ALTO_CELDA: return
+        self._mover(*self._celda_en(e.x, e.y), extender=bool(e.state & 1))
+
+    def _arrastrar(self, e):
+        self._mover(*self._celda_en(e.x, e.y), extender=True)
+
+    def _rueda(self, paso, horizontal):
+        if horizontal: self._desplazar(self.f0, self.c0 + paso)
+        else: self._desplazar(self.f0 + 3 * paso, self.c0)
+
+    def _scroll(self, args, pos, total, visibles):
+        if args[0] == "moveto": return int(round(float(args[1]) * total))
+        paso = int(args[1]) * (visibles if args[2] == "pages" else 1)
+        return pos + paso
+
+    def _scroll_y(self, *args): self._desplazar(self._scroll(args, self.f0, self.modelo.filas, self.n_filas_vis), self.c0)
+    def _scroll_x(self, *args): self._desplazar(self.f0, self._scroll(args, self.c0, self.modelo.cols, self.n_cols_vis))
+
+    def _tecla(self, e):
+        i, j = self.cursor
+        shift, ctrl = bool(e.state & 1), bool(e.state & 4)
+        k, m = e.keysym, self.modelo
+        pagina = max(1, self.n_filas_vis - 1)
+        movs = {"Up": (i - 1, j), "Down": (i + 1, j), "Left": (i, j - 1), "Right": (i, j + 1),
+                "Prior": (i - pagina, j), "Next": (i + pagina, j),
+                "Home": (0, 0) if ctrl else (i, 0), "End": (m.filas - 1, m.cols - 1) if ctrl else (i, m.cols - 1)}
+        if k in movs: self._mover(*movs[k], extender=shift)
+        elif k in ("Return", "KP_Enter"): self._mover(i + 1, j)
+        elif k == "ISO_Left_Tab" or (k == "Tab" and shift): self._mover(i, j - 1)
+        elif k == "Tab": self._mover(i, j + 1)
+        elif k == "F2": self._abrir_editor()
+        elif k in ("Delete", "BackSpace"): self._borrar_seleccion()
+        elif ctrl and k.lower() == "c": self._copiar()
+        elif ctrl and k.lower() == "v": self._pegar()
+        elif ctrl and k.lower() == "a":
+            self.ancla, self.cursor = (0, 0), (m.filas - 1, m.cols - 1)
+            self._dibujar_seleccion()
+        elif e.char and e.char.isprintable() and not ctrl: self._abrir_editor(e.char)
+        else: return
+        return "break" # Que Tab no saque el foco de la rejilla
+
+    # --- Edición ---
+
+    def _abrir_editor(self, inicial=None):
+        i, j = self.ancla = self.cursor
+        self._mover(i, j)
+        self.editando = (i, j)
+        self.editor.config(bg="white")
+        self.editor.delete(0, tk.END)
+        self.editor.insert(0, fmt_val(self.modelo.datos[i][j]) if inicial is None else inicial)
+        self._colocar_editor()
+        self.editor.focus_set()
+        self.editor.icursor(tk.END)
+        if inicial is None: self.editor.select_range(0, tk.END)
+
+    def _colocar_editor(self):
+        i, j = self.editando
+        if not (self.f0 <= i < self.f0 + self.n_filas_vis and self.c0 <= j < self.c0 + self.n_cols_vis):
+            self.editor.place_forget(); return
+        x0, y0, x1, y1 = self._caja(i, j)
+        self.editor.place(x=x0, y=y0, width=x1 - x0 + 1, height=y1 - y0 + 1)
+
+    def _confirmar(self, di, dj, al_salir=False):
+        if self.editando is None: return
+        i, j = self.editando
+        try: v = parsear_celda(self.editor.get())
+        except (ValueError, ZeroDivisionError):
+            if al_salir: return self._cerrar_editor() # Al perder el foco se descarta lo inválido
+            self.editor.config(bg="#f8d7da")
+            return "break"
+        self.modelo.datos[i][j] = v
+        self._cerrar_editor()
+        self._mover(i + di, j + dj)
+        return "break"
+
+    def _cerrar_editor(self):
+        if self.editando is None: return
+        self.editando = None
+        self.editor.place_forget()
+        self.canvas.focus_set()
+        self._redibujar()
+        return "break"
+
+    def _borrar_seleccion(self):
+        (i0, j0), (i1, j1) = self._rango()
+        cero = Fraction(0)
+        for fila in self.modelo.datos[i0:i1 + 1]: fila[j0:j1 + 1] = [cero] * (j1 - j0 + 1)
+        self._redibujar()
+
+    def _copiar(self):
+        (i0, j0), (i1, j1) = self._rango()
+        texto = "\n".join("\t".join(fmt_val(v) for v in fila[j0:j1 + 1]) for fila in self.modelo.datos[i0:i1 + 1])
+        self.clipboard_clear(); self.clipboard_append(texto)
+
+    def _pegar(self):
+        try: M = leer_matriz(self.clipboard_get())
+        except (tk.TclError, ValueError): return
+        if not M.filas: return
+        dims = (self.modelo.filas, self.modelo.cols)
+        self.modelo.pegar(*self.cursor, M.a_listas())
+        i, j = self.cursor
+        self.ancla, self.cursor = (i, j), (i + M.filas - 1, j + M.cols - 1)
+        if (self.modelo.filas, self.modelo.cols) != dims:
+            self._ajustar_tamano(); self._preparar_ranuras()
+            if self.al_redimensionar: self.al_redimensionar(self.modelo.filas, self.modelo.cols)
+        else: self._redibujar()
@@ -0,0 +1,181 @@
+import os
+from fractions import Fraction
+from typing import Dict, List, Tuple
+
+from algebraic_fill import leer_matriz, leer_matriz_archivo
+from matrix_ops import Matriz, fmt_val
+
+# Lectura y escritura de matrices en archivo, sin pasar por el texto de los widgets.
+# Formatos por extensión:
+#   .npy / .npz  NumPy (al cargar .npy se proyecta en memoria)
+#   .mtx         Matrix Market, densa ("array") o dispersa ("coordinate")
+#   .csv / .txt  texto; se lee con el lector de una pasada de algebraic_fill
+#   .rat         racional exacto: cabecera "%%MatrizRacional filas columnas" y valores n/d
+
+CABECERA_RAT = "%%MatrizRacional"
+FORMATOS = {".npy": "npy", ".npz": "npz", ".mtx": "mtx", ".csv": "csv", ".txt": "csv", ".rat": "rat"}
+TIPOS_ARCHIVO = [("Todos los soportados", "*.npy *.npz *.mtx *.csv *.txt *.rat"), ("NumPy", "*.npy *.npz"),
+                 ("Matrix Market", "*.mtx"), ("CSV", "*.csv *.txt"), ("Racional exacto", "*.rat")]
+
+def _formato(ruta, formato=None):
+    f = formato or FORMATOS.get(os.path.splitext(str(ruta))[1].lower())
+    if f is None: raise ValueError(f"Formato no reconocido: '{ruta}'")
+    return f
+
+def _a_frac(v):
+    # Enteros exactos; flotantes por su repr más corta (0.1 -> 1/10, no 3602879701896397/36028797018963968)
+    if isinstance(v, (int, Fraction)): return Fraction(v)
+    if hasattr(v, "item"): v = v.item() # Escalares de NumPy
+    return Fraction(v) if isinstance(v, int) else Fraction(repr(float(v)))
+
+# --- NumPy ---
+
+def cargar_npy(ruta, mmap=True):
+    """Arreglo 2-D de un .npy; con mmap=True los datos quedan en disco hasta que se leen."""
+    import numpy as np # Diferido: el resto de la app no necesita NumPy para matrices
+    a = np.load(ruta, mmap_mode="r" if mmap else None, allow_pickle=False)
+    return a.reshape(1, -1) if a.ndim == 1 else a
+
+def cargar_npz(ruta, nombre=None):
+    """Un arreglo de un .npz (el primero si no se indica). Los .npz son zip: no admiten mmap."""
+    import numpy as np
+    with np.load(ruta, allow_pickle=False) as z:
+        if not z.files: raise ValueError("El archivo .npz está vacío.")
+        a = z[nombre or z.files[0]]
+    return a.reshape(1, -1) if a.ndim == 1 else a
+
+_LIMITE_INT64 = 2 ** 63
+
+def _a_numpy(M: Matriz):
+    """int64 si todas las entradas son enteras y caben; si no, float64 (como cualquier fracción)."""
+    import numpy as np
+    if all(v.denominator == 1 and -_LIMITE_INT64 <= v.numerator < _LIMITE_INT64 for fila in M for v in fila):
+        return np.array([[int(v) for v in fila] for fila in M], dtype=np.int64)
+    try: return np.array([[float(v) for v in fila] for fila in M], dtype=np.float64)
+    except OverflowError:
+        raise ValueError("Hay entradas demasiado grandes para NumPy (ni int64 ni float64): guarde en .rat (exacto) o .mtx (exacto si son enteras).")
+
+def guardar_npy(ruta, M: Matriz):
+    import numpy as np
+    np.save(ruta, _a_numpy(M))
+
+def guardar_npz(ruta, M: Matriz, nombre="A"):
+    import numpy as np
+    np.savez_compressed(ruta, **{nombre: _a_numpy(M)})
+
+# --- Matrix Market ---
+
+def leer_mtx_disperso(ruta) -> Tuple[int, int, List[Dict[int, Fraction]]]:
+    """
+    (filas, columnas, [ {columna: valor} por fila ]) sin densificar.
+    Admite campos real / integer / pattern y simetría general / symmetric / skew-symmetric.
+    """
+    with open(ruta, encoding="utf-8") as fh:
+        cab = fh.readline().split()
+        if len(cab) < 5 or cab[0].lower() != "%%matrixmarket" or cab[1].lower() != "matrix":
+            raise ValueError("Cabecera Matrix Market inválida.")
+        organizacion, campo, simetria = cab[2].lower(), cab[3].lower(), cab[4].lower()
+        if campo not in ("real", "integer", "pattern"): raise ValueError(f"Campo '{campo}' no soportado.")
+        linea = fh.readline()
+        while linea.startswith("%") or not linea.strip(): linea = fh.readline()
+        dims = [int(t) for t in linea.split()]
+        n, m = dims[0], dims[1]
+        filas: List[Dict[int, Fraction]] = [{} for _ in range(n)]
+        signo = -1 if simetria == "skew-symmetric" else 1
+        if organizacion == "coordinate":
+            for linea in fh:
+                t = linea.split()
+                if not t or t[0].startswith("%"): continue
+                i, j = int(t[0]) - 1, int(t[1]) - 1
+                v = Fraction(1) if campo == "pattern" else Fraction(t[2])
+                if v: filas[i][j] = v
+                if simetria != "general" and i != j and v: filas[j][i] = signo * v
+        elif organizacion == "array":
+            # Orden por columnas; en simétricas solo viene el triángulo inferior
+            valores = (Fraction(t) for linea in fh if not linea.startswith("%") for t in linea.split())
+            for j in range(m):
+                for i in range(j if simetria != "general" else 0, n):
+                    if simetria == "skew-symmetric" and i == j: continue
+                    v = next(valores)
+                    if v:
+                        filas[i][j] = v
+                        if simetria != "general" and i != j: filas[j][i] = signo * v
+        else: raise ValueError(f"Organización '{organizacion}' no soportada.")
+    return n, m, filas
+
+def guardar_mtx(ruta, M: Matriz, disperso=None):
+    """Coordenadas si la matriz es dispersa (menos de la mitad no nula) o disperso=True; si no, 'array'."""
+    n, m = len(M), len(M[0]) if M else 0
+    no_nulos = [(i, j, v) for i, fila in enumerate(M) for j, v in enumerate(fila) if v]
+    if disperso is None: disperso = len(no_nulos) < n * m / 2
+    enteros = all(v.denominator == 1 for fila in M for v in fila)
+    campo = "integer" if enteros else "real"
+    txt = (lambda v: str(v.numerator)) if enteros else (lambda v: repr(float(v)))
+    with open(ruta, "w", encoding="utf-8", newline="\n") as fh:
+        if disperso:
+            fh.write(f"%%MatrixMarket matrix coordinate {campo} general\n{n} {m} {len(no_nulos)}\n")
+            fh.writelines(f"{i+1} {j+1} {txt(v)}\n" for i, j, v in no_nulos)
+        else:
+            fh.write(f"%%MatrixMarket matrix array {campo} general\n{n} {m}\n")
+            fh.writelines(f"{txt(M[i][j])}\n" for j in range(m) for i in range(n))
+
+# --- Texto ---
+
+def guardar_csv(ruta, M: Matriz):
+    """Valores exactos (enteros o n/d) separados por comas; se relee sin pérdida con cargar_matriz."""
+    with open(ruta, "w", encoding="utf-8", newline="\n") as fh:
+        fh.writelines(",".join(fmt_val(v) for v in fila) + "\n" for fila in M)
+
+def guardar_rat(ruta, M: Matriz):
+    n, m = len(M), len(M[0]) if M else 0
+    with open(ruta, "w", encoding="utf-8", newline="\n") as fh:
+        fh.write(f"{CABECERA_RAT} {n} {m}\n")
+        fh.writelines(" ".join(fmt_val(v) for v in fila) + "\n" for fila in M)
+
+def cargar_rat(ruta) -> Matriz:
+    with open(ruta, encoding="utf-8") as fh:
+        cab = fh.readline().split()
+        if len(cab) != 3 or cab[0] != CABECERA_RAT: raise ValueError("Cabecera de matriz racional inválida.")
+        n, m = int(cab[1]), int(cab[2])
+        L = leer_matriz(fh) # El resto del archivo por bloques
+    if L.filas != n or L.irregulares or (n and L.cols != m):
+        raise ValueError(f"Se esperaba una matriz {n}x{m} y se leyó {L.filas}x{L.cols}.")
+    return L.a_listas()
+
+# --- Entrada única ---
+
+def cargar_matriz(ruta, formato=None) -> Matriz:
+    """Matriz de Fraction (formato de matrix_ops) desde cualquiera de los formatos soportados."""
+    f = _formato(ruta, formato)
+    if f in ("npy", "npz"):
+        a = cargar_npy(ruta) if f == "npy" else cargar_npz(ruta)
+        if a.ndim != 2: raise ValueError(f"Se esperaba un arreglo 2-D (tiene {a.ndim} dimensiones).")
+        return [[_a_frac(v) for v in fila.tolist()] for fila in a] # Fila a fila desde el mmap
+    if f == "mtx":
+        n, m, filas = leer_mtx_disperso(ruta)
+        return [[d.get(j, Fraction(0)) for j in range(m)] for d in filas]
+    if f == "rat": return cargar_rat(ruta)
+    L = leer_matriz_archivo(ruta)
+    if L.irregulares:
+        i, k = L.irregulares[0]
+        raise ValueError(f"Filas de distinta longitud (fila {i+1} tiene {k} de {L.cols} columnas).")
+    return L.a_listas()
+
+def cargar_arreglo(ruta, formato=None):
+    """
+    Arreglo float64 sin pasar por Fraction: para la vía flotante con archivos grandes.
+    Un .npy se proyecta en memoria y solo se copia al convertir a float.
+    """
+    import numpy as np
+    f = _formato(ruta, formato)
+    if f == "npy": return np.asarray(cargar_npy(ruta), dtype=np.float64)
+    if f == "npz": return np.asarray(cargar_npz(ruta), dtype=np.float64)
+    if f == "csv":
+        L = leer_matriz_archivo(ruta)
+        if L.irregulares: raise ValueError("Filas de distinta longitud.")
+        return np.array([float(v) for v in L.datos], dtype=np.float64).reshape(L.filas, L.cols)
+    return np.array([[float(v) for v in fila] for fila in cargar_matriz(ruta, f)], dtype=np.float64)
+
+def guardar_matriz(ruta, M: Matriz, formato=None):
+    f = _formato(ruta, formato)
+    {"npy": guardar_npy, "npz": guardar_npz, "mtx": guardar_mtx, "csv": guardar_csv, "rat": guardar_rat}[f](ruta, M)
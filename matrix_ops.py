@@ -6,6 +6,7 @@ Numero = Fraction
 Matriz = List[List[Numero]]
 
 def _to_frac(v):
+    if isinstance(v, Fraction): return v # Ya viene así de MatrixInput: no volver a parsear
     try: return Fraction(str(v))
     except: return Fraction(0)
 
@@ -36,7 +37,7 @@ def restar_matrices_dos(A, B):
     R = [[A[i][j] - B[i][j] for j in range(len(A[0]))] for i in range(len(A))]
     return R, ["Resta A - B:\n" + fmt_paso(R)]
 
-def multiplicar_matrices(A, B):
+def multiplicar_matrices(A, B, progreso=None):
     if len(A[0])!=len(B): raise ValueError("Incompatibles")
     C = zeros(len(A), len(B[0]))
     pasos = ["Inicio Multiplicación:\n" + fmt_paso(A) + "\n  X\n" + fmt_paso(B) + "\n"]
@@ -45,6 +46,7 @@ def multiplicar_matrices(A, B):
             s = 0
             for k in range(len(A[0])): s += A[i][k]*B[k][j]
             C[i][j] = s
+        if progreso: progreso(f"Fila {i+1} de {len(A)}")
     pasos.append("Matriz Resultante:\n" + fmt_paso(C))
     return C, pasos
 
@@ -52,83 +54,143 @@ def transpuesta(A):
     T = [[A[j][i] for j in range(len(A))] for i in range(len(A[0]))]
     return T, ["Transpuesta:\n" + fmt_paso(T)]
 
+# --- Filas enteras con denominador común ---
+# Cada fila es una lista de enteros sobre un único denominador positivo. Una
+# operación de fila son multiplicaciones y restas de enteros, sin el mcd que
+# Fraction calcula en cada entrada. El contenido común (mcd de la fila) solo se
+# quita cuando el denominador crece más de UMBRAL_BITS desde la última reducción.
+
+UMBRAL_BITS = 128
+
+class FilaEntera:
+    """
+    Fila exacta: valor j = nums[j] / den, con den > 0. `nums` nunca se modifica en
+    sitio (cada operación crea una lista nueva), así que guardar (nums, den) basta
+    para una instantánea.
+    """
+    __slots__ = ("nums", "den", "limite")
+
+    def __init__(self, nums, den=1):
+        self.nums, self.den = nums, den
+        self.limite = den.bit_length() + UMBRAL_BITS
+
+    @classmethod
+    def desde(cls, fila):
+        fila = [_to_frac(v) for v in fila]
+        den = math.lcm(*(v.denominator for v in fila)) if fila else 1
+        return cls([v.numerator * (den // v.denominator) for v in fila], den)
+
+    def __getitem__(self, j): return Fraction(self.nums[j], self.den)
+
+    def fracciones(self) -> List[Fraction]:
+        d = self.den
+        return [Fraction(a, d) for a in self.nums]
+
+    def normalizar(self, c):
+        """Divide la fila por su entrada c (queda en 1): solo cambia el denominador."""
+        p = self.nums[c]
+        if p < 0: self.nums, p = [-a for a in self.nums], -p
+        self.den = p
+        self._reducir(forzar=True) # Una vez por pivote: deja el pivote en 1/1 si es posible
+
+    def eliminar(self, piv: "FilaEntera", c):
+        """self -= (self[c] / piv[c]) * piv, que anula la entrada c."""
+        f, p = self.nums[c], piv.nums[c]
+        if f == 0: return
+        if p < 0: f, p = -f, -p
+        # a/d - (f/d)(b/e)/(p/e) = (a*p - f*b) / (d*p): el denominador de piv se cancela
+        self.nums = [a * p - f * b if b else a * p for a, b in zip(self.nums, piv.nums)]
+        self.den *= p
+        self._reducir()
+
+    def _reducir(self, forzar=False):
+        if not forzar and self.den.bit_length() <= self.limite: return
+        g = math.gcd(self.den, *self.nums)
+        if g > 1:
+            self.nums = [a // g for a in self.nums]
+            self.den //= g
+        self.limite = self.den.bit_length() + UMBRAL_BITS
+
+def a_filas(M) -> List[FilaEntera]: return [FilaEntera.desde(f) for f in M]
+def de_filas(filas) -> Matriz: return [f.fracciones() for f in filas]
+
+class PasoMatriz:
+    """
+    Paso con una matriz: guarda (nums, den) de cada fila y arma el texto al pedirlo
+    con str(). Así la eliminación no formatea (ni reduce a Fraction) cada estado.
+    """
+    __slots__ = ("titulo", "filas", "fin")
+
+    def __init__(self, titulo, filas, fin="\n"):
+        self.titulo, self.fin = titulo, fin
+        self.filas = [(f.nums, f.den) for f in filas]
+
+    def __str__(self):
+        M = [[Fraction(a, d) for a in nums] for nums, d in self.filas]
+        return f"{self.titulo}:\n{fmt_paso(M)}{self.fin}"
+
 # --- GAUSS (REF) y GAUSS-JORDAN (RREF) ---
 
-def ref(A):
-    """Forma Escalonada (Row Echelon Form) - Solo ceros abajo."""
-    M = copy_m(A)
-    rows, cols = len(M), len(M[0])
-    pasos = [f"Matriz Inicial:\n{fmt_paso(M)}\n"]
+def _escalonar(A, reducida, progreso=None):
+    """Eliminación común a ref (reducida=False) y rref (reducida=True) sobre filas enteras."""
+    filas = a_filas(A)
+    rows, cols = len(filas), len(filas[0].nums)
+    pasos = [PasoMatriz("Matriz Inicial", filas)]
     r = 0
     for c in range(cols):
         if r >= rows: break
         pivot = r
-        while pivot < rows and M[pivot][c] == 0: pivot += 1
+        while pivot < rows and filas[pivot].nums[c] == 0: pivot += 1
         if pivot < rows:
             if pivot != r:
-                M[r], M[pivot] = M[pivot], M[r]
-                pasos.append(f"⬇ Intercambio F{r+1} <-> F{pivot+1}:\n{fmt_paso(M)}\n")
+                filas[r], filas[pivot] = filas[pivot], filas[r]
+                pasos.append(PasoMatriz(f"⬇ Intercambio F{r+1} <-> F{pivot+1}", filas))
             
             # Normalizar (Opcional en Gauss puro, pero recomendado)
-            piv_val = M[r][c]
-            if piv_val != 1:
-                for j in range(c, cols): M[r][j] /= piv_val
-                pasos.append(f"➗ F{r+1} / {fmt_val(piv_val)} (Pivote=1):\n{fmt_paso(M)}\n")
+            piv = filas[r]
+            if piv.nums[c] != piv.den:
+                piv_val = piv[c]
+                piv.normalizar(c)
+                pasos.append(PasoMatriz(f"➗ F{r+1} / {fmt_val(piv_val)} (Pivote=1)", filas))
             
-            # Eliminar SOLO ABAJO
+            # Eliminar abajo (REF) o arriba y abajo (RREF)
             cambio = False
-            for i in range(r + 1, rows):
-                if M[i][c] != 0:
-                    f = M[i][c]
-                    for j in range(c, cols): M[i][j] -= f * M[r][j]
+            for i in range(0 if reducida else r + 1, rows):
+                if i != r and filas[i].nums[c] != 0:
+                    f = filas[i][c]
+                    filas[i].eliminar(piv, c)
                     pasos.append(f"➖ F{i+1} - ({fmt_val(f)})*F{r+1}")
                     cambio = True
-            if cambio: pasos.append(f"   Estado (REF):\n{fmt_paso(M)}\n")
+            if cambio: pasos.append(PasoMatriz(f"   Estado ({'RREF' if reducida else 'REF'})", filas))
+            if progreso: progreso(f"Columna {c+1} de {cols}")
             r += 1
-    pasos.append(f"✅ Forma Escalonada (REF) Final:\n{fmt_paso(M)}")
-    return M, pasos
+    titulo = "✅ RREF Final" if reducida else "✅ Forma Escalonada (REF) Final"
+    pasos.append(PasoMatriz(titulo, filas, fin=""))
+    return de_filas(filas), pasos
 
-def rref(A):
+def ref(A, progreso=None):
+    """Forma Escalonada (Row Echelon Form) - Solo ceros abajo."""
+    return _escalonar(A, False, progreso)
+
+def rref(A, progreso=None):
     """Forma Escalonada Reducida (Reduced Row Echelon Form) - Ceros arriba y abajo."""
-    M = copy_m(A)
-    rows, cols = len(M), len(M[0])
-    pasos = [f"Matriz Inicial:\n{fmt_paso(M)}\n"]
-    r = 0
-    for c in range(cols):
-        if r >= rows: break
-        pivot = r
-        while pivot < rows and M[pivot][c] == 0: pivot += 1
-        if pivot < rows:
-            if pivot != r:
-                M[r], M[pivot] = M[pivot], M[r]
-                pasos.append(f"⬇ Intercambio F{r+1} <-> F{pivot+1}:\n{fmt_paso(M)}\n")
-            piv_val = M[r][c]
-            if piv_val != 1:
-                for j in range(c, cols): M[r][j] /= piv_val
-                pasos.append(f"➗ F{r+1} / {fmt_val(piv_val)} (Pivote=1):\n{fmt_paso(M)}\n")
-            cambio = False
-            for i in range(rows): # Eliminar ARRIBA Y ABAJO
-                if i != r and M[i][c] != 0:
-                    f = M[i][c]
-                    for j in range(c, cols): M[i][j] -= f * M[r][j]
-                    pasos.append(f"➖ F{i+1} - ({fmt_val(f)})*F{r+1}")
-                    cambio = True
-            if cambio: pasos.append(f"   Estado (RREF):\n{fmt_paso(M)}\n")
-            r += 1
-    pasos.append(f"✅ RREF Final:\n{fmt_paso(M)}")
-    return M, pasos
+    return _escalonar(A, True, progreso)
 
 rref_con_pasos = rref
 
 # --- SOLUCIONADORES DE SISTEMAS ---
 
-def resolver_gauss(A, b):
+def _exigir_cuadrado(A):
+    if len(A) != len(A[0]): raise ValueError(f"El sistema es {len(A)}×{len(A[0])}, no cuadrado: usa mínimos cuadrados")
+
+def resolver_gauss(A, b, progreso=None):
+    _exigir_cuadrado(A)
     # 1. Matriz Aumentada
     M = [row + [val_b] for row, val_b in zip(A, b)]
     pasos_totales = [f"Matriz Aumentada [A|b]:\n{fmt_paso(M)}\n"]
     
     # 2. Gauss (REF)
-    M_ref, pasos_ref = ref(M)
+    M_ref, pasos_ref = ref(M, progreso)
     pasos_totales.extend(pasos_ref)
     
     # 3. Sustitución hacia atrás
@@ -154,12 +216,13 @@ def resolver_gauss(A, b):
         
     return x, pasos_totales
 
-def resolver_gauss_jordan(A, b):
+def resolver_gauss_jordan(A, b, progreso=None):
+    _exigir_cuadrado(A)
     M = [row + [val_b] for row, val_b in zip(A, b)]
     pasos_totales = [f"Matriz Aumentada [A|b]:\n{fmt_paso(M)}\n"]
     
     # RREF directa
-    M_rref, pasos_rref = rref(M)
+    M_rref, pasos_rref = rref(M, progreso)
     pasos_totales.extend(pasos_rref)
     
     n = len(M_rref)
@@ -170,55 +233,131 @@ def resolver_gauss_jordan(A, b):
     x = [row[-1] for row in M_rref]
     return x, pasos_totales
 
+def resolver_lineal_float(A, b):
+    """
+    Backend float (sin pasos) para cálculos internos que necesitan velocidad:
+    eliminación gaussiana con pivoteo parcial.
+    """
+    n = len(A)
+    if n == 0 or n != len(A[0]) or n != len(b): raise ValueError("Sistema no cuadrado")
+    M = [[float(v) for v in row] + [float(bi)] for row, bi in zip(A, b)]
+    escala = max((abs(v) for row in M for v in row[:n]), default=0.0) or 1.0
+    for c in range(n):
+        p = max(range(c, n), key=lambda i: abs(M[i][c]))
+        if abs(M[p][c]) <= 1e-14 * escala: raise ValueError("Matriz singular")
+        if p != c: M[c], M[p] = M[p], M[c]
+        fila_p = M[c]
+        for i in range(c + 1, n):
+            f = M[i][c] / fila_p[c]
+            if f == 0: continue
+            fila = M[i]
+            for j in range(c, n + 1): fila[j] -= f * fila_p[j]
+    x = [0.0] * n
+    for i in range(n - 1, -1, -1):
+        s = M[i][n] - sum(M[i][j] * x[j] for j in range(i + 1, n))
+        x[i] = s / M[i][i]
+    return x
+
 # --- Otras ---
-def determinante(A):
+def determinante(A, progreso=None):
     n = len(A)
     if n != len(A[0]): raise ValueError("No cuadrada")
-    M = copy_m(A)
-    det = Fraction(1)
-    pasos = [f"Gauss para Determinante:\n{fmt_paso(M)}\n"]
+    M = a_filas(A)
+    pasos = [PasoMatriz("Gauss para Determinante", M)]
+    # Producto de pivotes como num/den enteros: una sola Fraction al final
+    det_num, det_den = 1, 1
     for i in range(n):
         p = i
-        while p < n and M[p][i] == 0: p += 1
+        while p < n and M[p].nums[i] == 0: p += 1
         if p == n: return Fraction(0), pasos + ["Columna 0 -> Det=0"]
         if p != i:
             M[i], M[p] = M[p], M[i]
-            det *= -1
+            det_num = -det_num
             pasos.append(f"Intercambio F{i+1}-F{p+1} (Det invierte signo)")
-        piv = M[i][i]
-        det *= piv
-        for j in range(i+1, n):
-            f = M[j][i] / piv
-            for k in range(i, n): M[j][k] -= f * M[i][k]
+        piv = M[i]
+        det_num *= piv.nums[i]; det_den *= piv.den
+        for j in range(i+1, n): M[j].eliminar(piv, i)
+        if progreso: progreso(f"Columna {i+1} de {n}")
+    det = Fraction(det_num, det_den)
     pasos.append(f"Multiplicación diagonal = {fmt_val(det)}")
     return det, pasos
 
-def matriz_inversa(A):
+# --- Predicado con filtro flotante ---
+# Rango completo sin aritmética exacta cuando se puede. Se calcula en float64 (NumPy)
+# y se certifica con una cota rigurosa a posteriori: si X ≈ A⁺ cumple ||I - X·A|| < 1,
+# las columnas de A son independientes. Los errores de redondeo de la propia cota se
+# absorben con γ y un margen. Si la cota no alcanza (rango incompleto o casi), el
+# llamador sigue por la vía exacta: la respuesta siempre es exacta.
+
+ESTADISTICAS_FILTRO = {"flotante": 0, "exacto": 0} # Consultas con filtro: decididas en flotante / cedidas a Fraction
+MIN_FILTRO = 12 # Por debajo de este orden la eliminación exacta ya es más rápida que NumPy
+_U = 2.0 ** -53 # Redondeo unitario de float64
+
+def _gamma(n): return n * _U / (1 - n * _U) + 2 * _U # γₙ más el redondeo de la entrada a float
+
+def _a_float(A):
+    """A en float64, o None si alguna entrada se sale del rango seguro (sin underflow/overflow)."""
+    import numpy as np
+    try: V = np.array([[float(v) for v in fila] for fila in A], dtype=np.float64)
+    except OverflowError: return None
+    magnitudes = np.abs(V[V != 0])
+    if magnitudes.size and (magnitudes.min() < 1e-150 or magnitudes.max() > 1e150): return None
+    return V
+
+def _cota_residuo(X, V):
+    """Cota superior de || |I - X·V| + γ|X||V| ||∞."""
+    import numpy as np
+    k, m = X.shape
+    cota = np.abs(np.eye(k) - X @ V) + _gamma(max(k, m)) * (np.abs(X) @ np.abs(V))
+    return float(cota.sum(axis=1).max()) * (1 + 4 * (k + m + 2) * _U)
+
+def _filtro_rango_completo(A) -> bool:
+    """True si rango(A) = min(m, n) queda certificado: ||I - X·A|| < 1 con X ≈ A⁺ (o sobre Aᵀ)."""
+    import numpy as np
+    V = _a_float(A)
+    if V is None: return False
+    if V.shape[0] < V.shape[1]: V = V.T
+    try: X = np.linalg.pinv(V)
+    except np.linalg.LinAlgError: return False
+    return bool(np.isfinite(X).all() and _cota_residuo(X, V) < 1)
+
+def rango_completo(A) -> bool:
+    """True si rango(A) = min(m, n) queda certificado por el filtro; False = no se sabe."""
+    if min(len(A), len(A[0])) < MIN_FILTRO: return False
+    ok = _filtro_rango_completo(A)
+    ESTADISTICAS_FILTRO["flotante" if ok else "exacto"] += 1
+    return ok
+
+def matriz_inversa(A, progreso=None):
     n = len(A)
     if n != len(A[0]): raise ValueError("No cuadrada")
     M = [r + row for r, row in zip(A, ident(n))]
     pasos = [f"Aumentada [A|I]:\n{fmt_paso(M)}\n"]
     # Reusamos lógica de rref para pasos limpios
-    R, p = rref(M)
+    R, p = rref(M, progreso)
+    if any(R[i][i] != 1 for i in range(n)): raise ValueError("Matriz singular (det = 0): no tiene inversa")
     pasos += p
     res = [row[n:] for row in R]
     return res, pasos
 
-def regla_cramer(A, b):
-    detA, pA = determinante(A)
-    pasos = ["1. Det(A):\n" + "\n".join(pA) + f"\nResultado Det(A) = {fmt_val(detA)}\n"]
+def regla_cramer(A, b, progreso=None):
+    detA, pA = determinante(A, progreso)
+    pasos = ["1. Det(A):\n" + "\n".join(map(str, pA)) + f"\nResultado Det(A) = {fmt_val(detA)}\n"]
     if detA == 0: return None, pasos + ["Det 0, Cramer falla"]
     n = len(A)
     sol = []
     for i in range(n):
         Ai = copy_m(A)
         for j in range(n): Ai[j][i] = b[j]
-        di, _ = determinante(Ai)
+        di, _ = determinante(Ai, progreso)
         sol.append(di/detA)
         pasos.append(f"x{i+1} = Det(A{i+1}) / Det(A) = {fmt_val(di)} / {fmt_val(detA)} = {fmt_val(sol[-1])}")
     return sol, pasos
 
-def rango_matriz(A):
-    R, _ = rref(A)
+def rango_matriz(A, progreso=None):
+    if rango_completo(A):
+        r = min(len(A), len(A[0]))
+        return r, [f"Filtro flotante certificado: rango completo = {r} (sin RREF)"]
+    R, _ = rref(A, progreso)
     r = sum(1 for row in R if any(x!=0 for x in row))
     return r, [f"RREF:\n{fmt_paso(R)}\nFilas no nulas = {r}"]
\ No newline at end of file
@@ -0,0 +1,145 @@
+import math
+import re
+from typing import List, Sequence, Union
+
+from algebraic_fill import _ordenar_variables # Mismo criterio que los sistemas lineales
+from autodiff import Dual, funciones_duales, FUNCIONES_FLOAT
+from matrix_ops import resolver_lineal_float
+from numerical_methods import _preprocesar_expresion, _crear_contexto_seguro
+from traces import nueva_traza
+
+NOMBRES_RESERVADOS = {"sin", "cos", "tan", "sqrt", "exp", "ln", "log", "log10", "abs", "pow", "e", "pi"}
+_CTX_DUAL = funciones_duales(FUNCIONES_FLOAT)
+
+class SistemaCompilado:
+    """F(x) = 0 con cada ecuación 'lhs = rhs' compilada como lhs - (rhs)."""
+    def __init__(self, ecuaciones: List[str], variables: List[str]):
+        self.ecuaciones = ecuaciones
+        self.variables = variables
+        try: self.codigos = [compile(e, "<F>", "eval") for e in ecuaciones]
+        except SyntaxError as e: raise ValueError(f"Ecuación mal formada: {e.text}")
+        self.base = _crear_contexto_seguro(0.0)
+        self.evaluaciones = 0
+
+    def _eval(self, ctx):
+        return [eval(c, {"__builtins__": None}, ctx) for c in self.codigos]
+
+    def F(self, x: Sequence[float]) -> List[float]:
+        self.evaluaciones += 1
+        ctx = dict(self.base); ctx.update(zip(self.variables, x))
+        return [float(v) for v in self._eval(ctx)]
+
+    def jacobiano_ad(self, x: Sequence[float]) -> List[List[float]]:
+        """Diferenciación automática: una pasada con duales por variable (columna)."""
+        n, m = len(self.variables), len(self.codigos)
+        J = [[0.0] * n for _ in range(m)]
+        for j in range(n):
+            ctx = dict(self.base); ctx.update(_CTX_DUAL)
+            ctx.update({v: Dual(float(x[k]), 1.0 if k == j else 0.0) for k, v in enumerate(self.variables)})
+            for i, r in enumerate(self._eval(ctx)):
+                J[i][j] = float(r.d) if isinstance(r, Dual) else 0.0
+        return J
+
+    def jacobiano_fd(self, x: Sequence[float], fx=None) -> List[List[float]]:
+        """Diferencias finitas hacia adelante con paso relativo √ε."""
+        fx = fx if fx is not None else self.F(x)
+        n = len(x)
+        J = [[0.0] * n for _ in range(len(fx))]
+        for j in range(n):
+            h = 1.49e-8 * max(1.0, abs(x[j]))
+            xh = list(x); xh[j] += h
+            fh = self.F(xh)
+            for i in range(len(fx)): J[i][j] = (fh[i] - fx[i]) / h
+        return J
+
+def compilar_sistema(texto_o_lista: Union[str, List[str]]) -> SistemaCompilado:
+    """
+    Acepta el mismo estilo que parsear_sistema_ecuaciones ("x^2+y^2=4 \\ x-y=0",
+    separadores por línea, '\\' o ';', numeración "1)" ignorada).
+    """
+    if isinstance(texto_o_lista, str):
+        texto = texto_o_lista.replace("\\", "\n").replace(";", "\n")
+        lineas = [l.strip() for l in texto.split("\n") if l.strip()]
+    else: lineas = [l.strip() for l in texto_o_lista if l.strip()]
+
+    ecuaciones, nombres = [], set()
+    for l in lineas:
+        l = re.sub(r'^\d+[\.\)]', '', l)
+        lhs, rhs = l.split("=", 1) if "=" in l else (l, "0")
+        expr = _preprocesar_expresion(f"({lhs.strip()})-({rhs.strip() or '0'})")
+        nombres.update(n for n in re.findall(r'[a-z_]\w*', expr) if n not in NOMBRES_RESERVADOS)
+        ecuaciones.append(expr)
+    if not ecuaciones: raise ValueError("No se encontraron ecuaciones.")
+    variables = _ordenar_variables(nombres)
+    # Multiplicación implícita variable-paréntesis: y(x+1) -> y*(x+1)
+    if variables:
+        patron = re.compile(r'\b(' + "|".join(map(re.escape, variables)) + r')\s*(?=\()')
+        ecuaciones = [patron.sub(r'\1*', e) for e in ecuaciones]
+    return SistemaCompilado(ecuaciones, variables)
+
+def _norma(v): return math.sqrt(sum(x * x for x in v))
+
+def newton_sistema(ecuaciones, x0: Sequence[float], tol=1e-10, max_iter=50,
+                   jacobiano="ad", broyden=False, traza=True):
+    """
+    Newton multivariable para F(x) = 0. Cada paso resuelve J·Δx = -F con el backend
+    float de matrix_ops. jacobiano: "ad" (automático) o "fd" (diferencias finitas).
+    Con broyden=True el jacobiano se calcula solo al inicio (o al reiniciar) y luego
+    se corrige con actualizaciones de rango 1.
+    Devuelve ({variable: valor}, reg). Si no converge, la última fila de reg lleva
+    el motivo en 'error' ("Jacobiano singular", "Error Mat." o "Sin convergencia").
+    """
+    S = ecuaciones if isinstance(ecuaciones, SistemaCompilado) else compilar_sistema(ecuaciones)
+    n = len(S.variables)
+    if len(S.codigos) != n:
+        raise ValueError(f"Se necesitan tantas ecuaciones como incógnitas ({len(S.codigos)} ecuaciones, {n} variables: {', '.join(S.variables)}).")
+    x = [float(v) for v in x0]
+    if len(x) != n: raise ValueError(f"Se esperaban {n} valores iniciales ({', '.join(S.variables)}).")
+
+    calc_J = S.jacobiano_ad if jacobiano == "ad" else S.jacobiano_fd
+    reg = nueva_traza(traza, ('iter', 'norma_F', 'error', 'jacobiano'))
+    try: fx = S.F(x)
+    except Exception as e: raise ValueError(f"Error evaluando F en x0: {e}")
+    J, nuevo_J = calc_J(x), 1
+
+    for k in range(1, max_iter + 1):
+        nf = _norma(fx)
+        try: dx = resolver_lineal_float(J, [-v for v in fx])
+        except ValueError:
+            if broyden and not nuevo_J: # La aproximación degeneró: reiniciar con el jacobiano real
+                J, nuevo_J = calc_J(x), 1
+                try: dx = resolver_lineal_float(J, [-v for v in fx])
+                except ValueError: dx = None
+            else: dx = None
+        if dx is None:
+            reg.agregar(k, nf, "Jacobiano singular", nuevo_J)
+            break
+
+        x_new = [a + b for a, b in zip(x, dx)]
+        try: f_new = S.F(x_new)
+        except Exception:
+            reg.agregar(k, nf, "Error Mat.", nuevo_J)
+            break
+        paso = _norma(dx)
+        reg.agregar(k, nf, paso, nuevo_J)
+
+        if paso < tol * max(1.0, _norma(x_new)) or _norma(f_new) < tol:
+            return dict(zip(S.variables, x_new)), reg
+
+        if broyden:
+            # Broyden "bueno": J += (Δf - J·Δx) Δxᵀ / (Δxᵀ Δx)
+            df = [a - b for a, b in zip(f_new, fx)]
+            Jdx = [sum(J[i][j] * dx[j] for j in range(n)) for i in range(n)]
+            den = sum(d * d for d in dx)
+            for i in range(n):
+                u = (df[i] - Jdx[i]) / den
+                if u:
+                    for j in range(n): J[i][j] += u * dx[j]
+            nuevo_J = 0
+            if _norma(f_new) > nf: J, nuevo_J = calc_J(x_new), 1 # Sin descenso: refrescar
+        else:
+            J = calc_J(x_new)
+        x, fx = x_new, f_new
+    else: reg.agregar(max_iter + 1, _norma(fx), "Sin convergencia", nuevo_J)
+
+    return dict(zip(S.variables, x)), reg
@@ -1,6 +1,11 @@
 ﻿import math
 import re
-from typing import Tuple, List, Dict, Any
+from functools import lru_cache
+from typing import Tuple, List, Dict, Any, Optional
+
+from autodiff import Dual, FUNCIONES_FLOAT, funciones_duales
+from polynomials import coeficientes_polinomio, derivar, horner, horner_con_derivada, aberth, contar_raices_sturm
+from traces import Traza, nueva_traza, diagnosticar_convergencia
 
 def _preprocesar_expresion(expr: str) -> str:
     if not expr: return ""
@@ -42,49 +47,128 @@ def _crear_contexto_seguro(valor_x: float):
         "pow": pow
     }
 
-def evaluar_funcion(func_str: str, val_x: float) -> float:
+@lru_cache(maxsize=256)
+def _compilar(func_str: str):
+    """
+    Preprocesa una sola vez: (coeficientes float si es polinomio, código compilado,
+    expandida). Horner solo sustituye a la expresión si ya venía expandida (sin
+    paréntesis): expandir (x-2)^15 cancela catastróficamente cerca de la raíz.
+    """
     func_py = _preprocesar_expresion(func_str)
-    ctx = _crear_contexto_seguro(val_x)
+    coefs = coeficientes_polinomio(func_py)
+    poli = tuple(float(c) for c in coefs) if coefs is not None else None
+    return poli, compile(func_py, "<f(x)>", "eval"), poli is not None and "(" not in func_py
+
+def evaluar_funcion(func_str: str, val_x: float) -> float:
     try:
-        return float(eval(func_py, {"__builtins__": None}, ctx))
+        poli, codigo, expandida = _compilar(func_str)
+        if expandida: # Camino rápido: Horner sin eval
+            r = horner(poli, float(val_x))
+            if not math.isfinite(r): raise OverflowError("desbordamiento")
+            return r
+        return float(eval(codigo, {"__builtins__": None}, _crear_contexto_seguro(val_x)))
     except Exception as e:
         raise ValueError(f"Error evaluando '{func_str}' en x={val_x}: {e}")
 
+def _contexto_numpy(np, xs):
+    return {"x": xs, "np": np, "sin": np.sin, "cos": np.cos, "tan": np.tan,
+            "ln": np.log, "log": np.log10, "log10": np.log10, "sqrt": np.sqrt, "exp": np.exp,
+            "pi": np.pi, "e": np.e, "abs": np.abs, "pow": np.power}
+
+def evaluar_vectorizado(func_str: str, xs):
+    """f sobre un arreglo NumPy completo (gráficas, cuadratura). Puntos inválidos -> nan/inf."""
+    import numpy as np # Diferido: los métodos escalares no necesitan NumPy
+    xs = np.asarray(xs, dtype=float)
+    try:
+        poli, codigo, expandida = _compilar(func_str)
+        with np.errstate(all='ignore'):
+            if expandida: return np.polyval(poli, xs)
+            y = eval(codigo, {"__builtins__": None}, _contexto_numpy(np, xs))
+        y = np.asarray(y, dtype=float)
+    except Exception as e:
+        raise ValueError(f"Error evaluando '{func_str}': {e}")
+    return y if y.shape == xs.shape else np.broadcast_to(y, xs.shape).copy()
+
+@lru_cache(maxsize=1)
+def _contexto_dual():
+    return funciones_duales(FUNCIONES_FLOAT)
+
 def derivada_numerica(f_str: str, x: float, h=1e-5) -> float:
+    try: poli, codigo, expandida = _compilar(f_str)
+    except Exception: poli = None
+    if poli is not None: # Derivada exacta: Horner si venía expandido, duales si no
+        if expandida: return horner_con_derivada(poli, float(x))[1]
+        ctx = _crear_contexto_seguro(Dual(float(x), 1.0)); ctx.update(_contexto_dual())
+        try: r = eval(codigo, {"__builtins__": None}, ctx)
+        except Exception as e: raise ValueError(f"Error evaluando '{f_str}' en x={x}: {e}")
+        return float(r.d) if isinstance(r, Dual) else 0.0
     f_x_h = evaluar_funcion(f_str, x + h)
     f_x_mh = evaluar_funcion(f_str, x - h)
     return (f_x_h - f_x_mh) / (2 * h)
 
+@lru_cache(maxsize=1)
+def _contexto_dual2():
+    # Duales cuyos componentes son duales: f, f' y f'' en una sola evaluación
+    return funciones_duales(dict(funciones_duales(FUNCIONES_FLOAT), cte=float))
+
+def _f_y_derivadas(func_str: str, x: float):
+    """(f, f', f'') exactas: Horner para polinomios ya expandidos, diferenciación automática si no."""
+    try:
+        poli, codigo, expandida = _compilar(func_str)
+        if expandida: # (x-1)^10 expandido pierde todos los dígitos justo donde importa
+            f, df = horner_con_derivada(poli, x)
+            return f, df, horner_con_derivada(derivar(poli), x)[1] if len(poli) > 1 else 0.0
+        ctx = _crear_contexto_seguro(0.0); ctx.update(_contexto_dual2())
+        ctx["x"] = Dual(Dual(x, 1.0), Dual(1.0, 0.0))
+        r = eval(codigo, {"__builtins__": None}, ctx)
+    except Exception as e:
+        raise ValueError(f"Error evaluando '{func_str}' en x={x}: {e}")
+    if not isinstance(r, Dual): return float(r), 0.0, 0.0
+    v, d = r.v, r.d
+    f, df = (v.v, v.d) if isinstance(v, Dual) else (v, d.v if isinstance(d, Dual) else d)
+    return float(f), float(df), float(d.d) if isinstance(d, Dual) else 0.0
+
 # --- MÉTODOS ---
 
-def newton_raphson(func_str: str, x0: float, tol=1e-7, max_iter=100):
-    reg = []
+def _refinar(func_str, x, reg, digits):
+    """Con `digits`: pulir la raíz float con Newton decimal de precisión creciente."""
+    from high_precision import refinar_newton # Diferido: evita el ciclo de importación
+    return refinar_newton(func_str, x, digits, reg, k0=reg.iteraciones)
+
+def _sin_converger(x, reg, digits):
+    """Salida sin convergencia: con `digits` el float se devuelve tal cual, anotado en la traza."""
+    if not digits: return x, reg
+    from high_precision import sin_refinar
+    return sin_refinar(x, digits, reg, reg.iteraciones + 1)
+
+def newton_raphson(func_str: str, x0: float, tol=1e-7, max_iter=100, traza=True, digits=None):
+    reg = nueva_traza(traza, ('iter', 'xi', 'f(xi)', 'error'))
     x = float(x0)
     for k in range(1, max_iter + 1):
         try:
             fx = evaluar_funcion(func_str, x)
             dfx = derivada_numerica(func_str, x)
         except ValueError:
-            reg.append({'iter': k, 'xi': x, 'error': "Error Mat."})
+            reg.agregar(k, x, None, "Error Mat.")
             break
 
         if abs(dfx) < 1e-15:
-            reg.append({'iter': k, 'xi': x, 'f(xi)': fx, 'error': "Derivada 0"})
+            reg.agregar(k, x, fx, "Derivada 0")
             break
             
         x_new = x - fx / dfx
         error = abs(x_new - x)
         
-        reg.append({'iter': k, 'xi': x, 'f(xi)': fx, 'error': error})
+        reg.agregar(k, x, fx, error)
         
         if error < tol:
-            return x_new, reg
+            return _refinar(func_str, x_new, reg, digits) if digits else (x_new, reg)
         x = x_new
         
-    return x, reg
+    return _sin_converger(x, reg, digits)
 
-def metodo_secante(func_str: str, x0: float, x1: float, tol=1e-7, max_iter=100):
-    reg = []
+def metodo_secante(func_str: str, x0: float, x1: float, tol=1e-7, max_iter=100, traza=True, digits=None):
+    reg = nueva_traza(traza, ('iter', 'xi', 'xi+1', 'error'))
     xa, xb = float(x0), float(x1)
     
     for k in range(1, max_iter + 1):
@@ -94,21 +178,21 @@ def metodo_secante(func_str: str, x0: float, x1: float, tol=1e-7, max_iter=100):
         except: break # Salir si eval falla
         
         if abs(fb - fa) < 1e-15:
-            reg.append({'iter': k, 'xi': xb, 'error': "División por 0"})
+            reg.agregar(k, xb, None, "División por 0")
             break
             
         xn = xb - fb * (xb - xa) / (fb - fa)
         error = abs(xn - xb)
         
-        reg.append({'iter': k, 'xi': xb, 'xi+1': xn, 'error': error})
+        reg.agregar(k, xb, xn, error)
         
-        if error < tol: return xn, reg
+        if error < tol: return _refinar(func_str, xn, reg, digits) if digits else (xn, reg)
         xa, xb = xb, xn
         
-    return xb, reg
+    return _sin_converger(xb, reg, digits)
 
-def metodo_biseccion(func_str: str, a: float, b: float, tol=1e-7, max_iter=100):
-    reg = []
+def metodo_biseccion(func_str: str, a: float, b: float, tol=1e-7, max_iter=100, traza=True, digits=None):
+    reg = nueva_traza(traza, ('iter', 'a', 'b', 'c', 'error'))
     fa = evaluar_funcion(func_str, a)
     fb = evaluar_funcion(func_str, b)
     
@@ -121,19 +205,19 @@ def metodo_biseccion(func_str: str, a: float, b: float, tol=1e-7, max_iter=100):
         fc = evaluar_funcion(func_str, c)
         error = abs(b - a) / 2
         
-        reg.append({'iter': k, 'a': a, 'b': b, 'c': c, 'error': error})
+        reg.agregar(k, a, b, c, error)
         
-        if abs(fc) < 1e-15 or error < tol: return c, reg
+        if abs(fc) < 1e-15 or error < tol: return _refinar(func_str, c, reg, digits) if digits else (c, reg)
         
         if fa * fc < 0:
             b, fb = c, fc
         else:
             a, fa = c, fc
             
-    return c, reg
+    return _sin_converger(c, reg, digits)
 
-def metodo_regla_falsa(func_str: str, a: float, b: float, tol=1e-7, max_iter=100):
-    reg = []
+def metodo_regla_falsa(func_str: str, a: float, b: float, tol=1e-7, max_iter=100, traza=True, digits=None):
+    reg = nueva_traza(traza, ('iter', 'a', 'b', 'c', 'error'))
     fa = evaluar_funcion(func_str, a)
     fb = evaluar_funcion(func_str, b)
     
@@ -147,13 +231,332 @@ def metodo_regla_falsa(func_str: str, a: float, b: float, tol=1e-7, max_iter=100
         fc = evaluar_funcion(func_str, c)
         error = abs(c - a) # Estimación simple
         
-        reg.append({'iter': k, 'a': a, 'b': b, 'c': c, 'error': error})
+        reg.agregar(k, a, b, c, error)
         
-        if abs(fc) < 1e-15 or error < tol: return c, reg
+        if abs(fc) < 1e-15 or error < tol: return _refinar(func_str, c, reg, digits) if digits else (c, reg)
         
         if fa * fc < 0:
             b, fb = c, fc
         else:
             a, fa = c, fc
             
-    return c, reg
\ No newline at end of file
+    return _sin_converger(c, reg, digits)
+
+# --- RAÍCES MÚLTIPLES Y ACELERACIÓN ---
+# En una raíz de multiplicidad m, una iteración x - μ·f/f' contrae el paso con razón
+# q = 1 - μ/m: Newton (μ = 1) pasa a ser lineal con q = (m-1)/m. De la razón observada
+# se despeja m = μ/(1 - q), y con μ = m se recupera la convergencia cuadrática.
+
+def _multiplicidad(q, mu=1) -> Optional[float]:
+    return mu / (1 - q) if q < 1 else None
+
+def estimar_multiplicidad(reg, campo="error") -> Optional[float]:
+    """
+    m estimada desde una traza de Newton con las tres últimas razones de paso antes
+    del nivel de redondeo (la fase inicial amortiguada no cuenta). 1.0 si las razones
+    siguen encogiéndose (convergencia superlineal: raíz simple); None si no se estabilizan.
+    """
+    if not len(reg): return None
+    xs = reg.columna("xi") if "xi" in reg.columnas else []
+    escala = max([1.0] + [abs(x) for x in xs[-1:] if math.isfinite(x)])
+    errores = [e for e in reg.columna(campo) if math.isfinite(e) and e > 0]
+    while errores and errores[-1] <= 1e-13 * escala: errores.pop() # Cola de redondeo
+    if len(errores) < 4: return None
+    q = [b / a for a, b in zip(errores[-4:], errores[-3:])]
+    if q[2] < q[1] < q[0] and q[2] < 0.5 * q[0]: return 1.0
+    if max(q) >= 1 or max(q) > 1.25 * min(q): return None
+    return _multiplicidad(sorted(q)[1])
+
+def newton_modificado(func_str: str, x0: float, multiplicidad=None, variante="m", tol=1e-7, max_iter=100, traza=True):
+    """
+    variante "m": x - m·f/f'. Sin `multiplicidad`, m se estima en marcha con la razón
+    de pasos consecutivos y se corrige en cuanto se estabiliza.
+    variante "u": Newton sobre u = f/f', x - f·f'/(f'² - f·f''): cuadrático sin conocer m.
+    f' y f'' son exactas (Horner o diferenciación automática): cerca de una raíz
+    múltiple f' es diminuta y las diferencias finitas la ahogan en ruido.
+    Devuelve (x, reg) con la columna 'm' usada en cada paso (0 en la variante "u").
+    """
+    reg = nueva_traza(traza, ('iter', 'xi', 'f(xi)', 'error', 'm'))
+    x, m = float(x0), multiplicidad or 1
+    pasos, fija = [], False # Pasos con signo desde el último cambio de m; fija: no volver a estimar
+    anterior = None # (x, f, f', f'') antes de un paso con m estimada > 1
+    for k in range(1, max_iter + 1):
+        try: fx, dfx, d2fx = _f_y_derivadas(func_str, x)
+        except ValueError: fx = dfx = d2fx = math.nan
+        if fx == 0:
+            reg.agregar(k, x, fx, 0.0, m)
+            return x, reg
+        den = dfx * dfx - fx * d2fx if variante == "u" else dfx
+        if anterior is not None and not (math.isfinite(fx) and abs(fx) < abs(anterior[1]) and abs(den) >= 1e-300):
+            # El paso con la m estimada no bajó |f| o cayó en un punto crítico: no era una
+            # raíz múltiple (zona lejana o raíces simples muy juntas). Volver atrás con m = 1.
+            (x, fx, dfx, d2fx), m, fija, pasos = anterior, 1, True, []
+            den = dfx
+        anterior = (x, fx, dfx, d2fx) if m > 1 and multiplicidad is None and not fija else None
+        if not math.isfinite(fx):
+            reg.agregar(k, x, None, "Error Mat.", m)
+            break
+        if abs(den) < 1e-300:
+            reg.agregar(k, x, fx, "Derivada 0", m)
+            break
+        paso = fx * dfx / den if variante == "u" else m * fx / dfx
+        x_new = x - paso
+        error = abs(paso)
+        reg.agregar(k, x, fx, error, 0 if variante == "u" else m)
+        if error < tol: return x_new, reg
+        x = x_new
+        if variante == "m" and multiplicidad is None and not fija:
+            pasos.append(paso)
+            if len(pasos) >= 3 and pasos[-2] and pasos[-3]:
+                q1, q2 = pasos[-1] / pasos[-2], pasos[-2] / pasos[-3]
+                # Razón estable y lejos de 0 (0 = ya cuadrático): corregir m
+                if abs(q1 - q2) < 0.05 and 0.2 < abs(q1) and q1 < 0.98:
+                    nueva = round(_multiplicidad(q1, m))
+                    if nueva >= 1 and nueva != m: m, pasos, fija = nueva, [], nueva < m
+    return x, reg
+
+def metodo_steffensen(func_str: str, x0: float, tol=1e-7, max_iter=100, traza=True):
+    """x - f(x)² / (f(x + f(x)) - f(x)): cuadrático en raíces simples sin derivadas, dos evaluaciones por paso."""
+    reg = nueva_traza(traza, ('iter', 'xi', 'f(xi)', 'error'))
+    x = float(x0)
+    for k in range(1, max_iter + 1):
+        try:
+            fx = evaluar_funcion(func_str, x)
+            if fx == 0:
+                reg.agregar(k, x, fx, 0.0)
+                return x, reg
+            den = evaluar_funcion(func_str, x + fx) - fx
+        except ValueError:
+            reg.agregar(k, x, None, "Error Mat.")
+            break
+        if den == 0:
+            reg.agregar(k, x, fx, "División por 0")
+            break
+        x_new = x - fx * fx / den
+        error = abs(x_new - x)
+        reg.agregar(k, x, fx, error)
+        if error < tol: return x_new, reg
+        x = x_new
+    return x, reg
+
+def aitken(xs: List[float]) -> List[float]:
+    """Δ² de Aitken: x_k - (Δx_k)² / Δ²x_k para cada terna consecutiva (n - 2 valores)."""
+    out = []
+    for a, b, c in zip(xs, xs[1:], xs[2:]):
+        d2 = c - 2 * b + a
+        out.append(c if d2 == 0 else a - (b - a) ** 2 / d2)
+    return out
+
+class _AitkenConvergio(Exception):
+    pass
+
+# Columna de la traza que lleva la sucesión de iterados en cada método
+CAMPO_ITERADO = {"newton_raphson": "xi", "metodo_secante": "xi+1", "metodo_biseccion": "c",
+                 "metodo_regla_falsa": "c", "newton_modificado": "xi", "metodo_steffensen": "xi"}
+
+def acelerar_aitken(metodo, func_str: str, *args, tol=1e-7, max_iter=100, traza=True):
+    """
+    Aplica Δ² de Aitken en marcha a los iterados de cualquier método de esta sección:
+    la traza interna del método alimenta la sucesión acelerada y el método se detiene
+    en cuanto ésta converge y |f| < tol en su límite. Devuelve (x, reg) con columnas ('iter', 'xi', 'aitken', 'error').
+    """
+    campo = CAMPO_ITERADO[metodo.__name__]
+    reg = nueva_traza(traza, ('iter', 'xi', 'aitken', 'error'))
+    xs, acel = [], []
+
+    def observar(fila):
+        x = fila.get(campo)
+        if not isinstance(x, float) or not math.isfinite(x): return
+        xs.append(x)
+        if len(xs) < 3:
+            reg.agregar(len(xs), x, None, None)
+            return
+        acel.append(aitken(xs[-3:])[0])
+        error = abs(acel[-1] - acel[-2]) if len(acel) > 1 else None
+        reg.agregar(len(xs), x, acel[-1], error)
+        if error is None or error >= tol: return
+        # Una sucesión geométrica lejos de toda raíz (x^10 - 1 desde 0.5) también
+        # "converge" acelerada: solo se acepta el límite si f es pequeña ahí.
+        try: residuo = abs(evaluar_funcion(func_str, acel[-1]))
+        except ValueError: return
+        if residuo < tol: raise _AitkenConvergio()
+
+    try: x, _ = metodo(func_str, *args, tol=tol, max_iter=max_iter, traza=Traza(activa=False, observador=observar))
+    except _AitkenConvergio: return acel[-1], reg
+    return x, reg # El método convergió antes que la sucesión acelerada
+
+def _convergio(reg, tol) -> bool:
+    errores = [e for e in reg.columna("error") if not math.isnan(e)] if len(reg) else []
+    return bool(errores) and errores[-1] < tol
+
+def ahorro_iteraciones(reg, base, func_str: str, *args, tol=1e-7, max_iter=100) -> Dict[str, Any]:
+    """Corre el método simple `base` con la misma entrada y compara iteraciones con `reg`."""
+    xb, reg_b = base(func_str, *args, tol=tol, max_iter=max_iter)
+    nb, na = reg_b.iteraciones, reg.iteraciones
+    return {'base': base.__name__, 'iter_base': nb, 'iter': na, 'ahorro': nb - na,
+            'porcentaje': 100 * (nb - na) / nb if nb else 0.0,
+            'base_convergio': _convergio(reg_b, tol), 'raiz_base': xb}
+
+def formatear_ahorro(d: Dict[str, Any]) -> str:
+    base = f"{d['base']}: {d['iter_base']} iteraciones" + ("" if d['base_convergio'] else " (sin converger)")
+    return f"{base} -> {d['iter']} ({'ahorro' if d['ahorro'] >= 0 else 'exceso'} {abs(d['ahorro'])}, {abs(d['porcentaje']):.0f}%)"
+
+# --- POLINOMIOS ---
+
+def coeficientes_exactos(func_str: str):
+    """Coeficientes Fraction (descendentes) si f es un polinomio en x, si no None."""
+    return coeficientes_polinomio(_preprocesar_expresion(func_str))
+
+def raices_polinomio(func_str: str, tol=1e-12, max_iter=500):
+    """Todas las raíces complejas de un polinomio a la vez (Aberth-Ehrlich)."""
+    coefs = coeficientes_exactos(func_str)
+    if coefs is None: raise ValueError("La expresión no es un polinomio en x.")
+    if len(coefs) == 1: raise ValueError("Polinomio constante: no hay raíces que buscar.")
+    return aberth(coefs, tol, max_iter)
+
+def contar_raices_reales(func_str: str, a: float, b: float) -> int:
+    """Raíces reales distintas en (a, b] por secuencias de Sturm (aritmética exacta)."""
+    coefs = coeficientes_exactos(func_str)
+    if coefs is None: raise ValueError("La expresión no es un polinomio en x.")
+    return contar_raices_sturm(coefs, a, b)
+
+# --- INTEGRACIÓN ---
+
+class _Integrando:
+    """f vectorizada que cuenta evaluaciones; un lote por llamada (nunca punto a punto)."""
+    def __init__(self, func_str: str):
+        self.func_str = func_str
+        self.evaluaciones = 0
+
+    def __call__(self, xs):
+        import numpy as np
+        y = evaluar_vectorizado(self.func_str, xs)
+        self.evaluaciones += y.size
+        if not np.all(np.isfinite(y)):
+            x_mal = np.asarray(xs, dtype=float).ravel()[np.argmin(np.isfinite(y).ravel())]
+            raise ValueError(f"El integrando no es finito en x={x_mal:.6g}")
+        return y
+
+def integrar_trapecio(func_str: str, a: float, b: float, n=128, traza=True):
+    """Trapecio compuesto con n subintervalos; error estimado por Richardson contra n/2 (sin evaluar de nuevo)."""
+    import numpy as np
+    n = max(2, int(n) + int(n) % 2)
+    f = _Integrando(func_str)
+    reg = nueva_traza(traza, ('iter', 'n', 'valor', 'error', 'evals'))
+    y = f(np.linspace(a, b, n + 1))
+    h = (b - a) / n
+    t_mitad = 2 * h * (y[0:-1:2].sum() + y[2::2].sum()) / 2
+    t = h * (y[0] / 2 + y[1:-1].sum() + y[-1] / 2)
+    error = abs(t - t_mitad) / 3
+    reg.agregar(1, n // 2, t_mitad, None, f.evaluaciones)
+    reg.agregar(2, n, t, error, f.evaluaciones)
+    return t, reg
+
+def integrar_simpson(func_str: str, a: float, b: float, n=128, traza=True):
+    """Simpson compuesto (n múltiplo de 4); error estimado contra la regla con n/2."""
+    import numpy as np
+    n = max(4, -(-int(n) // 4) * 4)
+    f = _Integrando(func_str)
+    reg = nueva_traza(traza, ('iter', 'n', 'valor', 'error', 'evals'))
+    y = f(np.linspace(a, b, n + 1))
+    h = (b - a) / n
+    s = h / 3 * (y[0] + 4 * y[1:-1:2].sum() + 2 * y[2:-1:2].sum() + y[-1])
+    y2 = y[::2]
+    s_mitad = 2 * h / 3 * (y2[0] + 4 * y2[1:-1:2].sum() + 2 * y2[2:-1:2].sum() + y2[-1])
+    error = abs(s - s_mitad) / 15
+    reg.agregar(1, n // 2, s_mitad, None, f.evaluaciones)
+    reg.agregar(2, n, s, error, f.evaluaciones)
+    return s, reg
+
+def integrar_romberg(func_str: str, a: float, b: float, tol=1e-10, max_niveles=16, traza=True):
+    """
+    Extrapolación de Richardson sobre trapecios 1, 2, 4, ... subintervalos.
+    Cada nivel evalúa solo los puntos medios nuevos, en un lote.
+    """
+    import numpy as np
+    f = _Integrando(func_str)
+    reg = nueva_traza(traza, ('iter', 'n', 'valor', 'error', 'evals'))
+    h = b - a
+    extremos = f(np.array([a, b], dtype=float))
+    fila = [h * (extremos[0] + extremos[1]) / 2]
+    reg.agregar(0, 1, fila[0], None, f.evaluaciones)
+    for k in range(1, max_niveles + 1):
+        n = 2 ** (k - 1) # Puntos medios nuevos
+        medios = a + h * (np.arange(n) + 0.5)
+        h /= 2
+        nueva = [fila[0] / 2 + h * f(medios).sum()]
+        for j in range(1, k + 1):
+            nueva.append(nueva[j - 1] + (nueva[j - 1] - fila[j - 1]) / (4 ** j - 1))
+        error = abs(nueva[k] - fila[k - 1])
+        fila = nueva
+        reg.agregar(k, 2 * n, fila[k], error, f.evaluaciones)
+        if k >= 4 and error <= tol * max(1.0, abs(fila[k])): break
+    return fila[-1], reg
+
+# Gauss-Kronrod 7-15 (nodos y pesos de QUADPACK, mitad positiva de mayor a menor)
+_XGK = (0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+        0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+        0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+        0.207784955007898467600689403773245, 0.0)
+_WGK = (0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+        0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+        0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+        0.204432940075298892414161999234649, 0.209482141084727828012999174891714)
+_WG = (0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+       0.381830050505118944950369775488975, 0.417959183673469387755102040816327)
+
+@lru_cache(maxsize=1)
+def _tabla_gk():
+    import numpy as np
+    x = np.array(_XGK)
+    nodos = np.concatenate([-x[:-1], x[::-1]])
+    wk = np.array(_WGK); wk = np.concatenate([wk[:-1], wk[::-1]])
+    wg = np.zeros(8); wg[1::2] = _WG # Los nodos de Gauss son los de índice impar
+    wg = np.concatenate([wg[:-1], wg[::-1]])
+    return nodos, wk, wg
+
+def integrar_gauss_kronrod(func_str: str, a: float, b: float, tol=1e-10, max_subintervalos=2000, traza=True):
+    """
+    Gauss-Kronrod 7-15 adaptativo. En cada ronda se bisecan a la vez todos los
+    subintervalos cuyo error |K15 - G7| supera su parte proporcional de la tolerancia,
+    y sus 15 nodos se evalúan en un único lote. Devuelve (valor, reg).
+    """
+    import numpy as np
+    nodos, wk, wg = _tabla_gk()
+    f = _Integrando(func_str)
+    reg = nueva_traza(traza, ('iter', 'subintervalos', 'valor', 'error', 'evals'))
+
+    def reglas(lo, hi):
+        c, r = (lo + hi) / 2, (hi - lo) / 2
+        y = f(c[:, None] + r[:, None] * nodos)
+        k, g = r * (y @ wk), r * (y @ wg)
+        return k, np.abs(k - g)
+
+    lo, hi = np.array([float(a)]), np.array([float(b)])
+    val, err = reglas(lo, hi)
+    hechos_val, hechos_err = 0.0, 0.0 # Subintervalos ya aceptados
+    ancho, k = abs(b - a) or 1.0, 0
+    while True:
+        k += 1
+        total, error = hechos_val + val.sum(), hechos_err + err.sum()
+        reg.agregar(k, lo.size, total, error, f.evaluaciones)
+        objetivo = tol * max(1.0, abs(total))
+        if error <= objetivo or lo.size == 0: break
+        dividir = err > objetivo * np.abs(hi - lo) / ancho
+        if not dividir.any(): dividir = err >= err.max() # Nadie supera su cuota: el peor
+        if 2 * dividir.sum() + lo.size > max_subintervalos:
+            reg.agregar(k + 1, lo.size, total, "Límite de subintervalos", f.evaluaciones)
+            break
+        hechos_val += val[~dividir].sum(); hechos_err += err[~dividir].sum()
+        lo, hi = lo[dividir], hi[dividir]
+        mid = (lo + hi) / 2
+        lo, hi = np.concatenate([lo, mid]), np.concatenate([mid, hi])
+        val, err = reglas(lo, hi)
+    return total, reg
+
+METODOS_INTEGRACION = {
+    "Gauss-Kronrod (adaptativo)": integrar_gauss_kronrod,
+    "Romberg": integrar_romberg,
+    "Simpson": integrar_simpson,
+    "Trapecio": integrar_trapecio,
+}
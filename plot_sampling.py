@@ -0,0 +1,145 @@
+from collections import OrderedDict
+
+import numpy as np
+
+# Muestreo adaptativo para la gráfica de f(x): se parte de una malla gruesa y se
+# subdivide solo donde la interpolación lineal falla (curvatura) o hay cambio de
+# signo. Los saltos (polos, discontinuidades) se cortan insertando NaN.
+
+N_INICIAL = 129
+TOL_REL = 2e-3        # Error de interpolación tolerado, relativo a la escala vertical
+MAX_RONDAS = 10
+MAX_PUNTOS = 6000
+
+def _escala(y):
+    yf = y[np.isfinite(y)]
+    if yf.size == 0: return 1.0
+    lo, hi = np.percentile(yf, [2, 98])
+    return float(hi - lo) or max(1.0, float(np.max(np.abs(yf))))
+
+def refinar(f, x, y, tol_rel=TOL_REL, max_rondas=MAX_RONDAS, max_puntos=MAX_PUNTOS):
+    """Subdivide (x, y) ordenados donde hace falta. Cada ronda es una sola evaluación vectorial."""
+    ancho_min = (x[-1] - x[0]) * 1e-7 if x.size > 1 else 0
+    for _ in range(max_rondas):
+        if x.size >= max_puntos: break
+        xm = (x[:-1] + x[1:]) / 2
+        ym = f(xm)
+        escala = _escala(y)
+        with np.errstate(invalid="ignore"):
+            err = np.abs(ym - (y[:-1] + y[1:]) / 2) / escala
+            cambio = (y[:-1] * y[1:]) < 0
+        finitos = np.isfinite(y[:-1]) & np.isfinite(y[1:])
+        # Curvatura alta, cambio de signo o borde de dominio (finito <-> no finito)
+        marcar = (np.where(np.isfinite(err), err, 0) > tol_rel) | cambio | (finitos != np.isfinite(ym))
+        marcar &= (x[1:] - x[:-1]) > ancho_min
+        if not marcar.any(): break
+        idx = np.nonzero(marcar)[0]
+        if x.size + idx.size > max_puntos: idx = idx[np.argsort(-np.nan_to_num(err[idx], nan=np.inf))][:max_puntos - x.size]
+        idx.sort()
+        x = np.insert(x, idx + 1, xm[idx])
+        y = np.insert(y, idx + 1, ym[idx])
+    return x, y
+
+def _salto_persistente(f, xa, xb, ya, yb, rondas=60):
+    """
+    Bisección vectorial de cada segmento hacia la mitad con el mayor salto. En una
+    función continua el salto se achica con el intervalo (y el segmento sale de la
+    bisección en cuanto baja a la mitad); en floor(x) o abs(x)/x no se achica nunca.
+    """
+    salto0 = np.abs(yb - ya)
+    persiste = np.ones(salto0.size, dtype=bool)
+    activos = np.arange(salto0.size)
+    for _ in range(rondas):
+        if activos.size == 0: break
+        xm = (xa + xb) / 2
+        ym = f(xm)
+        with np.errstate(invalid="ignore"):
+            izq = ~(np.abs(yb - ym) > np.abs(ym - ya)) # NaN en ym: mitad izquierda
+        xb, yb = np.where(izq, xm, xb), np.where(izq, ym, yb)
+        xa, ya = np.where(izq, xa, xm), np.where(izq, ya, ym)
+        with np.errstate(invalid="ignore"):
+            continuo = np.abs(yb - ya) <= 0.5 * salto0[activos]
+        persiste[activos[continuo]] = False
+        seguir = ~continuo & (xb - xa > 1e-12 * np.maximum(1.0, np.abs(xa)))
+        activos, xa, xb, ya, yb = activos[seguir], xa[seguir], xb[seguir], ya[seguir], yb[seguir]
+    return persiste
+
+def cortar_discontinuidades(f, x, y):
+    """
+    Inserta NaN entre muestras separadas por un salto: el segmento es grande frente a
+    la escala y, o el punto medio NO queda entre sus extremos (polo), o el salto no
+    se achica al subdividir (escalón: el punto medio vale lo mismo que un extremo).
+    """
+    if x.size < 3: return x, y
+    escala = _escala(y)
+    with np.errstate(invalid="ignore"):
+        dy = np.abs(np.diff(y))
+        salto = dy > 0.02 * escala # Un escalón visible; el criterio de polo exige más
+    idx = np.nonzero(salto)[0]
+    if idx.size:
+        ym = f((x[idx] + x[idx + 1]) / 2)
+        lo, hi = np.minimum(y[idx], y[idx + 1]), np.maximum(y[idx], y[idx + 1])
+        holgura = 0.05 * (hi - lo)
+        fuera = ~((ym >= lo - holgura) & (ym <= hi + holgura)) & (dy[idx] > 0.25 * escala)
+        dentro = np.nonzero(~fuera)[0]
+        if dentro.size:
+            j = idx[dentro]
+            fuera[dentro] = _salto_persistente(f, x[j], x[j + 1], y[j], y[j + 1])
+        idx = idx[fuera]
+    if idx.size == 0: return x, y
+    return np.insert(x, idx + 1, np.nan), np.insert(y, idx + 1, np.nan)
+
+class CacheMuestras:
+    """
+    Muestras por expresión. Al desplazar solo se evalúa el tramo nuevo; al acercar
+    se refina solo la ventana visible (si su densidad no alcanza). LRU por expresión.
+    """
+    def __init__(self, max_expresiones=16, max_puntos_expr=200_000):
+        self.datos = OrderedDict() # clave -> (x, y) ordenados
+        self.max_expresiones = max_expresiones
+        self.max_puntos_expr = max_puntos_expr
+        self.evaluaciones = 0
+
+    def muestras(self, clave, f, a, b, n_min=N_INICIAL):
+        def f_contada(xs):
+            self.evaluaciones += xs.size
+            return f(xs)
+
+        x, y = self.datos.pop(clave, (np.empty(0), np.empty(0)))
+        nuevos = []
+        if x.size == 0: nuevos.append((a, b))
+        else:
+            # Tramos no cubiertos (desplazamiento o alejamiento)
+            if a < x[0]: nuevos.append((a, x[0]))
+            if b > x[-1]: nuevos.append((x[-1], b))
+        for lo, hi in nuevos:
+            n = max(9, int(n_min * (hi - lo) / (b - a)))
+            xs = np.linspace(lo, hi, n)
+            xs, ys = refinar(f_contada, xs, f_contada(xs))
+            x, y = _fusionar(x, y, xs, ys)
+
+        i0, i1 = np.searchsorted(x, a), np.searchsorted(x, b, side="right")
+        if i1 - i0 < n_min:
+            # Acercamiento: la ventana quedó con pocas muestras -> malla nueva a esta escala
+            xs = np.linspace(a, b, n_min)
+            xs, ys = refinar(f_contada, xs, f_contada(xs))
+            x, y = _fusionar(x, y, xs, ys)
+            i0, i1 = np.searchsorted(x, a), np.searchsorted(x, b, side="right")
+
+        if x.size > self.max_puntos_expr: # Conservar solo lo visible
+            x, y = x[i0:i1].copy(), y[i0:i1].copy()
+            i0, i1 = 0, x.size
+        self.datos[clave] = (x, y)
+        while len(self.datos) > self.max_expresiones: self.datos.popitem(last=False)
+        # Ventana + un punto a cada lado para que la curva llegue al borde
+        j0, j1 = max(0, i0 - 1), min(x.size, i1 + 1)
+        return cortar_discontinuidades(f_contada, x[j0:j1], y[j0:j1])
+
+    def invalidar(self, clave=None):
+        if clave is None: self.datos.clear()
+        else: self.datos.pop(clave, None)
+
+def _fusionar(x1, y1, x2, y2):
+    x = np.concatenate([x1, x2]); y = np.concatenate([y1, y2])
+    x, idx = np.unique(x, return_index=True)
+    return x, y[idx]
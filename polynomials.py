@@ -0,0 +1,172 @@
+import ast
+from fractions import Fraction
+from typing import List, Optional, Tuple
+
+# Coeficientes en orden DESCENDENTE: (a_n, ..., a_1, a_0), listos para Horner.
+Coefs = Tuple[Fraction, ...]
+
+GRADO_MAX = 500
+BITS_MAX = 8192 # Tamaño de los coeficientes de una potencia; más allá, eval (float) se encarga
+
+def _sumar(p, q):
+    if len(p) < len(q): p, q = q, p
+    r = list(p)
+    for i, c in enumerate(q): r[i] += c
+    return r
+
+def _mult(p, q):
+    r = [Fraction(0)] * (len(p) + len(q) - 1)
+    for i, a in enumerate(p):
+        if a == 0: continue
+        for j, b in enumerate(q): r[i + j] += a * b
+    return r
+
+def _recortar(p):
+    while len(p) > 1 and p[-1] == 0: p.pop()
+    return p
+
+def _poli_de_nodo(n):
+    """Recorre el AST y devuelve los coeficientes ASCENDENTES, o None si no es polinomio en x."""
+    if isinstance(n, ast.Expression): return _poli_de_nodo(n.body)
+    if isinstance(n, ast.Constant) and type(n.value) in (int, float):
+        return [Fraction(repr(n.value)) if isinstance(n.value, float) else Fraction(n.value)]
+    if isinstance(n, ast.Name): return [Fraction(0), Fraction(1)] if n.id == "x" else None
+    if isinstance(n, ast.UnaryOp) and isinstance(n.op, (ast.USub, ast.UAdd)):
+        p = _poli_de_nodo(n.operand)
+        if p is None: return None
+        return [-c for c in p] if isinstance(n.op, ast.USub) else p
+    if not isinstance(n, ast.BinOp): return None
+
+    p = _poli_de_nodo(n.left)
+    if p is None: return None
+    if isinstance(n.op, ast.Pow):
+        # Solo exponentes enteros no negativos y constantes
+        q = _poli_de_nodo(n.right)
+        if q is None or len(_recortar(q)) != 1 or q[0].denominator != 1 or q[0] < 0: return None
+        k = int(q[0])
+        p = _recortar(p)
+        if (len(p) - 1) * k > GRADO_MAX: return None
+        bits = max(max(c.numerator.bit_length(), c.denominator.bit_length()) for c in p)
+        if k * max(bits, len(p).bit_length()) > BITS_MAX: return None # 1^5000000 cabe; 2**200000 no
+        if len(p) == 1: return [p[0] ** k]
+        r = [Fraction(1)]
+        while k: # Cuadrados sucesivos: log2(k) productos en lugar de k
+            if k & 1: r = _mult(r, p)
+            k >>= 1
+            if k: p = _mult(p, p)
+        return r
+    q = _poli_de_nodo(n.right)
+    if q is None: return None
+    if isinstance(n.op, ast.Add): return _sumar(p, q)
+    if isinstance(n.op, ast.Sub): return _sumar(p, [-c for c in q])
+    if isinstance(n.op, ast.Mult):
+        r = _mult(p, q)
+        return r if len(r) - 1 <= GRADO_MAX else None
+    if isinstance(n.op, ast.Div):
+        q = _recortar(q)
+        if len(q) != 1 or q[0] == 0: return None # Dividir por algo con x no es polinomio
+        return [c / q[0] for c in p]
+    return None
+
+def coeficientes_polinomio(expr_py: str) -> Optional[Coefs]:
+    """Detecta si una expresión YA PREPROCESADA es un polinomio en x y extrae sus coeficientes exactos."""
+    try: arbol = ast.parse(expr_py, mode="eval")
+    except SyntaxError: return None
+    p = _poli_de_nodo(arbol)
+    if p is None: return None
+    return tuple(reversed(_recortar(p)))
+
+def derivar(coefs: Coefs) -> Coefs:
+    n = len(coefs) - 1
+    if n == 0: return (Fraction(0),)
+    return tuple(c * (n - i) for i, c in enumerate(coefs[:-1]))
+
+def horner(coefs, x):
+    p = coefs[0]
+    for c in coefs[1:]: p = p * x + c
+    return p
+
+def horner_con_derivada(coefs, x):
+    """Evalúa p(x) y p'(x) en una sola pasada."""
+    p, dp = coefs[0], 0 * x
+    for c in coefs[1:]:
+        dp = dp * x + p
+        p = p * x + c
+    return p, dp
+
+# --- TODAS LAS RAÍCES (Aberth-Ehrlich) ---
+
+def aberth(coefs, tol=1e-12, max_iter=500):
+    """
+    Aproxima simultáneamente todas las raíces complejas. Cada iteración es vectorial:
+    p(z)/p'(z) para todas las aproximaciones y la corrección de Aberth con la matriz 1/(zi-zj).
+    Devuelve (raices, reg).
+    """
+    import numpy as np # Diferido: solo se necesita para el resolvedor de todas las raíces
+
+    c = [complex(v) for v in coefs]
+    while len(c) > 1 and c[0] == 0: c.pop(0)
+    ceros = 0
+    while len(c) > 1 and c[-1] == 0: # Raíces en 0: se factoriza x^k
+        c.pop(); ceros += 1
+    n = len(c) - 1
+    reg = []
+    if n <= 0: return [0j] * ceros, reg
+
+    a = np.array(c, dtype=complex) / c[0]
+    da = a[:-1] * np.arange(n, 0, -1)
+    # Aproximaciones iniciales en el círculo de la cota de Fujiwara, desfasadas para romper simetrías
+    radio = 2 * float(np.max(np.abs(a[1:]) ** (1 / np.arange(1, n + 1)))) or 1.0
+    z = radio * np.exp(1j * (2 * np.pi * np.arange(n) / n + 0.4))
+
+    for k in range(1, max_iter + 1):
+        pz, dpz = np.polyval(a, z), np.polyval(da, z)
+        with np.errstate(all='ignore'):
+            cociente = pz / dpz
+            dif = z[:, None] - z[None, :]
+            np.fill_diagonal(dif, 1)
+            inv = 1 / dif
+            np.fill_diagonal(inv, 0)
+            w = cociente / (1 - cociente * inv.sum(axis=1))
+        w = np.where(np.isfinite(w), w, 0)
+        w = np.where(pz == 0, 0, w)
+        z = z - w
+        corr = float(np.max(np.abs(w)))
+        listas = int(np.sum(np.abs(w) <= tol * np.maximum(1, np.abs(z))))
+        reg.append({'iter': k, 'max_correccion': corr, 'convergidas': listas})
+        if listas == n: break
+
+    raices = [complex(r) for r in z] + [0j] * ceros
+    raices.sort(key=lambda r: (round(r.real, 12), r.imag))
+    return raices, reg
+
+# --- SECUENCIAS DE STURM (exactas) ---
+
+def _resto(p: List[Fraction], q: List[Fraction]) -> List[Fraction]:
+    """Resto de p / q con coeficientes descendentes."""
+    p = list(p)
+    while len(p) >= len(q) and any(p):
+        f = p[0] / q[0]
+        for i in range(len(q)): p[i] -= f * q[i]
+        p.pop(0)
+    while len(p) > 1 and p[0] == 0: p.pop(0)
+    return p
+
+def secuencia_sturm(coefs: Coefs) -> List[List[Fraction]]:
+    seq = [list(coefs), list(derivar(coefs))]
+    while len(seq[-1]) > 1: # Termina al llegar a una constante
+        r = _resto(seq[-2], seq[-1])
+        if not any(r): break
+        seq.append([-c for c in r])
+    return seq
+
+def _cambios_signo(seq, x) -> int:
+    signos = [s for s in (horner(p, x) for p in seq) if s != 0]
+    return sum(1 for u, v in zip(signos, signos[1:]) if (u > 0) != (v > 0))
+
+def contar_raices_sturm(coefs: Coefs, a, b) -> int:
+    """Número de raíces reales DISTINTAS en (a, b]."""
+    a, b = Fraction(str(a)), Fraction(str(b))
+    if a > b: a, b = b, a
+    seq = secuencia_sturm(coefs)
+    return _cambios_signo(seq, a) - _cambios_signo(seq, b)
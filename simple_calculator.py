@@ -4,6 +4,8 @@ import math
 from fractions import Fraction
 from typing import List, Optional, Union
 
+from exact_eval import EvaluadorIncremental, aproximar, exacto_corto, comprobar_tamano
+
 # Constantes para superíndices y subíndices (Estética)
 SUPERSCRIPT_MAP = {"0": "⁰", "1": "¹", "2": "²", "3": "³", "4": "⁴", "5": "⁵", "6": "⁶", "7": "⁷", "8": "⁸", "9": "⁹", "+": "⁺", "-": "⁻", "(": "⁽", ")": "⁾"}
 SUBSCRIPT_MAP = {"0": "₀", "1": "₁", "2": "₂", "3": "₃", "4": "₄", "5": "₅", "6": "₆", "7": "₇", "8": "₈", "9": "₉", "+": "₊", "-": "₋", "(": "₍", ")": "₎"}
@@ -25,7 +27,9 @@ class SimpleCalculator(tk.Frame):
         self.display_var = tk.StringVar(value="0")
         self.expression_var = tk.StringVar(value="")
         self.current_entry = ""
-        self.expression_tokens: List[str] = []
+        self.expression_tokens: List[str] = [] # Texto de cada token, solo para mostrar
+        self.expr = EvaluadorIncremental()
+        self.valor_entrada: Optional[Fraction] = None
         self.last_was_result = False
 
         self._create_ui()
@@ -107,128 +111,151 @@ class SimpleCalculator(tk.Frame):
         elif char in ('(', ')'): self._parenthesis(char)
 
     # --- Lógica de Calculadora ---
+    # La expresión vive en un EvaluadorIncremental (Fraction, sin eval): cada número u
+    # operador se integra al pulsarlo y la vista previa sale de sus pilas en cada tecla.
+    def _operando(self) -> Optional[Fraction]:
+        """Número en curso: lo tecleado o el resultado de √, x², 1/x."""
+        if self.valor_entrada is not None: return self.valor_entrada
+        if self.current_entry not in ("", "-", "."): return Fraction(self.current_entry)
+        return None
+
     def _update_display(self):
-        self.display_var.set(self.current_entry if self.current_entry else "0")
+        if self.valor_entrada is not None: self.display_var.set(self._formatear(self.valor_entrada))
+        else: self.display_var.set(self.current_entry if self.current_entry else "0")
+        self._actualizar_vista_previa()
 
-    def _add_digit(self, digit):
+    def _formatear(self, valor: Fraction) -> str:
+        return exacto_corto(valor) and format_fraction_unicode(valor) or aproximar(valor)
+
+    def _actualizar_vista_previa(self):
+        expr_str = " ".join(self.expression_tokens).replace('*', '×').replace('/', '÷')
+        if len(expr_str) > 60: expr_str = "…" + expr_str[-59:] # Expresiones largas: solo la cola
+        try: previa = self.expr.vista_previa(self._operando()) if self.expression_tokens else None
+        except ValueError: previa = None
+        if previa is not None:
+            txt = self._formatear(previa)
+            aprox = aproximar(previa)
+            expr_str += f"   = {txt}" + (f" ≈ {aprox}" if previa.denominator != 1 and aprox != txt else "")
+        self.expression_var.set(expr_str)
+
+    def _nuevo_numero(self):
         if self.last_was_result:
-            self.current_entry = ""
+            self.current_entry, self.valor_entrada = "", None
             self.last_was_result = False
+
+    def _add_digit(self, digit):
+        self._nuevo_numero()
+        if self.valor_entrada is not None: return
         if self.current_entry == "0": self.current_entry = digit
         else: self.current_entry += digit
         self._update_display()
 
     def _add_decimal(self):
-        if self.last_was_result:
-            self.current_entry = "0"
-            self.last_was_result = False
+        self._nuevo_numero()
+        if self.valor_entrada is not None: return
         if "." not in self.current_entry:
             self.current_entry += "." if self.current_entry else "0."
         self._update_display()
 
     def _clear(self):
         self.current_entry = ""
+        self.valor_entrada = None
         self.expression_tokens = []
+        self.expr = EvaluadorIncremental()
+        self.last_was_result = False
         self.expression_var.set("")
         self._update_display()
 
     def _backspace(self):
         if self.last_was_result: return
-        self.current_entry = self.current_entry[:-1]
+        if self.valor_entrada is not None: self.valor_entrada = None
+        elif self.current_entry: self.current_entry = self.current_entry[:-1]
+        elif self.expression_tokens: # Sin número en curso: quitar el último token de la expresión
+            self.expr.deshacer(); self.expression_tokens.pop()
         self._update_display()
 
+    def _empujar(self, token, texto):
+        """Agrega un token al evaluador; si es inválido muestra Error y reinicia."""
+        try: self.expr.agregar(token)
+        except ValueError as e:
+            self._error(str(e))
+            return False
+        self.expression_tokens.append(texto)
+        return True
+
+    def _empujar_operando(self):
+        v = self._operando()
+        if v is None: return True
+        texto = self.current_entry if self.valor_entrada is None else self._formatear(v)
+        self.current_entry, self.valor_entrada = "", None
+        return self._empujar(v, texto)
+
     def _set_operator(self, op):
-        if self.current_entry:
-            self.expression_tokens.append(self.current_entry)
-            self.current_entry = ""
-        elif self.last_was_result and self.display_var.get() != "Error":
-             # Usar resultado anterior si se presiona operador directo
-             self.expression_tokens.append(self.display_var.get())
-             self.last_was_result = False
-        
-        # Reemplazar operador si se presiona otro seguido
-        if self.expression_tokens and self.expression_tokens[-1] in ('+', '-', '*', '/'):
-            self.expression_tokens.pop()
-        
-        op_map = {'×': '*', '÷': '/'}
-        self.expression_tokens.append(op_map.get(op, op))
-        
-        # Actualizar visor superior
-        expr_str = " ".join(self.expression_tokens).replace('*', '×').replace('/', '÷')
-        self.expression_var.set(expr_str)
+        op = {'×': '*', '÷': '/'}.get(op, op)
+        if self.last_was_result: self.last_was_result = False # Encadenar con el resultado anterior
+        if not self._empujar_operando(): return
+        # Reemplazar operador si se presiona otro seguido (salvo el signo de un número)
+        if self.expression_tokens and self.expression_tokens[-1] in ('+', '-', '*', '/') and not (op == '-' and self.expression_tokens[-1] in ('*', '/')):
+            self.expr.deshacer(); self.expression_tokens.pop()
+        self._empujar(op, op)
+        self._update_display()
 
     def _calculate(self):
-        if self.current_entry:
-            self.expression_tokens.append(self.current_entry)
-        
+        if not self._empujar_operando(): return
         if not self.expression_tokens: return
+        try: resultado = self.expr.resultado()
+        except ValueError as e: return self._error(str(e))
+        self.expression_var.set(" ".join(self.expression_tokens).replace('*', '×').replace('/', '÷')[-60:] + " =")
+        self.expression_tokens = []
+        self.expr = EvaluadorIncremental()
+        self.current_entry, self.valor_entrada = "", resultado
+        self.display_var.set(self._formatear(resultado))
+        self.last_was_result = True
 
-        try:
-            expr = "".join(self.expression_tokens)
-            # Evaluar con Fractions para precisión
-            # Reemplazamos números decimales por Fractions strings
-            # Nota: eval es peligroso en general, pero aquí controlamos los tokens
-            # Una implementación robusta usaría un parser propio, 
-            # pero para este demo usamos eval con cuidado.
-            
-            # Truco simple: Convertir todo a float para visualización rápida
-            # O usar Fractions si quieres precisión exacta
-            resultado = eval(expr) 
-            
-            # Formatear
-            if isinstance(resultado, float):
-                if resultado.is_integer(): resultado = int(resultado)
-                else: resultado = round(resultado, 10)
-            
-            self.current_entry = str(resultado)
-            self.display_var.set(self.current_entry)
-            self.expression_var.set(self.expression_var.get() + " =")
-            self.expression_tokens = []
-            self.last_was_result = True
-
-        except Exception:
-            self.display_var.set("Error")
-            self.current_entry = ""
-            self.expression_tokens = []
+    def _error(self, msg="Error"):
+        self.display_var.set("Error")
+        self.expression_var.set(msg)
+        self.current_entry, self.valor_entrada = "", None
+        self.expression_tokens = []
+        self.expr = EvaluadorIncremental()
 
     def _toggle_sign(self):
-        if self.current_entry:
+        if self.valor_entrada is not None:
+            self.valor_entrada = -self.valor_entrada
+        elif self.current_entry:
             if self.current_entry.startswith("-"): self.current_entry = self.current_entry[1:]
             else: self.current_entry = "-" + self.current_entry
-            self._update_display()
+        self._update_display()
 
-    def _sqrt(self):
+    def _aplicar_funcion(self, f):
+        """√, x², 1/x sobre el número en curso (o el último resultado), en exacto."""
         try:
-            val = float(self.current_entry or self.display_var.get())
-            if val < 0: raise ValueError
-            res = math.sqrt(val)
-            self.current_entry = str(int(res) if res.is_integer() else round(res, 8))
-            self.last_was_result = True
+            v = self._operando()
+            if v is None: return
+            self.valor_entrada, self.current_entry = f(v), ""
+            self.last_was_result = False
             self._update_display()
-        except: self.display_var.set("Error")
+        except (ValueError, OverflowError) as e: self._error(str(e) or "Error")
+
+    def _sqrt(self):
+        def raiz(v):
+            if v < 0: raise ValueError("Raíz de un número negativo")
+            n, d = math.isqrt(v.numerator), math.isqrt(v.denominator)
+            if n * n == v.numerator and d * d == v.denominator: return Fraction(n, d) # Cuadrado perfecto: exacto
+            return Fraction(repr(math.sqrt(v)))
+        self._aplicar_funcion(raiz)
 
     def _square(self):
-        try:
-            val = float(self.current_entry or self.display_var.get())
-            res = val ** 2
-            self.current_entry = str(int(res) if res.is_integer() else round(res, 8))
-            self.last_was_result = True
-            self._update_display()
-        except: self.display_var.set("Error")
+        self._aplicar_funcion(lambda v: comprobar_tamano(v * v))
 
     def _reciprocal(self):
-        try:
-            val = float(self.current_entry or self.display_var.get())
-            if val == 0: raise ValueError
-            res = 1 / val
-            self.current_entry = str(int(res) if res.is_integer() else round(res, 8))
-            self.last_was_result = True
-            self._update_display()
-        except: self.display_var.set("Error")
+        def inverso(v):
+            if v == 0: raise ValueError("División por cero")
+            return 1 / v
+        self._aplicar_funcion(inverso)
         
     def _parenthesis(self, char):
-        if self.current_entry:
-            self.expression_tokens.append(self.current_entry)
-            self.current_entry = ""
-        self.expression_tokens.append(char)
-        self.expression_var.set(" ".join(self.expression_tokens))
\ No newline at end of file
+        self._nuevo_numero() # Tras '=' un paréntesis empieza otra expresión
+        if not self._empujar_operando(): return
+        self._empujar(char, char)
+        self._update_display()
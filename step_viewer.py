@@ -0,0 +1,166 @@
+import tkinter as tk
+from tkinter import ttk
+from array import array
+from bisect import bisect_left
+
+# Visor del procedimiento: el Text solo contiene la página visible. Los pasos se leen
+# de la lista del solver al pintar cada página y el filtro es un array de índices
+# (4 bytes por paso), así que la memoria del visor no crece con la traza.
+
+POR_PAGINA = 40
+MAX_CARACTERES_PASO = 20_000 # Un paso con una matriz enorme se recorta; se puede expandir
+
+# Clasificación por el texto que generan matrix_ops (ref, rref, determinante)
+TIPOS = {
+    "Todos": None,
+    "Intercambios": "intercambio",
+    "Escalados": "escala",
+    "Eliminaciones": "eliminacion",
+    "Otros": "otro",
+}
+
+def tipo_paso(paso) -> str:
+    # Los PasoMatriz de matrix_ops se clasifican por su título, sin formatear la matriz
+    inicio = getattr(paso, "titulo", None) or str(paso)
+    inicio = inicio.lstrip()[:40]
+    if "Intercambio" in inicio: return "intercambio"
+    if inicio.startswith("➗") or "Pivote=1" in inicio: return "escala"
+    if inicio.startswith("➖"): return "eliminacion"
+    return "otro"
+
+class VisorPasos(tk.Toplevel):
+    """
+    Páginas de POR_PAGINA pasos con ◀ ▶, salto a un número de paso, filtro por tipo de
+    operación y búsqueda (Enter: siguiente, Shift+Enter: anterior).
+    """
+    def __init__(self, parent, pasos, titulo="Procedimiento"):
+        super().__init__(parent)
+        self.title(titulo); self.geometry("760x560")
+        self.pasos = pasos
+        self.indices = array("I", range(len(pasos)))
+        self.pagina = 0
+        self.expandidos = set() # Pasos recortados que el usuario pidió ver completos
+        self._hallado = None # Posición (en self.indices) de la última coincidencia
+
+        barra = tk.Frame(self, bg="#f1f3f5", padx=5, pady=4); barra.pack(fill=tk.X)
+        tk.Button(barra, text="⏮", command=lambda: self._ir_pagina(0), bd=0).pack(side=tk.LEFT)
+        tk.Button(barra, text="◀", command=lambda: self._ir_pagina(self.pagina - 1), bd=0).pack(side=tk.LEFT)
+        tk.Button(barra, text="▶", command=lambda: self._ir_pagina(self.pagina + 1), bd=0).pack(side=tk.LEFT)
+        tk.Button(barra, text="⏭", command=lambda: self._ir_pagina(self._n_paginas() - 1), bd=0).pack(side=tk.LEFT)
+        tk.Label(barra, text="Paso:", bg="#f1f3f5").pack(side=tk.LEFT, padx=(10, 2))
+        self.ent_paso = tk.Entry(barra, width=7); self.ent_paso.pack(side=tk.LEFT)
+        self.ent_paso.bind("<Return>", lambda e: self._ir_paso())
+
+        tk.Label(barra, text="Tipo:", bg="#f1f3f5").pack(side=tk.LEFT, padx=(10, 2))
+        self.tipo = tk.StringVar(value="Todos")
+        cb = ttk.Combobox(barra, textvariable=self.tipo, values=list(TIPOS), state="readonly", width=13)
+        cb.pack(side=tk.LEFT); cb.bind("<<ComboboxSelected>>", lambda e: self._filtrar())
+
+        tk.Label(barra, text="Buscar:", bg="#f1f3f5").pack(side=tk.LEFT, padx=(10, 2))
+        self.ent_buscar = tk.Entry(barra, width=16); self.ent_buscar.pack(side=tk.LEFT)
+        self.ent_buscar.bind("<Return>", lambda e: self._buscar(1))
+        self.ent_buscar.bind("<Shift-Return>", lambda e: self._buscar(-1))
+        self.lbl = tk.Label(self, text="", bg="white", fg="#666", anchor="w"); self.lbl.pack(fill=tk.X, padx=5)
+
+        marco = tk.Frame(self); marco.pack(fill=tk.BOTH, expand=True)
+        self.txt = tk.Text(marco, font=("Consolas", 10), padx=10, pady=10, wrap="none")
+        sy = ttk.Scrollbar(marco, orient="vertical", command=self.txt.yview)
+        sx = ttk.Scrollbar(marco, orient="horizontal", command=self.txt.xview)
+        self.txt.config(yscrollcommand=sy.set, xscrollcommand=sx.set)
+        sy.pack(side=tk.RIGHT, fill=tk.Y); sx.pack(side=tk.BOTTOM, fill=tk.X)
+        self.txt.pack(fill=tk.BOTH, expand=True)
+        self.txt.tag_config("cab", font=("Consolas", 10, "bold"), foreground="#0d6efd")
+        self.txt.tag_config("mas", foreground="#0d6efd", underline=True)
+        self.txt.tag_config("hallado", background="#ffe066")
+        self.txt.tag_config("actual", background="#fd7e14")
+        self.bind("<Alt-Left>", lambda e: self._ir_pagina(self.pagina - 1))
+        self.bind("<Alt-Right>", lambda e: self._ir_pagina(self.pagina + 1))
+        self._pintar()
+
+    def _n_paginas(self): return max(1, -(-len(self.indices) // POR_PAGINA))
+
+    def _pintar(self, resaltar=None):
+        """Rellena el Text con la página actual; resaltar = índice de paso a mostrar."""
+        t = self.txt
+        t.config(state="normal"); t.delete("1.0", tk.END)
+        # Marcas y etiquetas de la página anterior (sobreviven al delete)
+        marcas = [m for m in t.mark_names() if m[0] == "p" and m[1:].isdigit()]
+        if marcas: t.mark_unset(*marcas)
+        for tag in t.tag_names():
+            if tag.startswith("mas") and tag != "mas": t.tag_delete(tag)
+        desde = self.pagina * POR_PAGINA
+        visibles = self.indices[desde:desde + POR_PAGINA]
+        for k in visibles:
+            texto = str(self.pasos[k])
+            t.mark_set(f"p{k}", "end-1c"); t.mark_gravity(f"p{k}", "left")
+            t.insert(tk.END, f"Paso {k + 1}\n", "cab")
+            if len(texto) > MAX_CARACTERES_PASO and k not in self.expandidos:
+                t.insert(tk.END, texto[:MAX_CARACTERES_PASO] + "\n")
+                etiqueta = f"mas{k}"
+                t.insert(tk.END, f"… {len(texto) - MAX_CARACTERES_PASO} caracteres más (clic para ver completo)\n", ("mas", etiqueta))
+                t.tag_bind(etiqueta, "<Button-1>", lambda e, k=k: self._expandir(k))
+            else: t.insert(tk.END, texto + "\n")
+            t.insert(tk.END, "-" * 40 + "\n")
+        self._marcar_busqueda()
+        t.config(state="disabled")
+        if resaltar is not None: t.see(f"p{resaltar}")
+        n, total = len(self.indices), len(self.pasos)
+        rango = f"pasos {visibles[0] + 1}–{visibles[-1] + 1}" if visibles else "sin pasos"
+        filtro = f" · {n} de {total} con el filtro" if n != total else f" · {total} en total"
+        self.lbl.config(text=f"Página {self.pagina + 1} de {self._n_paginas()} · {rango}{filtro}")
+
+    def _marcar_busqueda(self):
+        t, patron = self.txt, self.ent_buscar.get()
+        t.tag_remove("hallado", "1.0", tk.END)
+        if not patron: return
+        pos, n = "1.0", tk.IntVar()
+        while True:
+            pos = t.search(patron, pos, tk.END, nocase=True, count=n)
+            if not pos: break
+            fin = f"{pos}+{n.get()}c"
+            t.tag_add("hallado", pos, fin)
+            pos = fin
+
+    def _ir_pagina(self, p, resaltar=None):
+        self.pagina = max(0, min(p, self._n_paginas() - 1))
+        self._pintar(resaltar)
+
+    def _expandir(self, k):
+        self.expandidos.add(k)
+        self._pintar(resaltar=k)
+
+    def _ir_paso(self):
+        """Salta al paso con ese número; si el filtro lo oculta, al siguiente visible."""
+        try: k = int(self.ent_paso.get()) - 1
+        except ValueError: return
+        pos = bisect_left(self.indices, k) # Los índices están ordenados
+        if pos < len(self.indices): self._ir_pagina(pos // POR_PAGINA, resaltar=self.indices[pos])
+
+    def _filtrar(self):
+        tipo = TIPOS[self.tipo.get()]
+        if tipo is None: self.indices = array("I", range(len(self.pasos)))
+        else: self.indices = array("I", (k for k, p in enumerate(self.pasos) if tipo_paso(p) == tipo))
+        self._hallado = None
+        self._ir_pagina(0)
+
+    def _buscar(self, direccion):
+        """Siguiente (o anterior) paso del filtro que contiene el texto, desde la página actual."""
+        patron = self.ent_buscar.get().lower()
+        if not patron: return "break"
+        n = len(self.indices)
+        if n == 0: return "break"
+        inicio = self._hallado
+        if inicio is None or not (self.pagina * POR_PAGINA <= inicio < (self.pagina + 1) * POR_PAGINA):
+            inicio = self.pagina * POR_PAGINA - direccion # Primera (o última) posición de esta página
+            if direccion < 0: inicio = min(n, (self.pagina + 1) * POR_PAGINA)
+        for paso in range(1, n + 1):
+            pos = (inicio + direccion * paso) % n
+            if patron in str(self.pasos[self.indices[pos]]).lower():
+                self._hallado = pos
+                self._ir_pagina(pos // POR_PAGINA, resaltar=self.indices[pos])
+                k = self.indices[pos]
+                self.txt.tag_remove("actual", "1.0", tk.END)
+                self.txt.tag_add("actual", f"p{k}", f"p{k} lineend")
+                return "break"
+        self.lbl.config(text=f"'{self.ent_buscar.get()}' no aparece en los pasos filtrados")
+        return "break"
@@ -0,0 +1,112 @@
+import math
+from array import array
+from typing import Dict, Iterator, Sequence
+
+NAN = float("nan")
+
+class Traza:
+    """
+    Registro de iteraciones en columnas (un array('d') por campo).
+    Agregar una fila cuesta unos pocos append de floats; la vista de diccionarios
+    (t[i], for paso in t) se construye solo cuando la UI la pide.
+    Los textos ("Derivada 0", "Error Mat.") se guardan aparte, indexados por fila.
+    """
+    __slots__ = ("columnas", "datos", "notas", "activa", "observador", "iteraciones")
+
+    def __init__(self, columnas: Sequence[str] = (), activa=True, observador=None):
+        self.activa = activa
+        self.observador = observador # Callable(dict) invocado por fila (progreso / cancelación)
+        self.iteraciones = 0
+        self.notas: Dict[int, Dict[str, str]] = {}
+        self.definir(columnas)
+
+    def definir(self, columnas: Sequence[str]):
+        self.columnas = tuple(columnas)
+        self.datos = [array("d") for _ in self.columnas]
+
+    def agregar(self, *valores):
+        """Una fila con los valores en el orden de `columnas` (None = campo ausente)."""
+        self.iteraciones += 1
+        if self.activa:
+            fila = len(self.datos[0]) if self.datos else 0
+            for j, v in enumerate(valores):
+                if v is None: v = NAN
+                elif isinstance(v, str):
+                    self.notas.setdefault(fila, {})[self.columnas[j]] = v
+                    v = NAN
+                self.datos[j].append(v)
+            for col in self.datos[len(valores):]: col.append(NAN)
+        if self.observador is not None: self.observador(self._fila_dict(valores))
+
+    def _fila_dict(self, valores):
+        d = {}
+        for nombre, v in zip(self.columnas, valores):
+            if v is None: continue
+            d[nombre] = int(v) if nombre == "iter" else v
+        return d
+
+    # --- Vista de lista de diccionarios (compatibilidad con reg) ---
+    def __len__(self): return len(self.datos[0]) if self.activa and self.datos else 0
+
+    def __getitem__(self, i):
+        if isinstance(i, slice): return [self[k] for k in range(*i.indices(len(self)))]
+        n = len(self)
+        if i < 0: i += n
+        if not 0 <= i < n: raise IndexError("índice de traza fuera de rango")
+        notas = self.notas.get(i, {})
+        d = {}
+        for nombre, col in zip(self.columnas, self.datos):
+            if nombre in notas: d[nombre] = notas[nombre]
+            elif not math.isnan(col[i]): d[nombre] = int(col[i]) if nombre == "iter" else col[i]
+        return d
+
+    def __iter__(self) -> Iterator[dict]:
+        for i in range(len(self)): yield self[i]
+
+    def __repr__(self): return f"Traza({len(self)} filas, columnas={self.columnas})"
+
+    def columna(self, nombre: str) -> array:
+        return self.datos[self.columnas.index(nombre)]
+
+    def a_numpy(self):
+        """Arreglo estructurado de NumPy (sin copiar fila por fila)."""
+        import numpy as np
+        out = np.empty(len(self), dtype=[(c, "f8") for c in self.columnas])
+        for nombre, col in zip(self.columnas, self.datos):
+            out[nombre] = np.frombuffer(col, dtype="f8") if len(col) else []
+        return out
+
+def nueva_traza(traza, columnas: Sequence[str]) -> Traza:
+    """Normaliza el parámetro `traza` de los métodos: True/False o una Traza ya creada."""
+    if isinstance(traza, Traza):
+        traza.definir(columnas)
+        return traza
+    return Traza(columnas, activa=bool(traza))
+
+# --- DIAGNÓSTICO DE CONVERGENCIA ---
+
+def diagnosticar_convergencia(traza: Traza, campo="error", ventana=5, umbral_estancamiento=0.95) -> dict:
+    """
+    Estima el orden q y la constante asintótica λ de e_{k+1} ≈ λ·e_k^q a partir
+    de los errores registrados, y detecta estancamiento (el error deja de bajar entre ventanas).
+    """
+    errores = [e for e in traza.columna(campo) if math.isfinite(e) and e > 0] if len(traza) else []
+    diag = {'iteraciones': traza.iteraciones, 'orden': None, 'constante': None, 'estancado': False}
+    if len(errores) >= 3:
+        estimaciones = []
+        for k in range(1, len(errores) - 1):
+            num = math.log(errores[k + 1] / errores[k])
+            den = math.log(errores[k] / errores[k - 1])
+            if den != 0: estimaciones.append(num / den)
+        # Las últimas estimaciones son las asintóticas; la mediana filtra el ruido
+        ultimas = sorted(estimaciones[-ventana:])
+        if ultimas:
+            q = ultimas[len(ultimas) // 2]
+            diag['orden'] = q
+            try: diag['constante'] = errores[-1] / errores[-2] ** q
+            except (OverflowError, ZeroDivisionError): pass
+    if len(errores) >= 2 * ventana:
+        # Sin progreso: el mejor error de la última ventana no mejora al de la anterior
+        previo, ultimo = min(errores[-2 * ventana:-ventana]), min(errores[-ventana:])
+        diag['estancado'] = ultimo > previo * umbral_estancamiento ** ventana
+    return diag
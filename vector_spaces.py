@@ -0,0 +1,84 @@
+from fractions import Fraction
+from typing import List, NamedTuple, Tuple
+
+from matrix_ops import Matriz, fmt_val, rango_completo, rref, transpuesta
+
+# Subespacios de una matriz a partir de una sola RREF: rango, columnas pivote, base
+# del espacio columna, base del espacio nulo y relaciones de dependencia entre
+# columnas. Las columnas libres de la RREF dicen todo: la columna libre f vale
+# Σ R[i][f] · (columna del pivote i), y de ahí sale un vector del núcleo.
+
+class Espacios(NamedTuple):
+    rango: int
+    pivotes: List[int] # Índices de las columnas pivote
+    base_columnas: List[List[Fraction]] # Columnas originales en los pivotes
+    base_nulo: List[List[Fraction]] # Un vector por columna libre
+    relaciones: List[Tuple[int, List[Tuple[int, Fraction]]]] # (libre, [(pivote, coeficiente)])
+    base_filas: Matriz # Filas no nulas de la RREF
+
+def espacios(A: Matriz, progreso=None):
+    """(Espacios, pasos) de A (m×n) con una sola eliminación."""
+    m, n = len(A), len(A[0])
+    if n <= m and rango_completo(A):
+        # Columnas independientes certificadas en flotante: la RREF sería [I; 0] y no hay núcleo
+        unos = [[Fraction(int(i == j)) for j in range(n)] for i in range(n)]
+        return (Espacios(n, list(range(n)), [[fila[j] for fila in A] for j in range(n)], [], [], unos),
+                [f"Filtro flotante certificado: rango {n} = número de columnas, sin RREF ni núcleo"])
+    R, pasos = rref(A, progreso)
+    pivotes, filas_piv = [], []
+    for fila in R:
+        j = next((j for j in range(n) if fila[j] != 0), None)
+        if j is not None: pivotes.append(j); filas_piv.append(fila)
+    es_pivote = set(pivotes)
+    libres = [j for j in range(n) if j not in es_pivote]
+    relaciones, base_nulo = [], []
+    for f in libres:
+        terminos = [(p, fila[f]) for p, fila in zip(pivotes, filas_piv) if fila[f] != 0]
+        relaciones.append((f, terminos))
+        x = [Fraction(0)] * n
+        x[f] = Fraction(1)
+        for p, c in terminos: x[p] = -c
+        base_nulo.append(x)
+    base_columnas = [[fila[j] for fila in A] for j in pivotes]
+    pasos.append(f"Rango {len(pivotes)} · columnas pivote: {', '.join(str(j + 1) for j in pivotes) or 'ninguna'}"
+                 f" · dimensión del núcleo: {len(libres)}")
+    return Espacios(len(pivotes), pivotes, base_columnas, base_nulo, relaciones, filas_piv), pasos
+
+def espacios_de_vectores(vectores: Matriz, progreso=None):
+    """Igual que espacios() pero con los vectores como filas: se analiza su transpuesta."""
+    return espacios(transpuesta(vectores)[0], progreso)
+
+def formatear_relacion(libre, terminos, nombre="v") -> str:
+    """(2, [(0, 2), (1, -1)]) -> 'v3 = 2·v1 - v2'."""
+    if not terminos: return f"{nombre}{libre + 1} = 0"
+    texto = ""
+    for p, c in terminos:
+        termino = ("" if abs(c) == 1 else f"{fmt_val(abs(c))}·") + f"{nombre}{p + 1}"
+        if not texto: texto = f"-{termino}" if c < 0 else termino
+        else: texto += f" {'-' if c < 0 else '+'} {termino}"
+    return f"{nombre}{libre + 1} = {texto}"
+
+def ortonormalizar(vectores, tol=1e-10):
+    """
+    Gram-Schmidt modificado vectorizado (con una segunda pasada: "dos veces basta").
+    vectores: k vectores de dimensión d (filas). Devuelve (Q, usados): Q es d×r con
+    columnas ortonormales y `usados` los índices de los vectores que aportaron
+    dirección; los casi dependientes (norma residual < tol·norma máxima) se descartan.
+    """
+    import numpy as np # Diferido, como en el resto de las vías flotantes
+    V = np.array(vectores, dtype=np.float64).T.copy() # Columnas = vectores
+    if V.size == 0: return np.zeros((V.shape[0], 0)), []
+    escala = float(np.max(np.linalg.norm(V, axis=0))) or 1.0
+    Q, usados = [], []
+    for j in range(V.shape[1]):
+        v = V[:, j]
+        if Q: # Segunda pasada contra la base aceptada: corrige lo que perdió la cancelación
+            B = np.column_stack(Q)
+            v = v - B @ (B.T @ v)
+        norma = float(np.linalg.norm(v))
+        if norma <= tol * escala: continue
+        q = v / norma
+        Q.append(q); usados.append(j)
+        # MGS: quitar la componente q de todos los vectores restantes de una vez
+        V[:, j + 1:] -= np.outer(q, q @ V[:, j + 1:])
+    return (np.column_stack(Q) if Q else np.zeros((V.shape[0], 0))), usados
@@ -1,14 +1,26 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
 from fractions import Fraction
+import os
 import random
 
 from matrix_ops import (
     sumar_matrices_dos, restar_matrices_dos, multiplicar_matrices,
     transpuesta, determinante, matriz_inversa, rango_matriz,
-    regla_cramer, resolver_gauss, resolver_gauss_jordan, rref_con_pasos
+    regla_cramer, resolver_gauss, resolver_gauss_jordan, rref_con_pasos, fmt_val
 )
-from algebraic_fill import parsear_matriz_texto, parsear_sistema_ecuaciones
+from algebraic_fill import leer_matriz, parsear_sistema_ecuaciones, parsear_sistema_disperso
+from job_runner import EjecutorTareas
+from matrix_io import cargar_matriz, cargar_arreglo, guardar_matriz, leer_mtx_disperso, TIPOS_ARCHIVO
+from least_squares import resolver_minimos_cuadrados
+from iterative_solvers import METODOS_ITERATIVOS, MatrizDispersa, informe_iterativo
+from traces import Traza
+from vector_spaces import espacios_de_vectores, formatear_relacion, ortonormalizar
+from matrix_grid import RejillaMatriz, parsear_celda
+from step_viewer import VisorPasos
+from matrix_expr import CacheResultados, evaluar, separar_asignacion
+
+MAX_DIM = 1000
 
 class MatrixInput(tk.Frame):
     """Componente Grid con herramientas avanzadas de generación."""
@@ -24,6 +36,9 @@ class MatrixInput(tk.Frame):
         
         # Botón Pegar
         tk.Button(h, text="📋", command=self._importar_texto, bd=0, bg="#e2e6ea", width=3, cursor="hand2").pack(side=tk.RIGHT, padx=1)
+        # Archivos: .npy/.npz, Matrix Market, CSV y racional exacto
+        tk.Button(h, text="💾", command=self._guardar_archivo, bd=0, bg="#e2e6ea", width=3, cursor="hand2").pack(side=tk.RIGHT, padx=1)
+        tk.Button(h, text="📂", command=self._abrir_archivo, bd=0, bg="#e2e6ea", width=3, cursor="hand2").pack(side=tk.RIGHT, padx=1)
         
         # Menú Generar (Identidades y Especiales)
         mb_gen = tk.Menubutton(h, text="⚡ Generar", bd=0, bg="#d1ecf1", cursor="hand2", font=("Segoe UI", 8))
@@ -41,113 +56,95 @@ class MatrixInput(tk.Frame):
         mb_gen.pack(side=tk.RIGHT, padx=1)
 
         # Dimensiones
-        self.sf = tk.Spinbox(h, from_=1, to=8, width=2); self.sf.delete(0,"end"); self.sf.insert(0, filas_def); self.sf.pack(side=tk.RIGHT)
+        self.sf = tk.Spinbox(h, from_=1, to=MAX_DIM, width=3); self.sf.delete(0,"end"); self.sf.insert(0, filas_def); self.sf.pack(side=tk.RIGHT)
         tk.Label(h, text="x", bg="#f8f9fa").pack(side=tk.RIGHT)
-        self.sc = tk.Spinbox(h, from_=1, to=8, width=2); self.sc.delete(0,"end"); self.sc.insert(0, cols_def); self.sc.pack(side=tk.RIGHT)
+        self.sc = tk.Spinbox(h, from_=1, to=MAX_DIM, width=3); self.sc.delete(0,"end"); self.sc.insert(0, cols_def); self.sc.pack(side=tk.RIGHT)
         tk.Button(h, text="↻", command=self._gen, bd=0, bg="#e9ecef").pack(side=tk.RIGHT, padx=2)
 
-        self.grid = tk.Frame(self, bg="white", padx=5, pady=5); self.grid.pack()
-        self.ents = {}; self._gen()
+        # Rejilla virtual: solo se dibujan las celdas visibles, los valores ya son Fraction
+        self.rejilla = RejillaMatriz(self, filas_def, cols_def, al_redimensionar=self._fijar_dims)
+        self.rejilla.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+    def _dims(self):
+        return max(1, min(MAX_DIM, int(self.sf.get()))), max(1, min(MAX_DIM, int(self.sc.get())))
+
+    def _fijar_dims(self, f, c):
+        self.sf.delete(0,"end"); self.sf.insert(0, f)
+        self.sc.delete(0,"end"); self.sc.insert(0, c)
 
     def _gen(self):
-        for w in self.grid.winfo_children(): w.destroy()
-        self.ents.clear()
-        try: f, c = int(self.sf.get()), int(self.sc.get())
-        except: return
-        for i in range(f):
-            for j in range(c):
-                e = tk.Entry(self.grid, width=5, justify="center", bg="#f8f9fa")
-                e.grid(row=i, column=j, padx=1, pady=1)
-                self.ents[(i,j)] = e
+        # Conserva los valores que siguen dentro de la nueva dimensión
+        try: f, c = self._dims()
+        except ValueError: return
+        self._fijar_dims(f, c)
+        self.rejilla.redimensionar(f, c)
 
     # --- MÉTODOS DE LLENADO ---
     
     def _limpiar_ceros(self):
-        for e in self.ents.values(): e.delete(0,tk.END); e.insert(0,"0")
+        self.rejilla.llenar(lambda i, j: Fraction(0))
 
     def _hacer_identidad(self):
-        self._llenar_diagonal(val_diag="1", val_resto="0")
+        self._llenar_diagonal(val_diag=1, val_resto=0)
 
     def _hacer_escalar(self):
         k = simpledialog.askstring("Matriz Escalar", "Ingresa el valor escalar (k):", parent=self)
         if k is not None:
-            self._llenar_diagonal(val_diag=k, val_resto="0")
+            try: self._llenar_diagonal(val_diag=parsear_celda(k), val_resto=0)
+            except (ValueError, ZeroDivisionError): messagebox.showerror("Error", f"'{k}' no es un número válido.", parent=self)
 
     def _hacer_random(self):
-        try:
-            f, c = int(self.sf.get()), int(self.sc.get())
-            for i in range(f):
-                for j in range(c):
-                    val = str(random.randint(-9, 9))
-                    self.ents[(i,j)].delete(0, tk.END)
-                    self.ents[(i,j)].insert(0, val)
-        except: pass
+        self.rejilla.llenar(lambda i, j: Fraction(random.randint(-9, 9)))
 
     def _hacer_simetrica(self):
-        try:
-            f, c = int(self.sf.get()), int(self.sc.get())
-            if f != c:
-                messagebox.showwarning("Aviso", "Para ser simétrica debe ser cuadrada.")
-                return
-            # Llenar triangulo superior y copiar al inferior
-            for i in range(f):
-                for j in range(i, c):
-                    val = str(random.randint(-9, 9))
-                    # Asignar (i, j)
-                    self.ents[(i,j)].delete(0, tk.END); self.ents[(i,j)].insert(0, val)
-                    # Asignar (j, i)
-                    self.ents[(j,i)].delete(0, tk.END); self.ents[(j,i)].insert(0, val)
-        except: pass
+        M = self.rejilla.modelo
+        if M.filas != M.cols:
+            messagebox.showwarning("Aviso", "Para ser simétrica debe ser cuadrada.")
+            return
+        # Triángulo superior aleatorio, el inferior es su reflejo
+        sup = {(i, j): Fraction(random.randint(-9, 9)) for i in range(M.filas) for j in range(i, M.cols)}
+        self.rejilla.llenar(lambda i, j: sup[(min(i, j), max(i, j))])
 
     def _hacer_diagonal(self):
-        try:
-            f, c = int(self.sf.get()), int(self.sc.get())
-            for i in range(f):
-                for j in range(c):
-                    self.ents[(i,j)].delete(0, tk.END)
-                    if i == j:
-                        self.ents[(i,j)].insert(0, str(random.randint(-9, 9)))
-                    else:
-                        self.ents[(i,j)].insert(0, "0")
-        except: pass
+        self.rejilla.llenar(lambda i, j: Fraction(random.randint(-9, 9)) if i == j else Fraction(0))
 
     def _llenar_diagonal(self, val_diag, val_resto):
-        try:
-            f, c = int(self.sf.get()), int(self.sc.get())
-            for i in range(f):
-                for j in range(c):
-                    self.ents[(i,j)].delete(0, tk.END)
-                    self.ents[(i,j)].insert(0, val_diag if i == j else val_resto)
-        except: pass
+        d, r = Fraction(val_diag), Fraction(val_resto)
+        self.rejilla.llenar(lambda i, j: d if i == j else r)
 
     def _importar_texto(self):
         win = tk.Toplevel(self); win.title("Pegar")
         tk.Label(win, text="Pega aquí:").pack()
         txt = tk.Text(win, height=5, width=30); txt.pack(padx=5)
         def procesar():
-            raw = txt.get("1.0", tk.END)
-            d = parsear_matriz_texto(raw)
-            if d:
-                self.sf.delete(0,"end"); self.sf.insert(0, len(d))
-                self.sc.delete(0,"end"); self.sc.insert(0, len(d[0]))
-                self._gen()
-                for i,r in enumerate(d):
-                    for j,v in enumerate(r):
-                        if (i,j) in self.ents: self.ents[(i,j)].delete(0,tk.END); self.ents[(i,j)].insert(0,str(v))
+            try: M = leer_matriz(txt.get("1.0", tk.END))
+            except ValueError as e: return messagebox.showerror("Error", str(e), parent=win)
+            if M.irregulares:
+                detalle = ", ".join(f"fila {i+1} ({n})" for i, n in M.irregulares[:5])
+                messagebox.showwarning("Filas irregulares", f"Se esperaban {M.cols} columnas; se completaron con 0: {detalle}" + ("…" if len(M.irregulares) > 5 else ""), parent=win)
+            self._cargar(M.a_listas())
             win.destroy()
         tk.Button(win, text="Cargar", command=procesar).pack(pady=5)
 
+    def _cargar(self, d):
+        if not d: return
+        self._fijar_dims(len(d), len(d[0]))
+        self.rejilla.cargar(d)
+
+    def _abrir_archivo(self):
+        ruta = filedialog.askopenfilename(parent=self, title=f"Abrir {self.titulo}", filetypes=TIPOS_ARCHIVO)
+        if not ruta: return
+        try: self._cargar(cargar_matriz(ruta))
+        except Exception as e: messagebox.showerror("Error", f"No se pudo leer el archivo: {e}", parent=self)
+
+    def _guardar_archivo(self):
+        ruta = filedialog.asksaveasfilename(parent=self, title=f"Guardar {self.titulo}", filetypes=TIPOS_ARCHIVO[1:], defaultextension=".rat")
+        if not ruta: return
+        try: guardar_matriz(ruta, self.get())
+        except Exception as e: messagebox.showerror("Error", f"No se pudo guardar: {e}", parent=self)
+
     def get(self):
-        f, c = int(self.sf.get()), int(self.sc.get())
-        mat = []
-        for i in range(f):
-            row = []
-            for j in range(c):
-                v = self.ents[(i,j)].get().strip()
-                try: row.append(Fraction(v if v else "0"))
-                except: row.append(Fraction(0))
-            mat.append(row)
-        return mat
+        return self.rejilla.get()
 
 # --- VISTA 1: CALCULADORA UNIVERSAL ---
 class VentanaCalculadoraUniversal(tk.Frame):
@@ -155,6 +152,7 @@ class VentanaCalculadoraUniversal(tk.Frame):
         super().__init__(parent, bg="white")
         self.pack(fill=tk.BOTH, expand=True)
         self.ultimos_pasos = []
+        self.runner = EjecutorTareas(self)
         
         sel = tk.Frame(self, bg="#e9ecef"); sel.pack(fill=tk.X)
         self.modo = tk.StringVar(value="AB")
@@ -175,9 +173,20 @@ class VentanaCalculadoraUniversal(tk.Frame):
         self.colB = tk.Frame(self.fo, bg="#f1f3f5")
         self._add(self.colB, "Ops B", ["Det", "Inv"], "B")
 
+        # Expresiones: "inv(A)*B*A + 2*T(B)"; "C = ..." guarda el resultado con nombre
+        fe = tk.Frame(self, bg="white"); fe.pack(fill=tk.X, padx=10, pady=(5, 0))
+        tk.Label(fe, text="Expresión:", bg="white", font=("bold")).pack(side=tk.LEFT)
+        self.ent_expr = tk.Entry(fe, font=("Consolas", 11)); self.ent_expr.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.ent_expr.bind("<Return>", lambda e: self._run_expr())
+        tk.Button(fe, text="= Evaluar", command=self._run_expr, bg="#28a745", fg="white").pack(side=tk.LEFT)
+        self.variables = {} # Matrices guardadas con "nombre = expresión"
+        self.cache_expr = CacheResultados()
+
         f_res = tk.Frame(self, bg="white"); f_res.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         tb = tk.Frame(f_res, bg="white"); tb.pack(fill=tk.X)
         tk.Button(tb, text="📜 Ver Procedimiento", command=self._ver_pasos, bg="#17a2b8", fg="white").pack(side=tk.RIGHT)
+        tk.Button(tb, text="■ Detener", command=self._detener, bg="#e9ecef").pack(side=tk.RIGHT, padx=5)
+        self.lbl_estado = tk.Label(tb, text="", bg="white", fg="#888"); self.lbl_estado.pack(side=tk.LEFT)
         self.txt = tk.Text(f_res, bg="#212529", fg="#00ff00", height=8, font=("Consolas", 10))
         self.txt.pack(fill=tk.BOTH, expand=True)
         self._upd()
@@ -206,21 +215,67 @@ class VentanaCalculadoraUniversal(tk.Frame):
 
     def _run(self, op, tgt):
         try:
-            res, pasos = None, []
             A = self.mA.get() if tgt in ["A", "AB"] else None
             B = self.mB.get() if tgt in ["B", "AB"] else None
-            
-            if tgt != "AB": 
-                M = A if tgt=="A" else B
-                if op=="det": res, pasos = determinante(M)
-                elif op=="inv": res, pasos = matriz_inversa(M)
-                elif op=="trans": res, pasos = transpuesta(M)
-                elif op=="rango": res, pasos = rango_matriz(M)
-            else: 
-                if op=="suma": res, pasos = sumar_matrices_dos(A, B)
-                elif op=="resta": res, pasos = restar_matrices_dos(A, B)
-                elif op=="mult": res, pasos = multiplicar_matrices(A, B)
+        except Exception as e:
+            self.txt.delete("1.0", tk.END); self.txt.insert(tk.END, f"ERROR: {str(e)}")
+            return
+        # Los datos se leen aquí (hilo de Tk); el cálculo corre en segundo plano
+        self.lbl_estado.config(text="Calculando…")
+        self.runner.enviar("op", lambda progreso: self._calcular(op, tgt, A, B, progreso),
+                           al_terminar=lambda r: self._mostrar(op, tgt, *r),
+                           al_error=self._fallo, al_progreso=self._avance)
+
+    def _run_expr(self):
+        nombre, expr = separar_asignacion(self.ent_expr.get())
+        if not expr.strip(): return
+        try: matrices = {**self.variables, "A": self.mA.get(), "B": self.mB.get()}
+        except Exception as e:
+            self.txt.delete("1.0", tk.END); self.txt.insert(tk.END, f"ERROR: {str(e)}")
+            return
+        self.lbl_estado.config(text="Calculando…")
+        # La caché solo se usa desde el hilo de cálculo (el ejecutor tiene uno)
+        self.runner.enviar("op", lambda progreso: evaluar(expr, matrices, self.cache_expr, progreso),
+                           al_terminar=lambda r: self._asignar(nombre, expr.strip(), *r),
+                           al_error=self._fallo, al_progreso=self._avance)
+
+    def _asignar(self, nombre, expr, res, pasos):
+        if nombre is not None and isinstance(res, list):
+            if nombre in ("A", "B"): (self.mA if nombre == "A" else self.mB)._cargar(res)
+            else: self.variables[nombre] = res
+        self._mostrar(expr if nombre is None else f"{nombre} = {expr}", "expr", res, pasos)
+        self.txt.insert(tk.END, "\n\n" + pasos[0]) # Informe del plan
+
+    @staticmethod
+    def _calcular(op, tgt, A, B, progreso):
+        res, pasos = None, []
+        if tgt != "AB": 
+            M = A if tgt=="A" else B
+            if op=="det": res, pasos = determinante(M, progreso)
+            elif op=="inv": res, pasos = matriz_inversa(M, progreso)
+            elif op=="trans": res, pasos = transpuesta(M)
+            elif op=="rango": res, pasos = rango_matriz(M, progreso)
+        else: 
+            if op=="suma": res, pasos = sumar_matrices_dos(A, B)
+            elif op=="resta": res, pasos = restar_matrices_dos(A, B)
+            elif op=="mult": res, pasos = multiplicar_matrices(A, B, progreso)
+        return res, pasos
+
+    def _avance(self, datos):
+        self.lbl_estado.config(text=f"Calculando… {str(datos[-1]).splitlines()[0][:60]}")
+
+    def _detener(self):
+        if self.runner.ocupado("op"):
+            self.runner.cancelar("op")
+            self.lbl_estado.config(text="Detenido")
+
+    def _fallo(self, e):
+        self.lbl_estado.config(text="")
+        self.txt.delete("1.0", tk.END); self.txt.insert(tk.END, f"ERROR: {str(e)}")
 
+    def _mostrar(self, op, tgt, res, pasos):
+        self.lbl_estado.config(text="")
+        try:
             self.txt.delete("1.0", tk.END)
             self.txt.insert(tk.END, f"> Operación: {op} ({tgt})\n")
             if isinstance(res, list) and isinstance(res[0], list):
@@ -232,10 +287,7 @@ class VentanaCalculadoraUniversal(tk.Frame):
 
     def _ver_pasos(self):
         if not self.ultimos_pasos: return
-        win = tk.Toplevel(self); win.title("Procedimiento")
-        t = tk.Text(win, font=("Consolas", 10), padx=10, pady=10)
-        t.pack(fill=tk.BOTH, expand=True)
-        for p in self.ultimos_pasos: t.insert(tk.END, f"{str(p)}\n{'-'*40}\n")
+        VisorPasos(self, self.ultimos_pasos, "Procedimiento")
 
 # --- VISTA 2: CRAMER ---
 class VentanaSistemas(tk.Frame):
@@ -243,6 +295,7 @@ class VentanaSistemas(tk.Frame):
         super().__init__(parent, bg="white")
         self.pack(fill=tk.BOTH, expand=True, padx=20)
         tk.Label(self, text="Sistemas Ax=b (Cramer)", bg="white", font=("bold",14)).pack(pady=10)
+        self.runner = EjecutorTareas(self)
         
         self.nb = ttk.Notebook(self); self.nb.pack(fill=tk.BOTH, expand=True)
         self.tab_vis = tk.Frame(self.nb, bg="white"); self.nb.add(self.tab_vis, text="Visual")
@@ -295,7 +348,13 @@ class VentanaSistemas(tk.Frame):
         except Exception as e: messagebox.showerror("Error", str(e))
 
     def _exec(self, A, b):
-        res, pasos = regla_cramer(A, b)
+        # n + 1 determinantes exactos: fuera del hilo de Tk
+        self.res_lbl.config(text="Calculando…")
+        self.runner.enviar("cramer", lambda progreso: regla_cramer(A, b, progreso),
+                           al_terminar=lambda r: self._mostrar(*r),
+                           al_error=lambda e: self.res_lbl.config(text=f"Error: {e}"))
+
+    def _mostrar(self, res, pasos):
         self.pasos = pasos
         if res:
             fmt = ", ".join([f"x{i+1}={val.numerator}/{val.denominator}" if val.denominator!=1 else f"x{i+1}={val.numerator}" for i, val in enumerate(res)])
@@ -304,16 +363,15 @@ class VentanaSistemas(tk.Frame):
 
     def _ver_pasos(self):
         if not self.pasos: return
-        win = tk.Toplevel(self); win.title("Pasos Cramer")
-        t = tk.Text(win); t.pack(fill=tk.BOTH, expand=True)
-        for p in self.pasos: t.insert(tk.END, str(p)+"\n")
+        VisorPasos(self, self.pasos, "Pasos Cramer")
 
 # --- VISTA 3: GAUSS / GAUSS-JORDAN ---
 class VentanaGauss(tk.Frame):
     def __init__(self, parent):
         super().__init__(parent, bg="white")
         self.pack(fill=tk.BOTH, expand=True, padx=20)
-        tk.Label(self, text="Sistemas Ax=b (Gauss / Gauss-Jordan)", bg="white", font=("bold",14)).pack(pady=10)
+        tk.Label(self, text="Sistemas Ax=b (Gauss / Gauss-Jordan / Mínimos cuadrados / Iterativos)", bg="white", font=("bold",14)).pack(pady=10)
+        self.runner = EjecutorTareas(self)
         
         self.nb = ttk.Notebook(self); self.nb.pack(fill=tk.BOTH, expand=True)
         self.tab_vis = tk.Frame(self.nb, bg="white"); self.nb.add(self.tab_vis, text="Cuadrícula")
@@ -321,8 +379,11 @@ class VentanaGauss(tk.Frame):
         
         # Visual
         f = tk.Frame(self.tab_vis, bg="white"); f.pack(pady=5)
-        tk.Label(f, text="N:", bg="white").pack(side=tk.LEFT)
+        tk.Label(f, text="Ecuaciones:", bg="white").pack(side=tk.LEFT)
+        self.spin_m = tk.Spinbox(f, from_=1, to=12, width=3, command=self._gen); self.spin_m.pack(side=tk.LEFT)
+        tk.Label(f, text="Incógnitas:", bg="white").pack(side=tk.LEFT)
         self.spin = tk.Spinbox(f, from_=2, to=5, width=3, command=self._gen); self.spin.pack(side=tk.LEFT)
+        self.spin_m.delete(0, "end"); self.spin_m.insert(0, self.spin.get())
         tk.Button(f, text="Generar", command=self._gen).pack(side=tk.LEFT)
         
         self.grid = tk.Frame(self.tab_vis, bg="white"); self.grid.pack()
@@ -331,6 +392,8 @@ class VentanaGauss(tk.Frame):
         f_btns = tk.Frame(self.tab_vis, bg="white"); f_btns.pack(pady=10)
         tk.Button(f_btns, text="Resolver por Gauss", command=lambda: self._solve_vis("gauss"), bg="#17a2b8", fg="white").pack(side=tk.LEFT, padx=5)
         tk.Button(f_btns, text="Resolver por Gauss-Jordan", command=lambda: self._solve_vis("rref"), bg="#28a745", fg="white").pack(side=tk.LEFT, padx=5)
+        tk.Button(f_btns, text="Mínimos cuadrados", command=lambda: self._solve_vis("mc"), bg="#6f42c1", fg="white").pack(side=tk.LEFT, padx=5)
+        tk.Button(f_btns, text="Iterativo", command=lambda: self._solve_vis("it"), bg="#fd7e14", fg="white").pack(side=tk.LEFT, padx=5)
 
         # Texto
         tk.Label(self.tab_txt, text="Ej: x+y=3", bg="white").pack()
@@ -338,6 +401,22 @@ class VentanaGauss(tk.Frame):
         f_btns2 = tk.Frame(self.tab_txt, bg="white"); f_btns2.pack(pady=10)
         tk.Button(f_btns2, text="Gauss", command=lambda: self._solve_txt("gauss"), bg="#17a2b8", fg="white").pack(side=tk.LEFT, padx=5)
         tk.Button(f_btns2, text="Gauss-Jordan", command=lambda: self._solve_txt("rref"), bg="#28a745", fg="white").pack(side=tk.LEFT, padx=5)
+        tk.Button(f_btns2, text="Mínimos cuadrados", command=lambda: self._solve_txt("mc"), bg="#6f42c1", fg="white").pack(side=tk.LEFT, padx=5)
+        tk.Button(f_btns2, text="Iterativo", command=lambda: self._solve_txt("it"), bg="#fd7e14", fg="white").pack(side=tk.LEFT, padx=5)
+        # Lotes grandes: [A|b] desde archivo (la última columna es b)
+        tk.Button(f_btns2, text="📂 [A|b] desde archivo…", command=lambda: self._solve_archivo("mc"), bg="#e2e6ea").pack(side=tk.LEFT, padx=5)
+        tk.Button(f_btns2, text="📂 [A|b] iterativo…", command=lambda: self._solve_archivo("it"), bg="#e2e6ea").pack(side=tk.LEFT, padx=5)
+
+        # Opciones de los métodos iterativos (compartidas por ambas pestañas)
+        f_it = tk.Frame(self, bg="white"); f_it.pack(pady=5)
+        tk.Label(f_it, text="Método iterativo:", bg="white").pack(side=tk.LEFT)
+        self.cb_it = ttk.Combobox(f_it, values=list(METODOS_ITERATIVOS), state="readonly", width=20)
+        self.cb_it.current(0); self.cb_it.pack(side=tk.LEFT, padx=5)
+        self.ents_it = {}
+        for clave, texto, defecto in (("omega", "ω (SOR):", "1.25"), ("tol", "Tol:", "1e-10"), ("max_iter", "Máx. iter:", "1000")):
+            tk.Label(f_it, text=texto, bg="white").pack(side=tk.LEFT)
+            e = tk.Entry(f_it, width=7); e.insert(0, defecto); e.pack(side=tk.LEFT, padx=(0, 5))
+            self.ents_it[clave] = e
 
         self.res_lbl = tk.Label(self, text="", bg="white", fg="blue", font=("bold",11)); self.res_lbl.pack(pady=5)
         self.pasos = []
@@ -347,9 +426,9 @@ class VentanaGauss(tk.Frame):
     def _gen(self):
         for w in self.grid.winfo_children(): w.destroy()
         self.entsA.clear(); self.entsB.clear()
-        try: n = int(self.spin.get())
+        try: m, n = int(self.spin_m.get()), int(self.spin.get())
         except: return
-        for i in range(n):
+        for i in range(m):
             for j in range(n):
                 e = tk.Entry(self.grid, width=5); e.grid(row=i, column=j)
                 self.entsA[(i,j)] = e
@@ -359,47 +438,143 @@ class VentanaGauss(tk.Frame):
 
     def _solve_vis(self, method):
         try:
-            n = int(self.spin.get())
-            A = [[Fraction(self.entsA[(i,j)].get() or 0) for j in range(n)] for i in range(n)]
-            b = [Fraction(self.entsB[i].get() or 0) for i in range(n)]
+            m, n = int(self.spin_m.get()), int(self.spin.get())
+            A = [[Fraction(self.entsA[(i,j)].get() or 0) for j in range(n)] for i in range(m)]
+            b = [Fraction(self.entsB[i].get() or 0) for i in range(m)]
             self._exec(A, b, method)
         except Exception as e: messagebox.showerror("Error", str(e))
 
     def _solve_txt(self, method):
         try:
-            A, b, _ = parsear_sistema_ecuaciones(self.txt_ec.get("1.0", tk.END))
-            if A: self._exec(A, b, method)
+            texto = self.txt_ec.get("1.0", tk.END)
+            # Los iterativos trabajan con las filas dispersas tal cual, sin densificar
+            A, b, variables = parsear_sistema_disperso(texto) if method == "it" else parsear_sistema_ecuaciones(texto)
+            if A: self._exec(A, b, method, len(variables))
         except Exception as e: messagebox.showerror("Error", str(e))
 
-    def _exec(self, A, b, method):
-        if method == "gauss": res, pasos = resolver_gauss(A, b)
-        else: res, pasos = resolver_gauss_jordan(A, b)
-        
+    def _solve_archivo(self, method="mc"):
+        ruta = filedialog.askopenfilename(parent=self, title="Sistema [A|b]", filetypes=TIPOS_ARCHIVO)
+        if not ruta: return
+        n_columnas = None
+        try:
+            if method == "it" and ruta.lower().endswith(".mtx"):
+                # Matrix Market disperso: se queda disperso (la última columna es b)
+                _, m, filas = leer_mtx_disperso(ruta)
+                b = [fila.pop(m - 1, 0) for fila in filas]
+                A, n_columnas = filas, m - 1
+            # NumPy o archivos grandes: directo a float, sin crear una Fraction por entrada
+            elif ruta.lower().endswith((".npy", ".npz")) or os.path.getsize(ruta) > 2_000_000:
+                M = cargar_arreglo(ruta)
+                A, b = M[:, :-1], M[:, -1]
+            else:
+                M = cargar_matriz(ruta)
+                A, b = [fila[:-1] for fila in M], [fila[-1] for fila in M]
+            if len(A) == 0 or len(A[0]) == 0: raise ValueError("Se necesitan al menos dos columnas: A y b.")
+        except Exception as e: return messagebox.showerror("Error", f"No se pudo leer el archivo: {e}", parent=self)
+        self._exec(A, b, method, n_columnas)
+
+    def _exec(self, A, b, method, n_columnas=None):
+        if method == "mc":
+            self.res_lbl.config(text="Calculando…")
+            self.runner.enviar("mc", lambda progreso: resolver_minimos_cuadrados(A, b, progreso=progreso),
+                               al_terminar=lambda r: self._mostrar_mc(*r),
+                               al_error=lambda e: self.res_lbl.config(text=f"Error: {e}"))
+            return
+        if method == "it": return self._exec_iterativo(A, b, n_columnas)
+        resolver = resolver_gauss if method == "gauss" else resolver_gauss_jordan
+        self.res_lbl.config(text="Calculando…")
+        self.runner.enviar("gauss", lambda progreso: resolver(A, b, progreso),
+                           al_terminar=lambda r: self._mostrar_exacto(*r),
+                           al_error=lambda e: self.res_lbl.config(text=f"Error: {e}"))
+
+    def _mostrar_exacto(self, res, pasos):
         self.pasos = pasos
         if res:
             fmt = ", ".join([f"x{i+1}={val.numerator}/{val.denominator}" if val.denominator!=1 else f"x{i+1}={val.numerator}" for i, val in enumerate(res)])
             self.res_lbl.config(text=f"Solución: {fmt}")
         else: self.res_lbl.config(text="Sin solución única")
 
+    def _mostrar_mc(self, sol, pasos):
+        self.pasos = pasos
+        fmt = lambda v: self._fmt_frac(v) if isinstance(v, Fraction) else f"{v:.10g}"
+        xs = ", ".join(f"x{i+1}={fmt(v)}" for i, v in enumerate(sol.x[:8])) + (" …" if len(sol.x) > 8 else "")
+        self.res_lbl.config(text=f"Mínimos cuadrados: {xs}\nRango {sol.rango} · ||b - Ax|| = {sol.residuo:.6g} ({'exacto' if sol.residuo2 is not None else 'QR flotante'})")
+
+    def _exec_iterativo(self, A, b, n_columnas=None):
+        metodo = self.cb_it.get()
+        try: opciones = {k: float(e.get()) for k, e in self.ents_it.items()}
+        except ValueError: return messagebox.showerror("Error", "ω, tolerancia y máximo de iteraciones deben ser números.", parent=self)
+        tol, max_iter = opciones["tol"], max(1, int(opciones["max_iter"]))
+        extra = {"omega": opciones["omega"]} if metodo == "SOR" else {}
+
+        def calculo(progreso):
+            M = MatrizDispersa.desde(A, n_columnas)
+            x, reg = METODOS_ITERATIVOS[metodo](M, b, tol=tol, max_iter=max_iter, traza=Traza(observador=progreso), **extra)
+            return x, reg, informe_iterativo(metodo, M, reg, tol, extra.get("omega"))
+
+        self.res_lbl.config(text=f"{metodo}: iterando…")
+        self.runner.enviar("it", calculo, al_terminar=lambda r: self._mostrar_it(metodo, *r),
+                           al_error=lambda e: self.res_lbl.config(text=f"Error: {e}"))
+
+    def _mostrar_it(self, metodo, x, reg, pasos):
+        self.pasos = pasos
+        xs = ", ".join(f"x{i+1}={v:.10g}" for i, v in enumerate(x[:8])) + (" …" if len(x) > 8 else "")
+        self.res_lbl.config(text=f"{metodo}: {xs}\n{pasos[-1].splitlines()[0]}")
+
+    @staticmethod
+    def _fmt_frac(v): return str(v.numerator) if v.denominator == 1 else f"{v.numerator}/{v.denominator}"
+
     def _ver_pasos(self):
         if not self.pasos: return
-        win = tk.Toplevel(self); win.title("Pasos")
-        t = tk.Text(win); t.pack(fill=tk.BOTH, expand=True)
-        for p in self.pasos: t.insert(tk.END, str(p)+"\n")
+        VisorPasos(self, self.pasos, "Pasos")
 
 class VentanaVectores(tk.Frame):
     def __init__(self, parent):
         super().__init__(parent, bg="white")
         self.pack(fill=tk.BOTH, expand=True, padx=20)
+        self.runner = EjecutorTareas(self)
         tk.Label(self, text="Espacios Vectoriales", bg="white", font=("bold", 12)).pack()
         self.v_input = MatrixInput(self, "Vectores", 3, 3); self.v_input.pack(fill=tk.X)
-        tk.Button(self, text="Verificar Indep.", command=self._calc, bg="blue", fg="white").pack(pady=10)
+        f = tk.Frame(self, bg="white"); f.pack(pady=10)
+        self.orientacion = tk.StringVar(value="filas")
+        tk.Label(f, text="Cada vector es una:", bg="white").pack(side=tk.LEFT)
+        tk.Radiobutton(f, text="fila", var=self.orientacion, value="filas", bg="white").pack(side=tk.LEFT)
+        tk.Radiobutton(f, text="columna", var=self.orientacion, value="columnas", bg="white").pack(side=tk.LEFT)
+        tk.Button(f, text="Analizar", command=self._calc, bg="blue", fg="white").pack(side=tk.LEFT, padx=10)
+        tk.Button(f, text="Ver Procedimiento", command=self._ver_pasos).pack(side=tk.LEFT)
         self.lbl = tk.Label(self, text="", bg="white", font=("bold", 11)); self.lbl.pack()
+        self.txt = tk.Text(self, height=12, font=("Consolas", 10), bg="#f8f9fa"); self.txt.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.pasos = []
 
     def _calc(self):
-        try:
-            M = self.v_input.get()
-            r, _ = rango_matriz(M)
-            if r == len(M): self.lbl.config(text="LINEALMENTE INDEPENDIENTES", fg="green")
-            else: self.lbl.config(text=f"DEPENDIENTES (Rango {r})", fg="red")
-        except: pass
\ No newline at end of file
+        try: M = self.v_input.get()
+        except Exception as e: return self.lbl.config(text=f"Error: {e}", fg="red")
+        vectores = M if self.orientacion.get() == "filas" else transpuesta(M)[0]
+        # Una sola RREF (con los vectores como columnas) da rango, bases y relaciones
+        self.lbl.config(text="Calculando…", fg="#888")
+        self.runner.enviar("esp", lambda progreso: (espacios_de_vectores(vectores, progreso), ortonormalizar(vectores)),
+                           al_terminar=lambda r: self._mostrar(vectores, *r),
+                           al_error=lambda e: self.lbl.config(text=f"Error: {e}", fg="red"))
+
+    def _mostrar(self, vectores, analisis, orto):
+        (e, self.pasos), (Q, usados) = analisis, orto
+        k = len(vectores)
+        if e.rango == k: self.lbl.config(text="LINEALMENTE INDEPENDIENTES", fg="green")
+        else: self.lbl.config(text=f"DEPENDIENTES (Rango {e.rango})", fg="red")
+        vec = lambda v: "(" + ", ".join(fmt_val(x) for x in v) + ")"
+        lineas = [f"Rango: {e.rango} de {k} vectores · dimensión del espacio: {len(vectores[0])}",
+                  "", "Base del espacio generado (vectores pivote):"]
+        lineas += [f"  v{j+1} = {vec(vectores[j])}" for j in e.pivotes]
+        if e.relaciones:
+            lineas += ["", "Relaciones de dependencia:"]
+            lineas += ["  " + formatear_relacion(f, t) for f, t in e.relaciones]
+            lineas += ["", "Base del núcleo (coeficientes c con Σ cᵢ·vᵢ = 0):"]
+            lineas += [f"  {vec(x)}" for x in e.base_nulo]
+        if usados: lineas += ["", f"Base ortonormal (Gram-Schmidt modificado, flotante; desde v{', v'.join(str(j+1) for j in usados)}):"]
+        else: lineas += ["", "Base ortonormal: vacía"]
+        lineas += ["  (" + ", ".join(f"{x:.6g}" for x in Q[:, c]) + ")" for c in range(Q.shape[1])]
+        self.txt.delete("1.0", tk.END); self.txt.insert(tk.END, "\n".join(lineas))
+
+    def _ver_pasos(self):
+        if not self.pasos: return
+        VisorPasos(self, self.pasos, "Procedimiento")
\ No newline at end of file
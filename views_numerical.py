@@ -2,10 +2,16 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
 import re  # Importación necesaria para Regex
+import time
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 # Importación segura
-from numerical_methods import newton_raphson, metodo_secante, metodo_biseccion, metodo_regla_falsa, _preprocesar_expresion
+from numerical_methods import newton_raphson, metodo_secante, metodo_biseccion, metodo_regla_falsa, diagnosticar_convergencia, evaluar_vectorizado, METODOS_INTEGRACION
+from numerical_methods import newton_modificado, metodo_steffensen, acelerar_aitken, ahorro_iteraciones, formatear_ahorro, estimar_multiplicidad
+from plot_sampling import CacheMuestras
+from nonlinear_systems import compilar_sistema, newton_sistema
+from traces import Traza
+from job_runner import EjecutorTareas
 
 class VistaMetodoBase(tk.Frame):
     def __init__(self, parent):
@@ -14,6 +20,13 @@ class VistaMetodoBase(tk.Frame):
         
         self.var_func = tk.StringVar()
         self.plot_timer = None
+        self.runner = EjecutorTareas(self)
+        self.muestras = CacheMuestras()
+        self.xlim = (-10.0, 10.0)
+        self.marcador = None
+        self.zoom_timer = None
+        self._arrastre = None
+        self._extra = None # Línea adicional del último resultado (ahorro de iteraciones, avisos)
         
         # --- PANEL SUPERIOR ---
         top = tk.Frame(self, bg="white"); top.pack(fill=tk.X)
@@ -31,6 +44,13 @@ class VistaMetodoBase(tk.Frame):
         self.ax = self.fig.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Zoom con la rueda y desplazamiento arrastrando
+        self.canvas.mpl_connect("scroll_event", self._on_scroll)
+        self.canvas.mpl_connect("button_press_event", self._on_press)
+        self.canvas.mpl_connect("motion_notify_event", self._on_drag)
+        self.canvas.mpl_connect("button_release_event", lambda e: setattr(self, "_arrastre", None))
+        self.canvas.mpl_connect("draw_event", self._guardar_fondo)
+        self._crear_artistas()
         
         # --- LOG ---
         self.log = tk.Text(self, height=6, bg="#f8f9fa", font=("Consolas", 9)); self.log.pack(fill=tk.X)
@@ -43,6 +63,11 @@ class VistaMetodoBase(tk.Frame):
         for v in ["sin", "cos", "tan", "ln", "sqrt", "^", "(", ")", "x"]:
             tk.Button(self.btns, text=v, command=lambda x=v: self._ins(x), width=3, bg="#f0f0f0", bd=0).pack(side=tk.LEFT, padx=1)
         tk.Button(self.btns, text="C", command=self._limpiar, width=3, bg="#ffcccc", bd=0).pack(side=tk.LEFT, padx=1)
+        tk.Button(self.btns, text="■ Detener", command=self._detener, bg="#f0f0f0", bd=0).pack(side=tk.RIGHT, padx=1)
+        self.lbl_estado = tk.Label(self.btns, text="", bg="white", fg="#888")
+        self.lbl_estado.pack(side=tk.RIGHT, padx=10)
+        self.lbl_tiempo = tk.Label(self.btns, text="", bg="white", fg="#aaa", font=("Consolas", 8))
+        self.lbl_tiempo.pack(side=tk.RIGHT)
 
     def _ins(self, t): 
         if hasattr(self, 'e_func'): 
@@ -59,6 +84,7 @@ class VistaMetodoBase(tk.Frame):
         self._update_pretty_formula()
         
         # 2. Programar la gráfica con retraso (Debounce)
+        self._limpiar_superposiciones()
         if self.plot_timer: self.after_cancel(self.plot_timer)
         self.plot_timer = self.after(800, self._plot)
 
@@ -96,59 +122,198 @@ class VistaMetodoBase(tk.Frame):
 
         self.lbl_formula.config(text=f"f(x) = {txt}")
 
+    # --- Zoom / desplazamiento ---
+    def _on_scroll(self, e):
+        if e.xdata is None: return
+        factor = 0.8 if e.button == "up" else 1.25
+        a, b = self.xlim
+        self.xlim = (e.xdata - (e.xdata - a) * factor, e.xdata + (b - e.xdata) * factor)
+        self._programar_replot()
+
+    def _on_press(self, e):
+        if e.button == 1 and e.inaxes is self.ax: self._arrastre = (e.x, self.xlim)
+
+    def _on_drag(self, e):
+        if self._arrastre is None or e.x is None: return
+        x0, (a, b) = self._arrastre
+        ancho_px = self.ax.bbox.width or 1
+        dx = (e.x - x0) * (b - a) / ancho_px
+        self.xlim = (a - dx, b - dx)
+        self._programar_replot()
+
+    def _programar_replot(self):
+        # Agrupa eventos de la rueda/arrastre en un redibujado por cuadro (~16 ms)
+        if self.zoom_timer is None:
+            self.zoom_timer = self.after(16, self._replot)
+
+    def _replot(self):
+        self.zoom_timer = None
+        self._plot(self.marcador)
+
+    # --- Artistas persistentes ---
+    def _crear_artistas(self):
+        """Malla, ejes, curva y marcadores se crean una vez; al redibujar solo cambian sus datos."""
+        self.ax.grid(True, linestyle=':', alpha=0.6)
+        self.ax.axhline(0, color='black', linewidth=1)
+        self.ax.axvline(0, color='black', linewidth=1)
+        self.linea, = self.ax.plot([], [], color='#007acc', linewidth=1.5)
+        self.pt_raiz, = self.ax.plot([], [], 'ro', markersize=6, label='Raíz')
+        self.leyenda = self.ax.legend(handles=[self.pt_raiz]); self.leyenda.set_visible(False)
+        # Superposiciones animadas: no entran en el dibujo completo, se pintan por blitting
+        self.pts_iter, = self.ax.plot([], [], 'o', color='#ff9900', markersize=4, alpha=0.7, animated=True)
+        self.pt_actual, = self.ax.plot([], [], 'o', color='#ff5500', markersize=9, mfc='none', mew=2, animated=True)
+        self._fondo = None
+        self._anim = None
+        self.anim_timer = None
+        self.t_dibujo = ""
+
     def _plot(self, marker=None):
         s = self.var_func.get()
         if not s.strip(): return
+        self.marcador = marker
         try:
-            f = _preprocesar_expresion(s)
-            x = np.linspace(-10, 10, 400)
-            # Contexto seguro y completo
-            ctx = {"x": x, "np": np, "sin": np.sin, "cos": np.cos, "tan": np.tan, 
-                   "ln": np.log, "log": np.log10, "sqrt": np.sqrt, "exp": np.exp, 
-                   "pi": np.pi, "e": np.e, "abs": np.abs}
-            
-            with np.errstate(all='ignore'):
-                y = eval(f, {"__builtins__": None}, ctx)
-            
-            if isinstance(y, (int, float)): y = np.full_like(x, y)
+            t0 = time.perf_counter()
+            a, b = self.xlim
+            # Muestreo adaptativo: solo se evalúa lo nuevo respecto a la caché
+            x, y = self.muestras.muestras(s, lambda xs: evaluar_vectorizado(s, xs), a, b)
+            t1 = time.perf_counter()
             
-            self.ax.clear()
-            self.ax.grid(True, linestyle=':', alpha=0.6)
-            self.ax.axhline(0, color='black', linewidth=1)
-            self.ax.axvline(0, color='black', linewidth=1)
+            self.linea.set_data(x, y)
+            self.pt_raiz.set_data(*(([marker], [0]) if marker is not None else ([], [])))
+            self.leyenda.set_visible(marker is not None)
+            self.ax.set_xlim(a, b)
             
-            self.ax.plot(x, y, color='#007acc', linewidth=1.5)
-            if marker is not None: 
-                self.ax.plot(marker, 0, 'ro', markersize=6, label='Raíz')
-                self.ax.legend()
-            
-            # Autozoom
-            y_clean = y[np.isfinite(y)]
+            # Autozoom (solo la ventana visible)
+            y_clean = y[np.isfinite(y) & (x >= a) & (x <= b)]
             if len(y_clean) > 0:
                 mx, mn = np.max(y_clean), np.min(y_clean)
                 if mx - mn > 50: self.ax.set_ylim(-20, 20)
                 else: self.ax.set_ylim(mn-2, mx+2)
             
             self.canvas.draw()
+            t2 = time.perf_counter()
+            self.t_dibujo = f"muestreo {(t1-t0)*1e3:.1f} ms · dibujo {(t2-t1)*1e3:.1f} ms"
+            self.lbl_tiempo.config(text=self.t_dibujo)
         except Exception: pass
 
+    def _guardar_fondo(self, e=None):
+        # Tras cada dibujo completo: fondo sin superposiciones, y luego se pintan encima
+        self._fondo = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.pts_iter); self.ax.draw_artist(self.pt_actual)
+
+    def _blit(self):
+        """Repinta solo las superposiciones sobre el fondo guardado. Devuelve la duración (s)."""
+        t0 = time.perf_counter()
+        if self._fondo is None: self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._fondo)
+            self.ax.draw_artist(self.pts_iter); self.ax.draw_artist(self.pt_actual)
+            self.canvas.blit(self.ax.bbox)
+        return time.perf_counter() - t0
+
+    def _limpiar_superposiciones(self):
+        if self.anim_timer: self.after_cancel(self.anim_timer)
+        self.anim_timer, self._anim = None, None
+        self.pts_iter.set_data([], []); self.pt_actual.set_data([], [])
+
+    # --- Animación de la convergencia ---
+    PAUSA_ANIM = 90 # ms entre iterados
+
+    def _animar(self, h):
+        """Recorre los iterados de la traza sobre la curva; cada cuadro es un blit, sin redibujar ejes."""
+        self._limpiar_superposiciones()
+        col = next((c for c in ("c", "xi+1", "xi") if c in h.columnas), None)
+        if col is None or len(h) == 0: return
+        xs = np.array(h.columna(col))
+        xs = xs[np.isfinite(xs)]
+        if xs.size == 0: return
+        try: ys = evaluar_vectorizado(self.var_func.get(), xs)
+        except ValueError: return
+        self._anim = (xs, ys, [])
+        self._cuadro(1)
+
+    def _cuadro(self, k):
+        xs, ys, tiempos = self._anim
+        self.pts_iter.set_data(xs[:k], ys[:k])
+        self.pt_actual.set_data(xs[k-1:k], ys[k-1:k])
+        tiempos.append(self._blit())
+        if k < xs.size:
+            self.anim_timer = self.after(self.PAUSA_ANIM, self._cuadro, k + 1)
+        else:
+            self.anim_timer = None
+            self.lbl_tiempo.config(text=f"{self.t_dibujo} · blit {np.mean(tiempos)*1e3:.2f} ms/cuadro")
+
+    # --- Cálculo en segundo plano ---
+    def _lanzar(self, calculo):
+        """Ejecuta calculo(traza) fuera del hilo de Tk; la traza publica cada iteración."""
+        self.lbl_estado.config(text="Calculando…")
+        self.runner.enviar("calc", lambda progreso: calculo(Traza(observador=progreso)),
+                           al_terminar=self._terminar, al_error=self._fallo, al_progreso=self._avance)
+
+    def _terminar(self, res):
+        r, h, *extra = res # Tercer elemento opcional: línea extra para el log
+        self._extra = extra[0] if extra else None
+        self.lbl_estado.config(text="")
+        self._plot(float(r))
+        self._mostrar_log(r, h)
+        self._animar(h)
+
+    def _fallo(self, e):
+        self.lbl_estado.config(text="")
+        messagebox.showerror("Error", f"No se pudo calcular: {e}")
+
+    def _avance(self, datos):
+        self.lbl_estado.config(text=f"Iteración {datos[-1].get('iter', '?')}…")
+
+    def _detener(self):
+        if self.runner.ocupado("calc"):
+            self.runner.cancelar("calc")
+            self.lbl_estado.config(text="Detenido")
+
+    def _mostrar_log(self, r, h):
+        self.log.delete("1.0", tk.END); self.log.insert(tk.END, f"Raíz: {r}\n")
+        if self._extra: self.log.insert(tk.END, self._extra + "\n")
+        d = diagnosticar_convergencia(h)
+        if d['orden'] is not None:
+            txt = f"Orden estimado: {d['orden']:.3f}"
+            if d['constante'] is not None: txt += f"  λ ≈ {d['constante']:.4g}"
+            self.log.insert(tk.END, txt + "\n")
+        if d['estancado']: self.log.insert(tk.END, "⚠ Estancado: el error dejó de disminuir\n")
+        for step in h: self.log.insert(tk.END, str(step)+"\n")
+
 class VistaNewton(VistaMetodoBase):
+    # Variantes para raíces múltiples; todas menos la primera informan su ahorro frente a Newton
+    METODOS = {"Newton-Raphson": lambda f, x0, t: newton_raphson(f, x0, traza=t),
+               "Newton modificado (m·f/f')": lambda f, x0, t: newton_modificado(f, x0, traza=t),
+               "Newton sobre f/f'": lambda f, x0, t: newton_modificado(f, x0, variante="u", traza=t),
+               "Steffensen (sin derivada)": lambda f, x0, t: metodo_steffensen(f, x0, traza=t),
+               "Newton + Aitken Δ²": lambda f, x0, t: acelerar_aitken(newton_raphson, f, x0, traza=t)}
+
     def __init__(self, parent):
         super().__init__(parent)
         self.x0 = tk.DoubleVar(value=1.0)
+        self.metodo = tk.StringVar(value=next(iter(self.METODOS)))
         tk.Label(self.inputs, text="f(x)=", bg="white").pack(side=tk.LEFT)
         self.e_func = tk.Entry(self.inputs, textvariable=self.var_func, width=25, font=("Consolas", 11)); self.e_func.pack(side=tk.LEFT)
         tk.Label(self.inputs, text="x0:", bg="white").pack(side=tk.LEFT)
         tk.Entry(self.inputs, textvariable=self.x0, width=5).pack(side=tk.LEFT)
+        ttk.Combobox(self.inputs, textvariable=self.metodo, values=list(self.METODOS), state="readonly", width=24).pack(side=tk.LEFT, padx=5)
         tk.Button(self.inputs, text="Calcular", command=self._calc, bg="#007acc", fg="white").pack(side=tk.LEFT, padx=10)
 
     def _calc(self):
-        try:
-            r, h = newton_raphson(self.var_func.get(), self.x0.get())
-            self._plot(r)
-            self.log.delete("1.0", tk.END); self.log.insert(tk.END, f"Raíz: {r}\n")
-            for step in h: self.log.insert(tk.END, str(step)+"\n")
-        except Exception as e: messagebox.showerror("Error", f"No se pudo calcular: {e}")
+        try: f, x0 = self.var_func.get(), self.x0.get()
+        except Exception as e: return messagebox.showerror("Error", f"No se pudo calcular: {e}")
+        nombre = self.metodo.get()
+        metodo = self.METODOS[nombre]
+
+        def calculo(traza):
+            r, h = metodo(f, x0, traza)
+            if nombre != "Newton-Raphson": return r, h, f"Frente a {formatear_ahorro(ahorro_iteraciones(h, newton_raphson, f, x0))}"
+            m = estimar_multiplicidad(h)
+            if m is not None and round(m) >= 2:
+                return r, h, f"⚠ Multiplicidad estimada ≈ {m:.2f}: raíz múltiple, pruebe Newton modificado o Newton sobre f/f'"
+            return r, h, None
+        self._lanzar(calculo)
 
 class VistaSecante(VistaMetodoBase):
     def __init__(self, parent):
@@ -160,15 +325,19 @@ class VistaSecante(VistaMetodoBase):
         tk.Entry(self.inputs, textvariable=self.x0, width=4).pack(side=tk.LEFT)
         tk.Label(self.inputs, text="x1:", bg="white").pack(side=tk.LEFT)
         tk.Entry(self.inputs, textvariable=self.x1, width=4).pack(side=tk.LEFT)
+        self.aitken = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.inputs, text="Aitken Δ²", variable=self.aitken, bg="white").pack(side=tk.LEFT, padx=5)
         tk.Button(self.inputs, text="Calcular", command=self._calc, bg="#007acc", fg="white").pack(side=tk.LEFT, padx=10)
 
     def _calc(self):
-        try:
-            r, h = metodo_secante(self.var_func.get(), self.x0.get(), self.x1.get())
-            self._plot(r)
-            self.log.delete("1.0", tk.END); self.log.insert(tk.END, f"Raíz: {r}\n")
-            for step in h: self.log.insert(tk.END, str(step)+"\n")
-        except Exception as e: messagebox.showerror("Error", str(e))
+        try: f, x0, x1 = self.var_func.get(), self.x0.get(), self.x1.get()
+        except Exception as e: return messagebox.showerror("Error", str(e))
+        if not self.aitken.get(): return self._lanzar(lambda traza: metodo_secante(f, x0, x1, traza=traza))
+
+        def calculo(traza):
+            r, h = acelerar_aitken(metodo_secante, f, x0, x1, traza=traza)
+            return r, h, f"Frente a {formatear_ahorro(ahorro_iteraciones(h, metodo_secante, f, x0, x1))}"
+        self._lanzar(calculo)
 
 class VentanaBiseccion(VistaMetodoBase):
     def __init__(self, parent):
@@ -181,21 +350,117 @@ class VentanaBiseccion(VistaMetodoBase):
         tk.Entry(self.inputs, textvariable=self.b, width=4).pack(side=tk.LEFT)
         tk.Button(self.inputs, text="Bisección", command=self._calc, bg="#007acc", fg="white").pack(side=tk.LEFT, padx=10)
 
+    metodo = staticmethod(metodo_biseccion)
+
     def _calc(self):
-        try:
-            from fractions import Fraction
-            r, h = metodo_biseccion(self.var_func.get(), float(self.a.get()), float(self.b.get())) # Usamos floats para numerical
-            self._plot(float(r))
-            self.log.delete("1.0", tk.END); self.log.insert(tk.END, f"Raíz: {float(r)}\n")
-            for step in h: self.log.insert(tk.END, str(step)+"\n")
-        except Exception as e: messagebox.showerror("Error", str(e))
+        try: f, a, b = self.var_func.get(), float(self.a.get()), float(self.b.get()) # Usamos floats para numerical
+        except Exception as e: return messagebox.showerror("Error", str(e))
+        self._lanzar(lambda traza: self.metodo(f, a, b, traza=traza))
 
 class VentanaReglaFalsa(VentanaBiseccion):
+    metodo = staticmethod(metodo_regla_falsa)
+
+class VistaIntegracion(VistaMetodoBase):
+    """∫ f(x) dx en [a, b] con la misma entrada y gráfica; el área calculada queda sombreada."""
+    def __init__(self, parent):
+        self.intervalo = None # [a, b] del último resultado
+        self.sombra = None
+        super().__init__(parent)
+        self.a = tk.DoubleVar(value=0); self.b = tk.DoubleVar(value=1)
+        self.metodo = tk.StringVar(value=next(iter(METODOS_INTEGRACION)))
+        tk.Label(self.inputs, text="f(x)=", bg="white").pack(side=tk.LEFT)
+        self.e_func = tk.Entry(self.inputs, textvariable=self.var_func, width=20, font=("Consolas", 11)); self.e_func.pack(side=tk.LEFT)
+        tk.Label(self.inputs, text="[a, b]", bg="white").pack(side=tk.LEFT)
+        tk.Entry(self.inputs, textvariable=self.a, width=4).pack(side=tk.LEFT)
+        tk.Entry(self.inputs, textvariable=self.b, width=4).pack(side=tk.LEFT)
+        ttk.Combobox(self.inputs, textvariable=self.metodo, values=list(METODOS_INTEGRACION), state="readonly", width=24).pack(side=tk.LEFT, padx=5)
+        tk.Button(self.inputs, text="Integrar", command=self._calc, bg="#007acc", fg="white").pack(side=tk.LEFT, padx=10)
+
+    def _calc(self):
+        try: f, a, b = self.var_func.get(), float(self.a.get()), float(self.b.get())
+        except Exception as e: return messagebox.showerror("Error", str(e))
+        metodo = METODOS_INTEGRACION[self.metodo.get()]
+        self._lanzar(lambda traza: (metodo(f, a, b, traza=traza), (min(a, b), max(a, b))))
+
+    def _terminar(self, res):
+        (r, h), self.intervalo = res
+        self.lbl_estado.config(text="")
+        self._plot()
+        self._mostrar_log(r, h)
+
+    def _on_input_change(self, *args):
+        self.intervalo = None # El área sombreada era de la función anterior
+        super()._on_input_change(*args)
+
+    def _plot(self, marker=None):
+        self._sombrear()
+        super()._plot(None)
+
+    def _sombrear(self):
+        if self.sombra is not None: self.sombra.remove(); self.sombra = None
+        s = self.var_func.get()
+        if self.intervalo is None or not s.strip(): return
+        lo, hi = self.intervalo
+        try: x, y = self.muestras.muestras(s, lambda xs: evaluar_vectorizado(s, xs), lo, hi)
+        except ValueError: return
+        # Los NaN de las discontinuidades parten el polígono igual que la curva
+        self.sombra = self.ax.fill_between(np.clip(x, lo, hi), 0, y, color='#007acc', alpha=0.2, linewidth=0)
+
+    def _mostrar_log(self, r, h):
+        self.log.delete("1.0", tk.END)
+        ultimo = h[-1] if len(h) else {}
+        txt = f"∫ f(x) dx = {r:.15g}"
+        if isinstance(ultimo.get('error'), float): txt += f"   (error estimado {ultimo['error']:.2e})"
+        self.log.insert(tk.END, txt + f"\nEvaluaciones de f: {int(ultimo.get('evals', 0))}\n")
+        for step in h: self.log.insert(tk.END, str(step)+"\n")
+
+class VistaSistemaNoLineal(tk.Frame):
+    """F(x)=0 con varias ecuaciones: mismo formato de texto que los sistemas lineales."""
+    METODOS = {"Newton (jacobiano automático)": ("ad", False),
+               "Newton (diferencias finitas)": ("fd", False),
+               "Broyden": ("ad", True)}
+
+    def __init__(self, parent):
+        super().__init__(parent, bg="white")
+        self.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.runner = EjecutorTareas(self)
+
+        tk.Label(self, text="Ej: x^2 + y^2 = 4 \\ x*y = 1", bg="white").pack(anchor="w")
+        self.txt_ec = tk.Text(self, height=6, font=("Consolas", 11)); self.txt_ec.pack(fill=tk.X)
+
+        f = tk.Frame(self, bg="white"); f.pack(fill=tk.X, pady=5)
+        tk.Label(f, text="Valores iniciales:", bg="white").pack(side=tk.LEFT)
+        self.x0 = tk.StringVar(value="1, 1")
+        tk.Entry(f, textvariable=self.x0, width=20).pack(side=tk.LEFT, padx=5)
+        self.metodo = tk.StringVar(value=next(iter(self.METODOS)))
+        ttk.Combobox(f, textvariable=self.metodo, values=list(self.METODOS), state="readonly", width=28).pack(side=tk.LEFT, padx=5)
+        tk.Button(f, text="Resolver", command=self._calc, bg="#007acc", fg="white").pack(side=tk.LEFT, padx=10)
+
+        self.res_lbl = tk.Label(self, text="", bg="white", fg="blue", font=("bold", 11)); self.res_lbl.pack(pady=5)
+        self.log = tk.Text(self, height=12, bg="#f8f9fa", font=("Consolas", 9)); self.log.pack(fill=tk.BOTH, expand=True)
+
     def _calc(self):
         try:
-            from fractions import Fraction
-            r, h = metodo_regla_falsa(self.var_func.get(), float(self.a.get()), float(self.b.get()))
-            self._plot(float(r))
-            self.log.delete("1.0", tk.END); self.log.insert(tk.END, f"Raíz: {float(r)}\n")
+            S = compilar_sistema(self.txt_ec.get("1.0", tk.END))
+            x0 = [float(v) for v in self.x0.get().replace(";", ",").split(",") if v.strip()]
+            if len(x0) == 1 and len(S.variables) > 1: x0 = x0 * len(S.variables)
+            jac, broyden = self.METODOS[self.metodo.get()]
+        except Exception as e: return messagebox.showerror("Error", str(e))
+        self.res_lbl.config(text="Calculando…", fg="blue")
+        # Fuera del hilo de Tk: la traza publica cada iteración (y permite cancelar)
+        self.runner.enviar("sistema", lambda progreso: newton_sistema(S, x0, jacobiano=jac, broyden=broyden, traza=Traza(observador=progreso)),
+                           al_terminar=lambda r: self._mostrar(S, *r),
+                           al_error=lambda e: self.res_lbl.config(text=f"Error: {e}", fg="red"))
+
+    def _mostrar(self, S, sol, h):
+        try:
+            motivo = h[-1].get('error') if len(h) else None
+            if isinstance(motivo, str): # El último punto no es una solución
+                self.res_lbl.config(text=f"Sin solución: {motivo} (último punto: " + ", ".join(f"{v} = {val:.6g}" for v, val in sol.items()) + ")", fg="red")
+            else: self.res_lbl.config(text="  ".join(f"{v} = {val:.10g}" for v, val in sol.items()), fg="blue")
+            self.log.delete("1.0", tk.END)
+            self.log.insert(tk.END, f"Variables: {', '.join(S.variables)}  |  Evaluaciones de F: {S.evaluaciones}\n")
+            d = diagnosticar_convergencia(h)
+            if d['orden'] is not None: self.log.insert(tk.END, f"Orden estimado: {d['orden']:.3f}\n")
             for step in h: self.log.insert(tk.END, str(step)+"\n")
-        except Exception as e: messagebox.showerror("Error", str(e))
\ No newline at end of file
+        except Exception as e: messagebox.showerror("Error", str(e))